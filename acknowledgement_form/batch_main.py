@@ -0,0 +1,29 @@
+import argparse
+
+from acknowledgement_form.form_generator.batch import generate_forms_from_quotations
+from acknowledgement_form.form_generator.constants import TEMPLATE_FILEPATH
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Creates Job Acknowledgement Excel files from Quotation PDFs"
+    )
+    parser.add_argument("source", help="directory or glob pattern of quotation PDFs")
+    parser.add_argument("output_directory", help="directory to write the forms to")
+    parser.add_argument("--workers", type=int, default=None, help="process count")
+    parser.add_argument("--template", default=TEMPLATE_FILEPATH)
+    parser.add_argument(
+        "--cache-directory", default=None, help="reuse previously parsed quotations"
+    )
+    args = parser.parse_args()
+    generate_forms_from_quotations(
+        args.source,
+        args.output_directory,
+        max_workers=args.workers,
+        template_filepath=args.template,
+        cache_directory=args.cache_directory,
+    )
+
+
+if __name__ == "__main__":
+    main()
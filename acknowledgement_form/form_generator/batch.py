@@ -0,0 +1,245 @@
+import glob
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from loguru import logger
+
+from acknowledgement_form.form_generator.constants import (
+    TEMPLATE_FILEPATH,
+    Content,
+    Field,
+)
+from acknowledgement_form.form_generator.generator import (
+    generate_output_filename,
+    load_template,
+    set_content,
+    set_field_value,
+)
+from acknowledgement_form.form_generator.quotation_cache import QuotationCache
+from acknowledgement_form.form_generator.quotation_reader import QuotationReader
+from excel_writer.writer import ExcelWriter
+
+MANIFEST_FILENAME = "manifest.json"
+
+
+class AcknowledgementJob(NamedTuple):
+    fields: Dict[Field, str]
+    contents: List[Content]
+    filename: str = ""
+
+
+class GenerationResult(NamedTuple):
+    quotation_filepath: str
+    output_filepath: str
+    seconds: float
+    error: str = ""
+
+    @property
+    def succeeded(self) -> bool:
+        return not self.error
+
+
+class BatchTemplateRenderer:
+    """Parses the acknowledgement template once and renders every form from an
+    in-memory copy of it"""
+
+    def __init__(self, template_filepath: str = TEMPLATE_FILEPATH):
+        # immutable master copy, every form is rendered from a fresh copy of it
+        self._template_snapshot = load_template(template_filepath).snapshot()
+
+    def load_template(self) -> ExcelWriter:
+        return ExcelWriter.from_snapshot(self._template_snapshot)
+
+    def render(self, fields: Dict[Field, str], contents: List[Content]) -> ExcelWriter:
+        writer = self.load_template()
+        for field in Field:
+            writer = set_field_value(writer, field, fields.get(field, ""))
+        return set_content(writer, contents)
+
+    def render_batch(
+        self, jobs: Iterable[AcknowledgementJob], output_directory: str
+    ) -> List[str]:
+        output_filepaths = []
+        for job in jobs:
+            filename = job.filename or f"{generate_output_filename(job.fields)}.xlsx"
+            writer = self.render(job.fields, job.contents)
+            writer.save_workbook(output_directory, filename)
+            output_filepaths.append(os.path.join(output_directory, filename))
+        logger.info(f"rendered {len(output_filepaths)} acknowledgement forms")
+        return output_filepaths
+
+
+# one renderer per worker process, so the template is parsed once per process
+_worker_renderer: Optional[BatchTemplateRenderer] = None
+_worker_quotation_cache: Optional[QuotationCache] = None
+
+
+def find_quotation_pdfs(source: str) -> List[str]:
+    """Returns the PDFs in a directory, or the files matching a glob pattern"""
+    if os.path.isdir(source):
+        source = os.path.join(source, "*.pdf")
+    return sorted(glob.glob(source))
+
+
+def generate_forms_from_quotations(
+    source: str,
+    output_directory: str,
+    max_workers: Optional[int] = None,
+    template_filepath: str = TEMPLATE_FILEPATH,
+    cache_directory: Optional[str] = None,
+) -> List[GenerationResult]:
+    """Generates one acknowledgement form per quotation PDF across a process pool
+    and writes a manifest of the results into output_directory, parsed quotations
+    are reused from cache_directory when given
+
+    Forms are named after their fields and the quotation PDF, a quotation whose
+    PDF name is already taken by another one would overwrite its form and fails.
+    """
+    quotation_filepaths = find_quotation_pdfs(source)
+    name_collisions = _find_name_collisions(quotation_filepaths)
+    os.makedirs(output_directory, exist_ok=True)
+
+    start_time = time.perf_counter()
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_initialize_worker,
+        initargs=(template_filepath, cache_directory),
+    ) as executor:
+        filepaths_to_generate = [
+            filepath
+            for filepath in quotation_filepaths
+            if filepath not in name_collisions
+        ]
+        generated_results = dict(
+            zip(
+                filepaths_to_generate,
+                executor.map(
+                    partial(
+                        _generate_form_from_quotation,
+                        output_directory=output_directory,
+                        template_filepath=template_filepath,
+                    ),
+                    filepaths_to_generate,
+                ),
+            )
+        )
+    results = [
+        generated_results.get(filepath)
+        or GenerationResult(
+            filepath,
+            output_filepath="",
+            seconds=0.0,
+            error=f"output name collides with {name_collisions[filepath]}",
+        )
+        for filepath in quotation_filepaths
+    ]
+    total_seconds = time.perf_counter() - start_time
+
+    write_manifest(results, output_directory, total_seconds)
+    logger.info(
+        f"generated {sum(result.succeeded for result in results)} of"
+        f" {len(results)} acknowledgement forms in {total_seconds:.2f}s"
+    )
+    return results
+
+
+def _find_name_collisions(quotation_filepaths: List[str]) -> Dict[str, str]:
+    """maps every quotation whose PDF name was taken by an earlier quotation to
+    that quotation"""
+    filepaths_by_name: Dict[str, str] = {}
+    name_collisions = {}
+    for filepath in quotation_filepaths:
+        name = _get_quotation_name(filepath).lower()
+        if name in filepaths_by_name:
+            name_collisions[filepath] = filepaths_by_name[name]
+        else:
+            filepaths_by_name[name] = filepath
+    return name_collisions
+
+
+def _get_quotation_name(quotation_filepath: str) -> str:
+    return os.path.splitext(os.path.basename(quotation_filepath))[0]
+
+
+def _initialize_worker(template_filepath: str, cache_directory: Optional[str]) -> None:
+    global _worker_renderer, _worker_quotation_cache
+    _worker_renderer = BatchTemplateRenderer(template_filepath)
+    if cache_directory is not None:
+        _worker_quotation_cache = QuotationCache(cache_directory)
+
+
+def _generate_form_from_quotation(
+    quotation_filepath: str,
+    output_directory: str,
+    template_filepath: str = TEMPLATE_FILEPATH,
+) -> GenerationResult:
+    start_time = time.perf_counter()
+    try:
+        output_filepath = _render_quotation(
+            quotation_filepath, output_directory, template_filepath
+        )
+    except Exception as exc:
+        logger.warning(f"failed to generate form for {quotation_filepath}: {exc}")
+        return GenerationResult(
+            quotation_filepath,
+            output_filepath="",
+            seconds=time.perf_counter() - start_time,
+            error=f"{type(exc).__name__}: {exc}",
+        )
+    return GenerationResult(
+        quotation_filepath, output_filepath, time.perf_counter() - start_time
+    )
+
+
+def _render_quotation(
+    quotation_filepath: str, output_directory: str, template_filepath: str
+) -> str:
+    """Renders and saves the form of one quotation, named like the forms the GUI
+    saves followed by the quotation PDF name, returns the output filepath"""
+    global _worker_renderer
+    if _worker_renderer is None:
+        _worker_renderer = BatchTemplateRenderer(template_filepath)
+    reader = QuotationReader(quotation_filepath, cache=_worker_quotation_cache)
+    fields = reader.get_fields()
+    writer = _worker_renderer.render(fields, reader.get_content())
+    # quotations carry no job number, the PDF name tells their forms apart
+    filename = (
+        f"{generate_output_filename(fields)}_{_get_quotation_name(quotation_filepath)}"
+        ".xlsx"
+    )
+    writer.save_workbook(output_directory, filename)
+    return os.path.join(output_directory, filename)
+
+
+def write_manifest(
+    results: List[GenerationResult], output_directory: str, total_seconds: float
+) -> str:
+    manifest = {
+        "total_seconds": total_seconds,
+        "succeeded": [
+            {
+                "quotation": result.quotation_filepath,
+                "output": result.output_filepath,
+                "seconds": result.seconds,
+            }
+            for result in results
+            if result.succeeded
+        ],
+        "failed": [
+            {
+                "quotation": result.quotation_filepath,
+                "error": result.error,
+                "seconds": result.seconds,
+            }
+            for result in results
+            if not result.succeeded
+        ],
+    }
+    manifest_filepath = os.path.join(output_directory, MANIFEST_FILENAME)
+    with open(manifest_filepath, "w", encoding="utf-8") as manifest_file:
+        json.dump(manifest, manifest_file, indent=2)
+    return manifest_filepath
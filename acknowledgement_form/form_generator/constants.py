@@ -8,6 +8,10 @@ TEMPLATE_FILEPATH = os.path.join(
     "acknowledgement_form", "template", "template_job_ack.xlsx"
 )
 
+QUOTATION_CACHE_DIRECTORY = os.path.join(
+    os.path.expanduser("~"), ".acknowledgement_form", "quotation_cache"
+)
+
 
 class FieldInfo(NamedTuple):
     cell_id: str
@@ -44,9 +44,14 @@ class ConfirmationEmailGenerator:
             self._job_number: f"JOB NO {self._job_number}",
         }
 
-    def create_email_body(self) -> str:
-        subject = self.create_email_subject()
-        content_lines = self.create_lines_from_contents()
+    def create_email_body(
+        self, subject: Optional[str] = None, content_lines: Optional[str] = None
+    ) -> str:
+        """an already created subject or content lines are reused if given"""
+        if subject is None:
+            subject = self.create_email_subject()
+        if content_lines is None:
+            content_lines = self.create_lines_from_contents()
         final_line = self._create_final_line()
 
         return self._generate_email_body_lines(
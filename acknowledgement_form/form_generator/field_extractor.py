@@ -0,0 +1,135 @@
+import re
+from typing import Dict
+
+from loguru import logger
+
+from acknowledgement_form.form_generator.constants import Field
+
+_BILL_TO = "BILL TO\n"
+_QUOTATION_PREFIX = "MMSQ"
+# in the parsed pdf text, version number is infront of page no. text
+_VERSION_NUMBER_PREFIX = "Page No. "
+_VESSEL_PREFIX = "Vessel: "
+_CLASS_PREFIX = "Class: "
+_DRAWING_NUMBER_PREFIX = "Drawing No.:"
+_DURATION_PREFIX = "Duration:"
+
+_DURATION_END_STRS = ("day", "month", "week")
+_ALTERNATIVE_DURATION_END_PREFIX = "Delivery:"
+
+_FIELD_MARKERS = (
+    _BILL_TO,
+    _QUOTATION_PREFIX,
+    _VERSION_NUMBER_PREFIX,
+    _VESSEL_PREFIX,
+    _CLASS_PREFIX,
+    _DRAWING_NUMBER_PREFIX,
+    _DURATION_PREFIX,
+)
+# none of the markers overlap, so one alternation finds the first of each
+_FIELD_MARKER_PATTERN = re.compile("|".join(map(re.escape, _FIELD_MARKERS)))
+
+
+class FieldExtractor:
+    """Locates every field marker of a page in a single scan, field values are
+    then sliced from the page text at the recorded offsets"""
+
+    def __init__(self, page_text: str):
+        self._page_text = page_text
+        self._marker_indices = self._find_first_marker_indices(page_text)
+
+    def _find_first_marker_indices(self, page_text: str) -> Dict[str, int]:
+        marker_indices: Dict[str, int] = {}
+        for match in _FIELD_MARKER_PATTERN.finditer(page_text):
+            marker_indices.setdefault(match.group(), match.start())
+            if len(marker_indices) == len(_FIELD_MARKERS):
+                break
+        return marker_indices
+
+    @property
+    def has_duration(self) -> bool:
+        return _DURATION_PREFIX in self._marker_indices
+
+    def get_first_page_fields(self) -> Dict[Field, str]:
+        return {
+            Field.CLIENT_NAME: self.get_client_name(),
+            Field.QUOTATION_NUM: self.get_quotation_number(),
+            Field.VESSEL: self.get_vessel(),
+            Field.CLASS: self.get_vessel_class(),
+            Field.DRAWING_NUM: self.get_drawing_number(),
+        }
+
+    def get_client_name(self) -> str:
+        if _BILL_TO not in self._marker_indices:
+            logger.warning("Client name could not be found")
+            return "-"
+        return self._get_rest_of_line(_BILL_TO)
+
+    def get_quotation_number(self) -> str:
+        if _QUOTATION_PREFIX not in self._marker_indices:
+            logger.warning("Quotation number could not be found")
+            return "-"
+
+        quotation_number_start_index = self._marker_indices[_QUOTATION_PREFIX]
+        quotation_number_end_index = self._page_text.find(
+            " ", quotation_number_start_index
+        )
+
+        version_number_index = self._marker_indices.get(
+            _VERSION_NUMBER_PREFIX, -1
+        ) + len(_VERSION_NUMBER_PREFIX)
+        version_number = int(
+            self._page_text[version_number_index : version_number_index + 1]
+        )
+
+        version_number_str = f" V{version_number}" if version_number > 1 else ""
+        quotation_number = self._page_text[
+            quotation_number_start_index:quotation_number_end_index
+        ]
+        return (quotation_number + version_number_str).strip()
+
+    def get_vessel(self) -> str:
+        if _VESSEL_PREFIX not in self._marker_indices:
+            logger.warning("Vessel could not be found")
+            return "N/A"
+        return self._get_rest_of_line(_VESSEL_PREFIX)
+
+    def get_vessel_class(self) -> str:
+        if _CLASS_PREFIX not in self._marker_indices:
+            logger.warning("Class could not be found")
+            return "Not Involved"
+        return self._get_rest_of_line(_CLASS_PREFIX)
+
+    def get_drawing_number(self) -> str:
+        if _DRAWING_NUMBER_PREFIX not in self._marker_indices:
+            logger.warning("no drawing number found")
+            return "-"
+        return self._get_rest_of_line(_DRAWING_NUMBER_PREFIX)
+
+    def get_duration(self) -> str:
+        if not self.has_duration:
+            logger.warning("Duration could not be found")
+            return "N/A"
+
+        # the duration value starts on the line after the duration prefix
+        duration_start_index = (
+            self._page_text.find("\n", self._marker_indices[_DURATION_PREFIX]) + 1
+        )
+        duration_end_index = self._get_end_index_for_duration(duration_start_index)
+        return self._page_text[duration_start_index:duration_end_index].strip()
+
+    def _get_end_index_for_duration(self, start_index: int) -> int:
+        lowered_page_text = self._page_text.lower()
+        for end_str in _DURATION_END_STRS:
+            end_str_index = lowered_page_text.find(end_str, start_index)
+            if end_str_index != -1:
+                index = end_str_index + len(end_str)
+                if lowered_page_text[index : index + 1] == "s":
+                    index = index + 1
+                return index
+        return self._page_text.find(_ALTERNATIVE_DURATION_END_PREFIX, start_index)
+
+    def _get_rest_of_line(self, prefix: str) -> str:
+        start_index = self._marker_indices[prefix] + len(prefix)
+        end_index = self._page_text.find("\n", start_index)
+        return self._page_text[start_index:end_index].strip()
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 from loguru import logger
 
@@ -10,7 +10,7 @@ from acknowledgement_form.form_generator.constants import (
     Content,
     Field,
 )
-from excel_writer.writer import CellRange, ExcelWriter
+from excel_writer.writer import CellRange, CellStyle, ExcelWriter
 
 
 def load_template(template_filepath: str = TEMPLATE_FILEPATH) -> ExcelWriter:
@@ -19,6 +19,13 @@ def load_template(template_filepath: str = TEMPLATE_FILEPATH) -> ExcelWriter:
     )
 
 
+def generate_output_filename(fields: Dict[Field, str]) -> str:
+    client_name = fields.get(Field.CLIENT_NAME, "")
+    job_number = fields.get(Field.JOB_NUM, "")
+    quotation_number = fields.get(Field.QUOTATION_NUM, "")
+    return f"ACK-JN{job_number}-{quotation_number}-{client_name}".replace(" ", "_")
+
+
 def set_field_value(
     writer: ExcelWriter, field: Field, value_to_set: str
 ) -> ExcelWriter:
@@ -43,40 +50,49 @@ def set_content(writer: ExcelWriter, contents: List[Content]) -> ExcelWriter:
 
     start_cell = writer.cell(0, FIRST_CONTENT_TITLE_CELL)
 
-    current_row = start_cell.row
-    column = start_cell.column
-
-    current_signature_range = SIGNATURE_BLOCK_CELL_RANGE
+    content_rows, content_styles = _build_content_block(
+        contents, content_title_style, content_description_style
+    )
 
+    # the rows needed are known up front, so the signature block is shifted
+    # once to directly below the contents before they are written
+    rows_to_move = (
+        start_cell.row + len(content_rows) - SIGNATURE_BLOCK_CELL_RANGE.start_row
+    )
     current_signature_range = writer.move_range(
-        0, current_signature_range, rows_to_move=100
+        0, SIGNATURE_BLOCK_CELL_RANGE, rows_to_move=rows_to_move
     )
 
-    for title, descriptions in contents:
-        writer.cell(
+    # unlike the old per-cell writes, which skipped falsy values, write_block
+    # writes empty description lines as "" and only skips None
+    if content_rows:
+        writer.write_block(
             0,
-            cell_id=(current_row, column),
-            set_value=title,
-            set_style=content_title_style,
+            (start_cell.row, start_cell.column),
+            content_rows,
+            styles=content_styles,
         )
 
-        for description_line in descriptions:
-            current_row += 1
-            writer.cell(
-                0,
-                cell_id=(current_row, column),
-                set_value=description_line,
-                set_style=content_description_style,
-            )
-
-        current_row += 2
+    return _set_print_area(writer, current_signature_range)
 
-    rows_to_move = current_row - current_signature_range.start_row
-    current_signature_range = writer.move_range(
-        0, current_signature_range, rows_to_move=rows_to_move
-    )
 
-    return _set_print_area(writer, current_signature_range)
+def _build_content_block(
+    contents: List[Content],
+    title_style: CellStyle,
+    description_style: CellStyle,
+) -> Tuple[List[List[Optional[str]]], List[Optional[CellStyle]]]:
+    rows: List[List[Optional[str]]] = []
+    styles: List[Optional[CellStyle]] = []
+    for title, descriptions in contents:
+        rows.append([title])
+        styles.append(title_style)
+        for description_line in descriptions:
+            rows.append([description_line])
+            styles.append(description_style)
+        # blank spacer row between content items
+        rows.append([None])
+        styles.append(None)
+    return rows, styles
 
 
 def _set_print_area(writer: ExcelWriter, signature_range: CellRange) -> ExcelWriter:
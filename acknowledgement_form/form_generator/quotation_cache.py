@@ -0,0 +1,79 @@
+import hashlib
+from typing import Dict, List, NamedTuple, Optional
+
+from acknowledgement_form.form_generator.constants import (
+    QUOTATION_CACHE_DIRECTORY,
+    Content,
+    Field,
+)
+from excel_writer.json_cache import JsonFileCache
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+DEFAULT_MAX_CACHE_BYTES = 64 * 1024 * 1024
+
+
+class ParsedQuotation(NamedTuple):
+    # None for pages not extracted yet, and for fields or contents not parsed yet
+    pages_text: List[Optional[str]]
+    fields: Optional[Dict[Field, str]] = None
+    contents: Optional[List[Content]] = None
+
+
+class QuotationCache(JsonFileCache[ParsedQuotation]):
+    """On-disk cache of parsed quotations keyed by the PDF content hash and the
+    parser version, the least recently used entries are evicted once the entries
+    take up more than max_bytes"""
+
+    def __init__(
+        self,
+        cache_directory: str = QUOTATION_CACHE_DIRECTORY,
+        max_bytes: int = DEFAULT_MAX_CACHE_BYTES,
+    ):
+        super().__init__(cache_directory, max_bytes, description="quotation cache")
+
+    def get_key(self, pdf_filepath: str, parser_version: int) -> str:
+        digest = hashlib.sha256(f"parser-v{parser_version}:".encode())
+        with open(pdf_filepath, "rb") as pdf_file:
+            while chunk := pdf_file.read(_HASH_CHUNK_SIZE):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _serialize(self, parsed_quotation: ParsedQuotation) -> Dict:
+        return {
+            "pages_text": parsed_quotation.pages_text,
+            "fields": (
+                None
+                if parsed_quotation.fields is None
+                else {
+                    field.name: value
+                    for field, value in parsed_quotation.fields.items()
+                }
+            ),
+            "contents": (
+                None
+                if parsed_quotation.contents is None
+                else [
+                    [title, descriptions]
+                    for title, descriptions in parsed_quotation.contents
+                ]
+            ),
+        }
+
+    def _deserialize(self, entry: Dict) -> ParsedQuotation:
+        fields, contents = entry["fields"], entry["contents"]
+        return ParsedQuotation(
+            pages_text=list(entry["pages_text"]),
+            fields=(
+                None
+                if fields is None
+                else {Field[name]: value for name, value in fields.items()}
+            ),
+            contents=(
+                None
+                if contents is None
+                else [
+                    Content(title, list(descriptions))
+                    for title, descriptions in contents
+                ]
+            ),
+        )
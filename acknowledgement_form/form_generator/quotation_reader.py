@@ -1,215 +1,220 @@
 import re
-from typing import Dict, List
-
-from loguru import logger
-from pypdf import PdfReader
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Union,
+    overload,
+)
+
+from pypdf import PageObject, PdfReader
 
 from acknowledgement_form.form_generator.constants import Content, Field
+from acknowledgement_form.form_generator.field_extractor import FieldExtractor
+from acknowledgement_form.form_generator.quotation_cache import (
+    ParsedQuotation,
+    QuotationCache,
+)
 
 CLIENT_NAME_TEXT_COORDINATES = "18.48, 590.065, 217.986, 599.048"
 
 SAMPLE_PDF = "tests/acknowledgement_form_tests/test_files/sample_quo.pdf"
 
+DEFAULT_DESCRIPTION_LINES = 2
 
-class QuotationReader:
-    def __init__(self, quotation_pdf_filepath: str):
-        self._reader = PdfReader(quotation_pdf_filepath)
-        self.pages = self._reader.pages
-        self.pages_text = [page.extract_text() for page in self.pages]
+# bump whenever parsing changes so cached quotations are parsed again
+PARSER_VERSION = 1
 
-    def get_fields(self) -> Dict[Field, str]:
-        return _get_field_values_from_pages(self.pages_text)
+_ITEM_NUMBER_PATTERN = re.compile(r"\d+\.\s+")
 
-    def get_content(self) -> List[Content]:
-        return _get_content_from_pages(self.pages_text)
 
+class LazyPagesText(Sequence[str]):
+    """Text of each PDF page, extracted the first time the page is read, pages_text
+    holds the text known up front with None for every page still to extract"""
 
-def _get_field_values_from_pages(all_pages_text: List[str]) -> Dict[Field, str]:
-    first_page_text = all_pages_text[0]
-    first_page_fields = _get_fields_from_first_page(first_page_text)
+    def __init__(
+        self,
+        get_pages: Callable[[], Sequence[PageObject]],
+        pages_text: List[Optional[str]],
+    ):
+        self._get_pages = get_pages
+        self._pages_text = pages_text
 
-    duration = _get_duration_from_pages(all_pages_text)
+    def __len__(self) -> int:
+        return len(self._pages_text)
 
-    return first_page_fields | {Field.DURATION: duration}
+    @overload
+    def __getitem__(self, index: int) -> str:
+        ...
 
+    @overload
+    def __getitem__(self, index: slice) -> List[str]:
+        ...
 
-def _get_fields_from_first_page(first_page_text: str) -> Dict[Field, str]:
-    client_name = get_client_name(first_page_text)
-    quotation_number = get_quotation_number(first_page_text)
-    vessel = get_vessel(first_page_text)
-    vessel_class = get_vessel_class(first_page_text)
-    drawing_number = get_drawing_number(first_page_text)
-    return {
-        Field.CLIENT_NAME: client_name,
-        Field.QUOTATION_NUM: quotation_number,
-        Field.VESSEL: vessel,
-        Field.CLASS: vessel_class,
-        Field.DRAWING_NUM: drawing_number,
-    }
-
-
-def _get_duration_from_pages(all_pages_text: List[str]) -> str:
-    if page_with_duration := [
-        page_text for page_text in all_pages_text if "Duration:" in page_text
-    ]:
-        return get_duration(page_with_duration[0])
-    return "N/A"
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(index, slice):
+            return [self[page_index] for page_index in range(*index.indices(len(self)))]
+        page_text = self._pages_text[index]
+        if page_text is None:
+            page_text = self._get_pages()[index].extract_text()
+            self._pages_text[index] = page_text
+        return page_text
 
+    @property
+    def extracted_page_count(self) -> int:
+        return sum(page_text is not None for page_text in self._pages_text)
 
-def _get_content_from_pages(all_pages_text: List[str]) -> List[Content]:
-    contents = []
-    for page_text in all_pages_text:
-        contents.extend(get_content(page_text))
-    return contents
+    @property
+    def known_pages_text(self) -> List[Optional[str]]:
+        return list(self._pages_text)
 
 
-def get_client_name(page_text: str) -> str:
-    bill_to_text = "BILL TO\n"
+class QuotationReader:
+    def __init__(
+        self, quotation_pdf_filepath: str, cache: Optional[QuotationCache] = None
+    ):
+        """with a cache, whatever was parsed of the PDF before is served without
+        opening it, and what is parsed now is added to the cache"""
+        self._quotation_pdf_filepath = quotation_pdf_filepath
+        self._reader: Optional[PdfReader] = None
+        self._cache = cache
+        self._cache_key = ""
+        cached_quotation = None
+        if cache is not None:
+            self._cache_key = cache.get_key(quotation_pdf_filepath, PARSER_VERSION)
+            cached_quotation = cache.load(self._cache_key)
+
+        self._parsed_quotation = cached_quotation or ParsedQuotation(
+            pages_text=[None] * len(self.pages)
+        )
+        self.pages_text = LazyPagesText(
+            lambda: self.pages, list(self._parsed_quotation.pages_text)
+        )
+
+    @property
+    def pages(self) -> Sequence[PageObject]:
+        if self._reader is None:
+            self._reader = PdfReader(self._quotation_pdf_filepath)
+        return self._reader.pages
 
-    if bill_to_text not in page_text:
-        logger.warning("Client name could not be found")
-        return "-"
+    def get_fields(self) -> Dict[Field, str]:
+        fields = self._parsed_quotation.fields
+        if fields is None:
+            fields = _get_field_values_from_pages(self.pages_text)
+            self._remember(fields=fields)
+        return dict(fields)
+
+    def get_content(
+        self, description_lines: int = DEFAULT_DESCRIPTION_LINES
+    ) -> List[Content]:
+        if description_lines != DEFAULT_DESCRIPTION_LINES:
+            return _get_content_from_pages(self.pages_text, description_lines)
+        contents = self._parsed_quotation.contents
+        if contents is None:
+            contents = _get_content_from_pages(self.pages_text)
+            self._remember(contents=contents)
+        return list(contents)
+
+    def _remember(self, **parsed: Any) -> None:
+        """keeps the parsed values with the page text extracted so far, storing
+        them in the cache if set"""
+        self._parsed_quotation = self._parsed_quotation._replace(
+            pages_text=self.pages_text.known_pages_text, **parsed
+        )
+        if self._cache is not None:
+            self._cache.store(self._cache_key, self._parsed_quotation)
+
+
+def _get_field_values_from_pages(all_pages_text: Sequence[str]) -> Dict[Field, str]:
+    first_page = FieldExtractor(all_pages_text[0])
+    first_page_fields = first_page.get_first_page_fields()
+
+    duration = _get_duration_from_pages(all_pages_text, first_page)
 
-    bill_to_text_index = page_text.find(bill_to_text)
+    return first_page_fields | {Field.DURATION: duration}
 
-    client_name_start_index = bill_to_text_index + len(bill_to_text)
-    client_name_end_index = page_text.find("\n", client_name_start_index)
 
-    return page_text[client_name_start_index:client_name_end_index].strip()
+def _get_duration_from_pages(
+    all_pages_text: Sequence[str], first_page: FieldExtractor
+) -> str:
+    if first_page.has_duration:
+        return first_page.get_duration()
+    # stops extracting pages at the first one containing the duration
+    page_with_duration = next(
+        (
+            page_text
+            for page_text in islice(all_pages_text, 1, None)
+            if "Duration:" in page_text
+        ),
+        None,
+    )
+    if page_with_duration is not None:
+        return get_duration(page_with_duration)
+    return "N/A"
 
 
-def get_quotation_number(page_text: str) -> str:
-    quotation_prefix = "MMSQ"
+def _get_content_from_pages(
+    all_pages_text: Sequence[str], description_lines: int = DEFAULT_DESCRIPTION_LINES
+) -> List[Content]:
+    contents = []
+    for page_text in all_pages_text:
+        contents.extend(get_content(page_text, description_lines))
+    return contents
 
-    if quotation_prefix not in page_text:
-        logger.warning("Quotation number could not be found")
-        return "-"
 
-    quotation_number_start_index = page_text.find(quotation_prefix)
-    quotation_number_end_index = page_text.find(" ", quotation_number_start_index)
+def get_client_name(page_text: str) -> str:
+    return FieldExtractor(page_text).get_client_name()
 
-    # in the parsed pdf text, version number is infront of page no. text
-    version_number_prefix = "Page No. "
-    version_number_index = page_text.find(version_number_prefix) + len(
-        version_number_prefix
-    )
-    version_number = int(page_text[version_number_index : version_number_index + 1])
 
-    version_number_str = f" V{version_number}" if version_number > 1 else ""
-    quotation_number = page_text[
-        quotation_number_start_index:quotation_number_end_index
-    ]
-    return (quotation_number + version_number_str).strip()
+def get_quotation_number(page_text: str) -> str:
+    return FieldExtractor(page_text).get_quotation_number()
 
 
 def get_vessel(page_text: str) -> str:
-    vessel_prefix = "Vessel: "
-
-    if vessel_prefix not in page_text:
-        logger.warning("Vessel could not be found")
-        return "N/A"
-
-    vessel_start_index = page_text.find(vessel_prefix) + len(vessel_prefix)
-    vessel_end_index = page_text.find("\n", vessel_start_index)
-    return page_text[vessel_start_index:vessel_end_index].strip()
+    return FieldExtractor(page_text).get_vessel()
 
 
 def get_vessel_class(page_text: str) -> str:
-    class_prefix = "Class: "
-
-    if class_prefix not in page_text:
-        logger.warning("Class could not be found")
-        return "Not Involved"
-
-    class_start_index = page_text.find(class_prefix) + len(class_prefix)
-    class_end_index = page_text.find("\n", class_start_index)
-    return page_text[class_start_index:class_end_index].strip()
+    return FieldExtractor(page_text).get_vessel_class()
 
 
 def get_duration(page_text: str) -> str:
-    duration_prefix = _get_duration_prefix(page_text)
-
-    if duration_prefix not in page_text:
-        logger.warning("Duration could not be found")
-        return "N/A"
-
-    duration_start_index = page_text.find(duration_prefix) + len(duration_prefix)
-    duration_end_index = _get_end_index_for_duration(page_text, duration_start_index)
-    return page_text[duration_start_index:duration_end_index].strip()
-
-
-def _get_duration_prefix(page_text: str) -> str:
-    duration_prefix = "Duration:"
-    duration_prefix_start_index = page_text.find(duration_prefix)
-    duration_endline = "\n"
-    duration_endline_index = page_text.find(
-        duration_endline, duration_prefix_start_index
-    )
-    duration_prefix_end_index = duration_endline_index + len("\n")
-    return page_text[duration_prefix_start_index:duration_prefix_end_index]
-
-
-def _get_end_index_for_duration(page_text: str, start_index) -> int:
-    possible_end_strs = ["day", "month", "week"]
-    for end_str in possible_end_strs:
-        end_str_index = page_text.lower().find(end_str, start_index)
-        if end_str_index != -1:
-            index = end_str_index + len(end_str)
-            if page_text[index].lower() == "s":
-                index = index + 1
-            return index
-    alterative_duration_end_prefix = "Delivery:"
-    return page_text.find(alterative_duration_end_prefix, start_index)
+    return FieldExtractor(page_text).get_duration()
 
 
 def get_drawing_number(page_text: str) -> str:
-    drawing_number_prefix = "Drawing No.:"
-
-    if drawing_number_prefix not in page_text:
-        logger.warning("no drawing number found")
-        return "-"
-
-    drawing_number_start_index = page_text.find(drawing_number_prefix) + len(
-        drawing_number_prefix
-    )
-    drawing_number_end_index = page_text.find("\n", drawing_number_start_index)
-    return page_text[drawing_number_start_index:drawing_number_end_index].strip()
-
-
-def get_content(page_text: str) -> List[Content]:
-    item_titles = get_item_titles(page_text)
-    return get_item_description(page_text, item_titles)
+    return FieldExtractor(page_text).get_drawing_number()
+
+
+def get_content(
+    page_text: str, description_lines: int = DEFAULT_DESCRIPTION_LINES
+) -> List[Content]:
+    return list(iter_contents(page_text.split("\n"), description_lines))
+
+
+def iter_contents(
+    page_lines: Sequence[str], description_lines: int = DEFAULT_DESCRIPTION_LINES
+) -> Iterator[Content]:
+    """Yields the content of every numbered item in a single pass over the lines,
+    the title is the line after the item number followed by its descriptions"""
+    for line_index, line in enumerate(page_lines):
+        title_line_index = line_index + 1
+        if not _ITEM_NUMBER_PATTERN.match(line) or title_line_index >= len(page_lines):
+            continue
+        description_start_index = title_line_index + 1
+        descriptions = page_lines[
+            description_start_index : description_start_index + description_lines
+        ]
+        yield Content(
+            page_lines[title_line_index],
+            [description for description in descriptions if description.strip() != ""],
+        )
 
 
 def get_item_titles(page_text: str) -> List[str]:
-    page_lines = page_text.split("\n")
-    return [
-        page_lines[line_index + 1]
-        for line_index, line in enumerate(page_lines)
-        if re.match(r"\d+\.\s+", line)
-    ]
-
-
-def get_item_description(page_text: str, item_titles: List[str]) -> List[Content]:
-    page_lines = page_text.split("\n")
-    item_title_and_descriptions = []
-    for title in item_titles:
-        title_line_index = page_lines.index(title)
-        description_indices = _get_description_indices(title_line_index)
-        description = _get_descriptions_from_page_lines(page_lines, description_indices)
-        item_title_and_descriptions.append(Content(title, description))
-    return item_title_and_descriptions
-
-
-def _get_description_indices(title_line_index, description_lines: int = 2):
-    return [
-        title_line_index + additional_line
-        for additional_line in range(1, description_lines + 1)
-    ]
-
-
-def _get_descriptions_from_page_lines(
-    page_lines: List[str], description_indices: List[int]
-) -> List[str]:
-    description = [page_lines[index] for index in description_indices]
-    return [line for line in description if line.strip() != ""]
+    return [title for title, _ in iter_contents(page_text.split("\n"))]
@@ -0,0 +1,152 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+from loguru import logger
+
+T = TypeVar("T")
+
+# posts a function and its arguments to be run on the UI thread
+PostFunction = Callable[..., None]
+
+
+class TaskCancelled(Exception):
+    pass
+
+
+class _Cancellation:
+    """Cancel state shared by a task and its handle, a task stops being
+    cancellable once it starts its final step"""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._cancelled = False
+        self._cancellable = True
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self) -> bool:
+        with self._lock:
+            if self._cancellable:
+                self._cancelled = True
+            return self._cancelled
+
+    def end_cancellable(self) -> bool:
+        """returns False if the task was cancelled before"""
+        with self._lock:
+            if self._cancelled:
+                return False
+            self._cancellable = False
+            return True
+
+
+class TaskContext:
+    """Handed to a background task to report progress and check for cancel"""
+
+    def __init__(
+        self,
+        cancellation: _Cancellation,
+        post: PostFunction,
+        on_progress: Optional[Callable[[str], None]] = None,
+    ):
+        self._cancellation = cancellation
+        self._post = post
+        self._on_progress = on_progress
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancellation.cancelled
+
+    def raise_if_cancelled(self) -> None:
+        if self.cancelled:
+            raise TaskCancelled()
+
+    def report_progress(self, message: str) -> None:
+        """Checks for cancel first, so progress steps double as cancel points"""
+        self.raise_if_cancelled()
+        self._post_progress(message)
+
+    def report_final_step(self, message: str) -> None:
+        """Last cancel point, the task runs to completion after it, e.g. once it
+        starts writing its output"""
+        if not self._cancellation.end_cancellable():
+            raise TaskCancelled()
+        self._post_progress(message)
+
+    def _post_progress(self, message: str) -> None:
+        if self._on_progress is not None:
+            self._post(self._on_progress, message)
+
+
+class TaskHandle(Generic[T]):
+    def __init__(self, future: "Future[T]", cancellation: _Cancellation):
+        self._future = future
+        self._cancellation = cancellation
+
+    @property
+    def done(self) -> bool:
+        return self._future.done()
+
+    def cancel(self) -> bool:
+        """Returns False if the task already started its final step, it then
+        completes and its callbacks are run"""
+        if not self._cancellation.cancel():
+            return False
+        self._future.cancel()
+        return True
+
+    def result(self, timeout: Optional[float] = None) -> T:
+        return self._future.result(timeout)
+
+
+class BackgroundRunner:
+    """Runs GUI work on a worker thread, the done, error and progress callbacks
+    are posted back to the UI thread through post, e.g. appJar queueFunction"""
+
+    def __init__(self, post: PostFunction, max_workers: int = 1):
+        self._post = post
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="gui-worker"
+        )
+
+    def submit(
+        self,
+        task: Callable[[TaskContext], T],
+        on_done: Callable[[T], None],
+        on_error: Optional[Callable[[BaseException], None]] = None,
+        on_progress: Optional[Callable[[str], None]] = None,
+    ) -> TaskHandle[T]:
+        """callbacks of a cancelled task are not run"""
+        cancellation = _Cancellation()
+        context = TaskContext(cancellation, self._post, on_progress)
+        future = self._executor.submit(task, context)
+        future.add_done_callback(
+            lambda done_future: self._post_outcome(
+                done_future, cancellation, on_done, on_error
+            )
+        )
+        return TaskHandle(future, cancellation)
+
+    def shutdown(self, wait: bool = False) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _post_outcome(
+        self,
+        future: "Future[Any]",
+        cancellation: _Cancellation,
+        on_done: Callable[[Any], None],
+        on_error: Optional[Callable[[BaseException], None]],
+    ) -> None:
+        if future.cancelled() or cancellation.cancelled:
+            return
+        error = future.exception()
+        if error is None:
+            self._post(on_done, future.result())
+        elif isinstance(error, TaskCancelled):
+            return
+        elif on_error is not None:
+            self._post(on_error, error)
+        else:
+            logger.error(f"background task failed: {error!r}")
@@ -0,0 +1,143 @@
+import re
+from bisect import bisect_right
+from itertools import chain
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from acknowledgement_form.form_generator.constants import Content
+
+TITLE_LINE = "Title: "
+DESCRIPTION_START_LINE = "Description:\n"
+DESCRIPTION_END_BLOCK = "---ENDBLOCK---"
+
+_END_BLOCK_LINE_PATTERN = re.compile(rf"^{re.escape(DESCRIPTION_END_BLOCK)}$", re.M)
+
+
+class ContentSegment(NamedTuple):
+    """Text up to and including an end block line, descriptions is None for
+    the trailing text that no end block line closes"""
+
+    titles: Tuple[str, ...]
+    descriptions: Optional[Tuple[str, ...]]
+    start_line: int
+    line_count: int
+
+
+class _ParsedSegment(NamedTuple):
+    titles: Tuple[str, ...]
+    descriptions: Tuple[str, ...]
+
+
+class ContentModel:
+    """Contents of the GUI text area, kept in sync by update with the text of
+    the widget, only segments whose text changed since the last update are
+    parsed again"""
+
+    def __init__(self):
+        self._parsed_segments: Dict[str, _ParsedSegment] = {}
+        self._segments: List[ContentSegment] = []
+        self._segment_start_lines: List[int] = []
+        self._contents: List[Content] = []
+        self._text = ""
+        # incremented whenever the contents change
+        self.version = 0
+        self.parsed_segment_count = 0
+
+    @property
+    def contents(self) -> List[Content]:
+        return list(self._contents)
+
+    @property
+    def segments(self) -> List[ContentSegment]:
+        return list(self._segments)
+
+    def update(self, text: str) -> bool:
+        """Returns whether the contents changed"""
+        if text == self._text:
+            return False
+        self._text = text
+        segment_texts = _END_BLOCK_LINE_PATTERN.split(text)
+
+        parsed_segments: Dict[str, _ParsedSegment] = {}
+        segments: List[ContentSegment] = []
+        start_line = 0
+        for segment_index, segment_text in enumerate(segment_texts):
+            parsed_segment = parsed_segments.get(
+                segment_text
+            ) or self._parsed_segments.get(segment_text)
+            if parsed_segment is None:
+                parsed_segment = self._parse_segment(segment_text)
+            parsed_segments[segment_text] = parsed_segment
+            is_closed = segment_index < len(segment_texts) - 1
+            # splitting leaves the newline ending an end block line at the start
+            # of the next segment, so only the first segment adds its first line
+            line_count = segment_text.count("\n") + (segment_index == 0)
+            segments.append(
+                ContentSegment(
+                    titles=parsed_segment.titles,
+                    descriptions=parsed_segment.descriptions if is_closed else None,
+                    start_line=start_line,
+                    line_count=line_count,
+                )
+            )
+            start_line += line_count
+
+        # only the segments of the current text are kept for the next update
+        self._parsed_segments = parsed_segments
+        self._segments = segments
+        self._segment_start_lines = [segment.start_line for segment in segments]
+        contents = self._build_contents(segments)
+        if contents == self._contents:
+            return False
+        self._contents = contents
+        self.version += 1
+        return True
+
+    def set_contents(self, contents: Iterable[Content]) -> str:
+        """Returns the text area text for the contents"""
+        text = serialize_contents(contents)
+        self.update(text)
+        return text
+
+    def segment_at_line(self, line: int) -> Optional[ContentSegment]:
+        """line is 0-based, as the segments' start lines"""
+        segment_index = bisect_right(self._segment_start_lines, line) - 1
+        if segment_index < 0:
+            return None
+        segment = self._segments[segment_index]
+        if line >= segment.start_line + segment.line_count:
+            return None
+        return segment
+
+    def _parse_segment(self, segment_text: str) -> _ParsedSegment:
+        self.parsed_segment_count += 1
+        titles = []
+        descriptions = []
+        for line in segment_text.split("\n"):
+            if line.startswith(TITLE_LINE):
+                titles.append(line[len(TITLE_LINE) :])
+            elif not line.startswith("Description:") and line.strip():
+                descriptions.append(line)
+        return _ParsedSegment(tuple(titles), tuple(descriptions))
+
+    def _build_contents(self, segments: List[ContentSegment]) -> List[Content]:
+        # titles pair up with the description blocks in order, as when the whole
+        # text was scanned, even if a segment holds more or less than one title
+        titles = chain.from_iterable(segment.titles for segment in segments)
+        descriptions = (
+            segment.descriptions
+            for segment in segments
+            if segment.descriptions is not None
+        )
+        return [
+            Content(title, list(description_lines))
+            for title, description_lines in zip(titles, descriptions)
+        ]
+
+
+def serialize_contents(contents: Iterable[Content]) -> str:
+    text_parts = []
+    for title, descriptions in contents:
+        text_parts.append(f"{TITLE_LINE}{title} \n{DESCRIPTION_START_LINE}")
+        text_parts.extend(f"{description_line} \n" for description_line in descriptions)
+        text_parts.append(f"\n{DESCRIPTION_END_BLOCK}\n\n")
+    return "".join(text_parts)
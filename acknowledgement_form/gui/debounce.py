@@ -0,0 +1,53 @@
+from typing import Any, Callable, FrozenSet, Generic, Hashable, Optional, Set, TypeVar
+
+ScheduleFunction = Callable[[int, Callable[[], None]], Any]
+CancelFunction = Callable[[Any], None]
+
+_Key = TypeVar("_Key", bound=Hashable)
+
+
+class Debouncer(Generic[_Key]):
+    """Runs the callback once calls to request stop for delay_ms, with the keys
+    requested since the last run, schedule and cancel are the Tk after and
+    after_cancel functions of the window"""
+
+    def __init__(
+        self,
+        schedule: ScheduleFunction,
+        cancel: CancelFunction,
+        callback: Callable[[FrozenSet[_Key]], None],
+        delay_ms: int = 300,
+    ):
+        self._schedule = schedule
+        self._cancel = cancel
+        self._callback = callback
+        self._delay_ms = delay_ms
+        self._pending_keys: Set[_Key] = set()
+        self._scheduled_id: Optional[Any] = None
+
+    @property
+    def is_pending(self) -> bool:
+        return self._scheduled_id is not None
+
+    def request(self, key: _Key) -> None:
+        self._pending_keys.add(key)
+        self._cancel_scheduled()
+        self._scheduled_id = self._schedule(self._delay_ms, self._run)
+
+    def flush(self) -> None:
+        """Runs a pending callback immediately"""
+        if self._scheduled_id is None:
+            return
+        self._cancel_scheduled()
+        self._run()
+
+    def _cancel_scheduled(self) -> None:
+        if self._scheduled_id is not None:
+            self._cancel(self._scheduled_id)
+            self._scheduled_id = None
+
+    def _run(self) -> None:
+        self._scheduled_id = None
+        keys = frozenset(self._pending_keys)
+        self._pending_keys.clear()
+        self._callback(keys)
@@ -1,16 +1,22 @@
-from typing import Dict, List, Optional, Tuple, Union
+import os
+from typing import Callable, Collection, Dict, List, Optional, Tuple, Union
 
 from appJar import gui
 from loguru import logger
 
+from acknowledgement_form.form_generator.batch import BatchTemplateRenderer
 from acknowledgement_form.form_generator.constants import Content, Field
 from acknowledgement_form.form_generator.email import ConfirmationEmailGenerator
-from acknowledgement_form.form_generator.generator import (
-    load_template,
-    set_content,
-    set_field_value,
-)
+from acknowledgement_form.form_generator.generator import generate_output_filename
+from acknowledgement_form.form_generator.quotation_cache import QuotationCache
 from acknowledgement_form.form_generator.quotation_reader import QuotationReader
+from acknowledgement_form.gui.background import (
+    BackgroundRunner,
+    TaskContext,
+    TaskHandle,
+)
+from acknowledgement_form.gui.content_model import ContentModel
+from acknowledgement_form.gui.debounce import Debouncer
 from excel_writer.writer import ExcelWriter
 
 
@@ -31,14 +37,40 @@ class AcknowledgementFormGeneratorGUI:
     _EMAIL_SUBJECT_TEXT_AREA_ID = "email_subject"
     _EMAIL_BODY_TEXT_AREA_ID = "email_body"
     _CONTENT_TEXT_AREA_ID = "contents"
-    _TITLE_LINE = "Title: "
-    _DESCRIPTION_START_LINE = "Description:\n"
-    _DESCRIPTION_END_BLOCK = "---ENDBLOCK---"
+
+    _UPDATE_DELAY_MS = 300
+    # entries that do not feed into the output filename or email
+    _UNTRACKED_ENTRIES = ("pdf_filepath", "output_filename")
+    _FILENAME_FIELDS = (Field.CLIENT_NAME, Field.JOB_NUM, Field.QUOTATION_NUM)
+    _EMAIL_SUBJECT_FIELDS = (
+        Field.CLIENT_NAME,
+        Field.VESSEL,
+        Field.QUOTATION_NUM,
+        Field.PO_NUM,
+        Field.JOB_NUM,
+    )
 
     def __init__(self):
         self.app = gui("Acknowledgement Form Generator", useTtk=True)
         self.writer: ExcelWriter
+        self._quotation_cache = QuotationCache()
+        self._content_model = ContentModel()
+        self._email_subject = ""
+        self._email_content_lines = ""
+        self._email_content_version = -1
+        self._update_debouncer: Debouncer[str] = Debouncer(
+            self.app.after,
+            self.app.afterCancel,
+            self._update_fields,
+            delay_ms=self._UPDATE_DELAY_MS,
+        )
+        self._runner = BackgroundRunner(self.app.queueFunction)
+        self._quotation_task: Optional[TaskHandle] = None
+        self._save_task: Optional[TaskHandle] = None
+        self._template_renderer: Optional[BatchTemplateRenderer] = None
+        self._rendered_form: Optional[Tuple[Tuple, ExcelWriter]] = None
         self._setup_gui()
+        self._preload_template()
 
     def _setup_gui(self):
         self._setup_labels()
@@ -47,6 +79,8 @@ class AcknowledgementFormGeneratorGUI:
         self._setup_icon()
         self._setup_size()
         self._setup_change_functions()
+        self._setup_statusbar()
+        self.app.setStopFunction(self._stop)
 
     def _setup_labels(self):
         self.app.addLabel(
@@ -67,16 +101,30 @@ class AcknowledgementFormGeneratorGUI:
         self.app.addScrolledTextArea(self._EMAIL_BODY_TEXT_AREA_ID)
 
     def _setup_change_functions(self):
-        for entry_label in self._LABEL_ENTRIES.values():
-            self.app.setEntryChangeFunction(entry_label, self._update_fields)  # type: ignore
+        # appJar passes the entry label or text area id of the changed widget
+        for entry_id, entry_label in self._LABEL_ENTRIES.items():
+            if entry_id in self._UNTRACKED_ENTRIES:
+                continue
+            self.app.setEntryChangeFunction(entry_label, self._request_update)  # type: ignore
         self.app.setTextAreaChangeFunction(
-            self._CONTENT_TEXT_AREA_ID, self._update_fields
+            self._CONTENT_TEXT_AREA_ID, self._request_update
         )
 
+    def _request_update(self, widget_id: str):
+        self._update_debouncer.request(widget_id)
+
     def _setup_buttons(self):
         self.app.addButton("Select Quotation PDF", self._pdf_file_select)
         self.app.addButton("Save", self._save_file)
         self.app.addButton("Save As PDF", self._save_as_pdf)
+        self.app.addButton("Cancel", self._cancel_tasks)
+
+    def _setup_statusbar(self):
+        self.app.addStatusbar(fields=1)
+        self._set_status("Ready")
+
+    def _set_status(self, message: str) -> None:
+        self.app.setStatusbar(message)
 
     def _setup_icon(self):
         try:
@@ -97,83 +145,157 @@ class AcknowledgementFormGeneratorGUI:
 
     def _populate_fields_from_quotation(self):
         quotation_filepath = self._get_entry("pdf_filepath")
-        try:
-            self._update_ui_with_quotation_data(quotation_filepath)
-        except Exception as exc:
-            logger.warning(f"failed to get values from quotation pdf: {exc}")
+        if self._quotation_task is not None:
+            self._quotation_task.cancel()
+        self._set_status(f"Reading {os.path.basename(quotation_filepath)}")
+        self._quotation_task = self._runner.submit(
+            lambda context: self._read_quotation(context, quotation_filepath),
+            on_done=self._update_ui_with_quotation_data,
+            on_error=self._on_quotation_error,
+            on_progress=self._set_status,
+        )
 
-    def _update_ui_with_quotation_data(self, quotation_filepath: str) -> None:
-        reader = QuotationReader(quotation_filepath)
+    def _read_quotation(
+        self, context: TaskContext, quotation_filepath: str
+    ) -> Tuple[Dict[Field, str], List[Content]]:
+        """runs on the worker thread, so it must not touch the widgets"""
+        reader = QuotationReader(quotation_filepath, cache=self._quotation_cache)
+        context.report_progress("Reading quotation fields")
         fields = reader.get_fields()
+        context.report_progress("Reading quotation contents")
+        return fields, reader.get_content()
+
+    def _update_ui_with_quotation_data(
+        self, quotation_data: Tuple[Dict[Field, str], List[Content]]
+    ) -> None:
+        fields, contents = quotation_data
         self._set_fields_into_label_entries(fields)
-        contents = reader.get_content()
         self._set_contents_into_text_area(contents)
+        self._set_status("Quotation loaded")
+
+    def _on_quotation_error(self, error: BaseException) -> None:
+        logger.warning(f"failed to get values from quotation pdf: {error}")
+        self._set_status("Failed to read quotation")
 
     def _set_fields_into_label_entries(self, fields: Dict[Field, str]) -> None:
         for field, value in fields.items():
             self.app.setEntry(self._LABEL_ENTRIES[field], value)
 
     def _set_contents_into_text_area(self, contents: List[Content]) -> None:
-        content_text = ""
-        for title, descriptions in contents:
-            content_text = self._update_content_text(content_text, title, descriptions)
-            content_text += "\n"
+        content_text = self._content_model.set_contents(contents)
+        self._reset_text_area(self._CONTENT_TEXT_AREA_ID, call_function=False)
         self.app.setTextArea(self._CONTENT_TEXT_AREA_ID, content_text)
 
-    def _update_content_text(
-        self, content_text: str, title: str, descriptions: List[str]
-    ) -> str:
-        content_text = self._update_content_text_with_title_line(content_text, title)
-        content_text = self._update_content_text_with_descriptions(
-            content_text, descriptions
-        )
-        return content_text
-
-    def _update_content_text_with_title_line(
-        self, content_text: str, title: str
-    ) -> str:
-        content_text += f"{self._TITLE_LINE}{title} \n"
-        content_text += self._DESCRIPTION_START_LINE
-        return content_text
-
-    def _update_content_text_with_descriptions(
-        self, content_text: str, descriptions: List[str]
-    ) -> str:
-        for description_line in descriptions:
-            content_text += f"{description_line} \n"
-        content_text += f"\n{self._DESCRIPTION_END_BLOCK}\n"
-        return content_text
-
-    def _update_fields(self):
-        contents = self._get_content_from_text_area()
-        self._set_output_filename()
-        self._update_email_text_area(contents)
+    def _update_fields(self, changed_widget_ids: Optional[Collection[str]] = None):
+        """Rebuilds only what depends on the changed widgets, everything if None"""
+        if changed_widget_ids is None:
+            contents_changed = True
+            changed_fields = set(Field)
+        else:
+            contents_changed = self._CONTENT_TEXT_AREA_ID in changed_widget_ids
+            changed_fields = {
+                field
+                for field in Field
+                if self._LABEL_ENTRIES[field] in changed_widget_ids
+            }
+
+        if contents_changed:
+            self._update_content_model()
+        # the model may also have been updated by a save since the last preview
+        contents_changed = self._content_model.version != self._email_content_version
+        if changed_fields.intersection(self._FILENAME_FIELDS):
+            self._set_output_filename()
+        if contents_changed or changed_fields:
+            self._update_email_text_area(
+                self._content_model.contents,
+                subject_changed=bool(
+                    changed_fields.intersection(self._EMAIL_SUBJECT_FIELDS)
+                ),
+                contents_changed=contents_changed,
+            )
+            self._email_content_version = self._content_model.version
 
     def _set_output_filename(self):
         output_filename = self._generate_output_filename_from_fields()
-        self.app.setEntry(self._LABEL_ENTRIES["output_filename"], output_filename)
+        self.app.setEntry(
+            self._LABEL_ENTRIES["output_filename"], output_filename, callFunction=False
+        )
 
     def _generate_output_filename_from_fields(self):
-        client_name = self._get_entry(Field.CLIENT_NAME)
-        job_number = self._get_entry(Field.JOB_NUM)
-        quotation_number = self._get_entry(Field.QUOTATION_NUM)
-        return f"ACK-JN{job_number}-{quotation_number}-{client_name}".replace(" ", "_")
+        filename_fields = (Field.CLIENT_NAME, Field.JOB_NUM, Field.QUOTATION_NUM)
+        return generate_output_filename(
+            {field: self._get_entry(field) for field in filename_fields}
+        )
 
     def _save_file(self, button):
+        self._update_debouncer.flush()
         if not self._check_entries_not_empty():
             return
-        self._generate_acknowledgement()
         excel_filepath = self._get_excel_filepath()
         if excel_filepath is not None:
-            self.writer.save_workbook("", filename=excel_filepath)
+            self._generate_in_background(
+                lambda writer: writer.save_workbook("", filename=excel_filepath),
+                excel_filepath,
+            )
 
     def _save_as_pdf(self, button):
+        self._update_debouncer.flush()
         if not self._check_entries_not_empty():
             return
-        self._generate_acknowledgement()
         pdf_filepath = self._get_pdf_filepath()
         if pdf_filepath is not None:
-            self.writer.export_as_pdf("", filename=pdf_filepath)
+            self._generate_in_background(
+                lambda writer: writer.export_as_pdf("", filename=pdf_filepath),
+                pdf_filepath,
+            )
+
+    def _generate_in_background(
+        self, save: Callable[[ExcelWriter], None], output_filepath: str
+    ) -> None:
+        # widgets are read here on the UI thread, the worker only gets values
+        fields = {field: self._get_entry(field) for field in Field}
+        contents = self._get_content_from_text_area()
+        self._save_task = self._runner.submit(
+            lambda context: self._generate_and_save(
+                context, fields, contents, save, output_filepath
+            ),
+            on_done=self._on_saved,
+            on_error=self._on_save_error,
+            on_progress=self._set_status,
+        )
+
+    def _generate_and_save(
+        self,
+        context: TaskContext,
+        fields: Dict[Field, str],
+        contents: List[Content],
+        save: Callable[[ExcelWriter], None],
+        output_filepath: str,
+    ) -> Tuple[ExcelWriter, str]:
+        context.report_progress("Generating acknowledgement form")
+        writer = self._generate_acknowledgement(fields, contents)
+        # a save that started is completed, cancelling only stops it before
+        context.report_final_step(f"Saving {os.path.basename(output_filepath)}")
+        save(writer)
+        return writer, output_filepath
+
+    def _on_saved(self, saved: Tuple[ExcelWriter, str]) -> None:
+        self.writer, output_filepath = saved
+        self._set_status(f"Saved {output_filepath}")
+
+    def _on_save_error(self, error: BaseException) -> None:
+        logger.error(f"failed to save acknowledgement form: {error}")
+        self._set_status("Failed to save acknowledgement form")
+
+    def _cancel_tasks(self, button=None) -> None:
+        for task in (self._quotation_task, self._save_task):
+            if task is not None and not task.done and task.cancel():
+                self._set_status("Cancelled")
+
+    def _stop(self) -> bool:
+        self._cancel_tasks()
+        self._runner.shutdown()
+        return True
 
     def _check_entries_not_empty(self) -> bool:
         if missing_entries := [
@@ -192,82 +314,45 @@ class AcknowledgementFormGeneratorGUI:
             message=f"Entries are missing: \n\n{missing_entries_str}",
         )
 
-    def _load_writer(self):
-        self.writer = load_template()
-
-    def _generate_acknowledgement(self) -> bool:
-        self._load_writer()
-        self._update_writer_with_gui_contents()
-        return True
+    def _preload_template(self) -> None:
+        # queued first on the single worker, so saves always find it loaded
+        self._runner.submit(
+            lambda context: self._get_template_renderer(),
+            on_done=lambda renderer: logger.info("acknowledgement template loaded"),
+            on_error=lambda error: logger.warning(
+                f"failed to preload acknowledgement template: {error}"
+            ),
+        )
 
-    def _update_writer_with_gui_contents(self):
-        for field in Field:
-            field_value = self._get_entry(field)
-            self._set_field_value(field, field_value)
-        self._set_contents()
+    def _get_template_renderer(self) -> BatchTemplateRenderer:
+        """runs on the worker thread, the template is only parsed once"""
+        if self._template_renderer is None:
+            self._template_renderer = BatchTemplateRenderer()
+        return self._template_renderer
+
+    def _generate_acknowledgement(
+        self, fields: Dict[Field, str], contents: List[Content]
+    ) -> ExcelWriter:
+        """runs on the worker thread, the last form is reused if its fields and
+        contents did not change, e.g. for Save followed by Save As PDF"""
+        form_key = (
+            tuple(fields.items()),
+            tuple((title, tuple(descriptions)) for title, descriptions in contents),
+        )
+        if self._rendered_form is not None and self._rendered_form[0] == form_key:
+            return self._rendered_form[1]
+        writer = self._get_template_renderer().render(fields, contents)
+        self._rendered_form = (form_key, writer)
+        return writer
 
     def _get_content_from_text_area(self) -> List[Content]:
-        contents = []
-        contents = str(self.app.getTextArea(self._CONTENT_TEXT_AREA_ID))
-        content_lines = contents.split("\n")
-        titles = [
-            line[len(self._TITLE_LINE) :]
-            for line in content_lines
-            if line.startswith(self._TITLE_LINE)
-        ]
-        descriptions = self._parse_descriptions_from_lines(content_lines)
-        return [
-            Content(title, description)
-            for title, description in zip(titles, descriptions)
-        ]
-
-    def _parse_descriptions_from_lines(
-        self, content_lines: List[str]
-    ) -> List[List[str]]:
-        description_lines = self._extract_description_lines(content_lines)
-
-        descriptions: List[List[str]] = []
-        description_line_indexes: List[int] = []
-
-        for line_index, line in enumerate(description_lines):
-            if self._is_description_start_line(line):
-                continue
-            if self._is_end_of_description_block(line):
-                descriptions.append(
-                    self._get_description_lines(
-                        description_lines, description_line_indexes
-                    )
-                )
-                description_line_indexes.clear()
-                continue
-            description_line_indexes.append(line_index)
-
-        return descriptions
+        self._update_content_model()
+        return self._content_model.contents
 
-    def _is_end_of_description_block(self, line: str) -> bool:
-        return line == self._DESCRIPTION_END_BLOCK
-
-    def _extract_description_lines(self, content_lines: List[str]) -> List[str]:
-        return [line for line in content_lines if not line.startswith(self._TITLE_LINE)]
-
-    def _is_description_start_line(self, line: str) -> bool:
-        return line.startswith("Description:")
-
-    def _get_description_lines(
-        self, content_lines: List[str], description_line_indexes: List[int]
-    ) -> List[str]:
-        return [
-            content_lines[index]
-            for index in description_line_indexes
-            if content_lines[index].strip()
-        ]
-
-    def _set_field_value(self, field: Field, value_to_set: str):
-        self.writer = set_field_value(self.writer, field, value_to_set)
-
-    def _set_contents(self):
-        contents = self._get_content_from_text_area()
-        self.writer = set_content(self.writer, contents)
+    def _update_content_model(self) -> bool:
+        """Returns whether the contents changed since the last update"""
+        content_text = str(self.app.getTextArea(self._CONTENT_TEXT_AREA_ID))
+        return self._content_model.update(content_text)
 
     def _get_excel_filepath(self) -> Optional[str]:
         return self._get_filepath(("Excel", "*.xlsx"))
@@ -304,16 +389,32 @@ class AcknowledgementFormGeneratorGUI:
             return str(self.app.getEntry(self._LABEL_ENTRIES[entry_id]))
         return str(self.app.getEntry(entry_id))
 
-    def _update_email_text_area(self, contents: List[Content]) -> None:
-        self._reset_email_text_area()
-
+    def _update_email_text_area(
+        self,
+        contents: List[Content],
+        subject_changed: bool = True,
+        contents_changed: bool = True,
+    ) -> None:
+        """the subject and content lines of the previous update are reused when
+        their inputs did not change"""
         email_generator = self._instantiate_email_generator(contents)
 
-        subject = email_generator.create_email_subject()
-        body = email_generator.create_email_body()
+        if subject_changed or not self._email_subject:
+            self._email_subject = email_generator.create_email_subject()
+            self._replace_text_area(
+                self._EMAIL_SUBJECT_TEXT_AREA_ID, self._email_subject
+            )
+        if contents_changed:
+            self._email_content_lines = email_generator.create_lines_from_contents()
 
-        self.app.setTextArea(self._EMAIL_SUBJECT_TEXT_AREA_ID, subject)
-        self.app.setTextArea(self._EMAIL_BODY_TEXT_AREA_ID, body)
+        body = email_generator.create_email_body(
+            subject=self._email_subject, content_lines=self._email_content_lines
+        )
+        self._replace_text_area(self._EMAIL_BODY_TEXT_AREA_ID, body)
+
+    def _replace_text_area(self, text_area_id: str, text: str) -> None:
+        self._reset_text_area(text_area_id)
+        self.app.setTextArea(text_area_id, text, callFunction=False)
 
     def _instantiate_email_generator(
         self, contents: List[Content]
@@ -331,9 +432,5 @@ class AcknowledgementFormGeneratorGUI:
             drawing_number=entry_value_map[Field.DRAWING_NUM],
         )
 
-    def _reset_email_text_area(self) -> None:
-        self._reset_text_area(self._EMAIL_SUBJECT_TEXT_AREA_ID)
-        self._reset_text_area(self._EMAIL_BODY_TEXT_AREA_ID)
-
-    def _reset_text_area(self, text_area_id: str) -> None:
-        self.app.clearTextArea(text_area_id)
+    def _reset_text_area(self, text_area_id: str, call_function: bool = True) -> None:
+        self.app.clearTextArea(text_area_id, callFunction=call_function)
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Tuple
+
+from openpyxl.utils import column_index_from_string, get_column_letter
+from openpyxl.worksheet.worksheet import Worksheet
+
+if TYPE_CHECKING:
+    from excel_writer.writer import CellRange
+
+
+class RangeDimensions(NamedTuple):
+    """Row heights and column widths explicitly set within a cell range"""
+
+    cell_range: CellRange
+    row_heights: Dict[int, Optional[float]]
+    column_widths: Dict[int, float]
+
+
+def snapshot_range_dimensions(
+    worksheet: Worksheet, cell_range: CellRange
+) -> RangeDimensions:
+    """Only rows and columns with a dimension entry are read, rows and columns
+    left at the sheet default are skipped"""
+    row_heights = {
+        row: row_dimension.height
+        for row, row_dimension in worksheet.row_dimensions.items()
+        if cell_range.start_row <= row <= cell_range.end_row
+    }
+    column_widths = {}
+    for column_letter, column_dimension in worksheet.column_dimensions.items():
+        column = column_index_from_string(column_letter)
+        if cell_range.start_column <= column <= cell_range.end_column:
+            column_widths[column] = column_dimension.width
+    return RangeDimensions(cell_range, row_heights, column_widths)
+
+
+def reset_range_dimensions(
+    worksheet: Worksheet,
+    dimensions: RangeDimensions,
+    default_row_height: float,
+    default_column_width: float,
+) -> None:
+    for row in dimensions.row_heights:
+        worksheet.row_dimensions[row].height = default_row_height  # type: ignore
+    for column in dimensions.column_widths:
+        column_letter = get_column_letter(column)
+        worksheet.column_dimensions[column_letter].width = default_column_width
+
+
+def restore_range_dimensions(
+    worksheet: Worksheet,
+    dimensions: RangeDimensions,
+    default_row_height: float,
+    default_column_width: float,
+    rows_moved: int = 0,
+    columns_moved: int = 0,
+) -> None:
+    """Sets the snapshot dimensions at the moved range, rows and columns of the
+    moved range without a snapshot dimension are reset to the defaults, like the
+    rows and columns the range moved away from"""
+    new_range = dimensions.cell_range.move_range(rows_moved, columns_moved)
+    row_heights: Dict[int, Optional[float]] = {
+        row: default_row_height
+        for row in worksheet.row_dimensions
+        if new_range.start_row <= row <= new_range.end_row
+    }
+    row_heights.update(
+        (row + rows_moved, height) for row, height in dimensions.row_heights.items()
+    )
+    for row, height in row_heights.items():
+        worksheet.row_dimensions[row].height = height  # type: ignore
+
+    column_widths = {
+        column: default_column_width
+        for column in map(column_index_from_string, worksheet.column_dimensions)
+        if new_range.start_column <= column <= new_range.end_column
+    }
+    column_widths.update(
+        (column + columns_moved, width)
+        for column, width in dimensions.column_widths.items()
+    )
+    for column, width in column_widths.items():
+        worksheet.column_dimensions[get_column_letter(column)].width = width
+
+
+def move_range_dimensions(
+    worksheet: Worksheet,
+    cell_range: CellRange,
+    rows_to_move: int,
+    columns_to_move: int,
+    default_row_height: float,
+    default_column_width: float,
+) -> None:
+    dimensions = snapshot_range_dimensions(worksheet, cell_range)
+    reset_range_dimensions(
+        worksheet, dimensions, default_row_height, default_column_width
+    )
+    restore_range_dimensions(
+        worksheet,
+        dimensions,
+        default_row_height,
+        default_column_width,
+        rows_moved=rows_to_move,
+        columns_moved=columns_to_move,
+    )
+
+
+class DimensionMovePlan:
+    """Records dimension moves of cell ranges, moving a range that was already
+    moved extends the earlier move so only the net relocation is applied"""
+
+    def __init__(self) -> None:
+        # current position of a moved range -> (original range, rows, columns)
+        self._moves: Dict[CellRange, Tuple[CellRange, int, int]] = {}
+
+    def add(
+        self, cell_range: CellRange, rows_to_move: int = 0, columns_to_move: int = 0
+    ) -> None:
+        original_range, rows_moved, columns_moved = self._moves.pop(
+            cell_range, (cell_range, 0, 0)
+        )
+        new_range = cell_range.move_range(rows_to_move, columns_to_move)
+        self._moves[new_range] = (
+            original_range,
+            rows_moved + rows_to_move,
+            columns_moved + columns_to_move,
+        )
+
+    @property
+    def moves(self) -> List[Tuple[CellRange, int, int]]:
+        """net moves as (original range, rows, columns), cancelled moves dropped"""
+        return [
+            (original_range, rows_moved, columns_moved)
+            for original_range, rows_moved, columns_moved in self._moves.values()
+            if rows_moved or columns_moved
+        ]
@@ -0,0 +1,58 @@
+from typing import Any, Hashable, Iterator, List, Tuple
+
+import numpy as np
+import pandas as pd
+from openpyxl.utils import get_column_letter
+
+
+def frame_rows(frame: pd.DataFrame) -> Iterator[Tuple[Any, ...]]:
+    """Rows of the frame as python values openpyxl can write, missing values
+    are None"""
+    columns = [_column_values(frame.iloc[:, index]) for index in range(frame.shape[1])]
+    return zip(*columns)
+
+
+def frame_header(frame: pd.DataFrame) -> List[str]:
+    return [_column_name(column) for column in frame.columns]
+
+
+def values_to_frame(
+    values: np.ndarray, header: bool = True, first_column: int = 1
+) -> pd.DataFrame:
+    """Frame of a 2-D object array of cell values, the first row names the
+    columns when header is set, otherwise the column letters do. Column dtypes
+    are inferred, numbers with empty cells become floats with NaN"""
+    column_letters = [
+        get_column_letter(column)
+        for column in range(first_column, first_column + values.shape[1])
+    ]
+    if header and len(values):
+        columns = [
+            column_letter if name is None else _column_name(name)
+            for column_letter, name in zip(column_letters, values[0])
+        ]
+        values = values[1:]
+    else:
+        columns = column_letters
+    return pd.DataFrame(values, columns=columns).infer_objects()
+
+
+def _column_values(column: pd.Series) -> List[Any]:
+    if isinstance(column.dtype, pd.DatetimeTZDtype):
+        # Excel has no time zones, the wall time is written
+        column = column.dt.tz_localize(None)
+    if pd.api.types.is_datetime64_dtype(column.dtype):
+        values = np.array(column.dt.to_pydatetime(), dtype=object)
+    elif pd.api.types.is_timedelta64_dtype(column.dtype):
+        values = np.array(column.dt.to_pytimedelta(), dtype=object)
+    else:
+        # numpy scalars become python ints, floats and bools
+        values = column.to_numpy(dtype=object)
+    values[column.isna().to_numpy()] = None
+    return values.tolist()
+
+
+def _column_name(name: Hashable) -> str:
+    if isinstance(name, tuple):
+        return " ".join(str(level) for level in name)
+    return str(name)
@@ -0,0 +1,123 @@
+import json
+import os
+from typing import Any, Generic, Optional, Tuple, TypeVar
+
+from loguru import logger
+
+T = TypeVar("T")
+
+
+class JsonFileCache(Generic[T]):
+    """On-disk cache of one JSON file per key, subclasses convert their values
+    to and from JSON, the least recently used entries are evicted once the
+    entries take up more than max_bytes, if given
+
+    The cache never fails its caller, entries that cannot be read are misses and
+    entries that cannot be written are skipped, a cache directory that cannot be
+    created disables the cache.
+    """
+
+    def __init__(
+        self,
+        cache_directory: str,
+        max_bytes: Optional[int] = None,
+        description: str = "cache",
+    ):
+        """description names the cache in the logged warnings"""
+        self._cache_directory = cache_directory
+        self._max_bytes = max_bytes
+        self._description = description
+        self.enabled = True
+        try:
+            os.makedirs(cache_directory, exist_ok=True)
+        except OSError as exc:
+            logger.warning(f"{description} disabled: {exc}")
+            self.enabled = False
+
+    def load(self, key: str) -> Optional[T]:
+        if not self.enabled:
+            return None
+        entry_filepath = self._get_entry_filepath(key)
+        try:
+            with open(entry_filepath, "r", encoding="utf-8") as entry_file:
+                entry = json.load(entry_file)
+            value = self._deserialize(entry)
+        except FileNotFoundError:
+            return None
+        except OSError as exc:
+            logger.warning(f"could not read {self._description} entry {key}: {exc}")
+            return None
+        except (ValueError, KeyError, TypeError):
+            logger.warning(f"discarding unreadable {self._description} entry {key}")
+            self._remove_entry(entry_filepath)
+            return None
+        self._mark_used(entry_filepath)
+        return value
+
+    def store(self, key: str, value: T) -> None:
+        if not self.enabled:
+            return
+        entry_filepath = self._get_entry_filepath(key)
+        temporary_filepath = f"{entry_filepath}.{os.getpid()}.tmp"
+        try:
+            with open(temporary_filepath, "w", encoding="utf-8") as entry_file:
+                json.dump(self._serialize(value), entry_file)
+            os.replace(temporary_filepath, entry_filepath)
+        except OSError as exc:
+            logger.warning(f"could not write {self._description} entry {key}: {exc}")
+            self._remove_entry(temporary_filepath)
+            return
+        if self._max_bytes is not None:
+            self._evict_least_recently_used(self._max_bytes)
+
+    def _serialize(self, value: T, /) -> Any:
+        """Returns value as JSON serializable data"""
+        raise NotImplementedError
+
+    def _deserialize(self, entry: Any, /) -> T:
+        """Returns the value of the JSON data, raises ValueError, KeyError or
+        TypeError if it is not a valid entry"""
+        raise NotImplementedError
+
+    def _mark_used(self, entry_filepath: str) -> None:
+        # mtime is bumped on every hit as atime is often disabled
+        try:
+            os.utime(entry_filepath)
+        except OSError:
+            pass
+
+    def _evict_least_recently_used(self, max_bytes: int) -> None:
+        try:
+            entries = sorted(
+                self._get_last_used_time_and_size(entry)
+                for entry in os.scandir(self._cache_directory)
+                if entry.name.endswith(".json")
+            )
+        except OSError as exc:
+            logger.warning(f"could not list the {self._description}: {exc}")
+            return
+        excess_bytes = sum(size for _, size, _ in entries) - max_bytes
+        for _, size, entry_filepath in entries:
+            if excess_bytes <= 0:
+                break
+            self._remove_entry(entry_filepath)
+            excess_bytes -= size
+
+    def _get_last_used_time_and_size(
+        self, entry: os.DirEntry
+    ) -> Tuple[float, int, str]:
+        try:
+            entry_stat = entry.stat()
+        except OSError:
+            # the entry was removed in the meantime
+            return 0.0, 0, entry.path
+        return entry_stat.st_mtime, entry_stat.st_size, entry.path
+
+    def _remove_entry(self, entry_filepath: str) -> None:
+        try:
+            os.remove(entry_filepath)
+        except OSError:
+            pass
+
+    def _get_entry_filepath(self, key: str) -> str:
+        return os.path.join(self._cache_directory, f"{key}.json")
@@ -0,0 +1,485 @@
+import hashlib
+import os
+import posixpath
+import re
+from typing import Dict, List, Mapping, NamedTuple, Optional, Tuple, Union
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape, quoteattr
+from zipfile import ZIP_DEFLATED, ZipFile
+
+from openpyxl.utils.cell import column_index_from_string, coordinate_to_tuple
+
+_MAIN_NAMESPACE = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_RELATIONSHIPS_NAMESPACE = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+)
+_OFFICE_DOCUMENT_TYPE = f"{_RELATIONSHIPS_NAMESPACE}/officeDocument"
+_WORKSHEET_TYPE = f"{_RELATIONSHIPS_NAMESPACE}/worksheet"
+_WORKSHEET_CONTENT_TYPE = (
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"
+)
+_CONTENT_TYPES_PART = "[Content_Types].xml"
+_PACKAGE_RELATIONSHIPS_PART = "_rels/.rels"
+_SHARED_STRINGS_TYPE = f"{_RELATIONSHIPS_NAMESPACE}/sharedStrings"
+
+_LOCAL_SHEET_ID_PATTERN = re.compile(rb'localSheetId="(\d+)"')
+_WORKBOOK_VIEW_SHEET_PATTERN = re.compile(rb'\s(?:activeTab|firstSheet)="\d+"')
+_TAB_SELECTED_PATTERN = re.compile(rb'\stabSelected="[^"]*"')
+_DEFINED_NAME_PATTERN = re.compile(rb"<definedName\b[^>]*>.*?</definedName>", re.S)
+_SHARED_STRING_CELL_PATTERN = re.compile(
+    rb'(<c\b[^>]*?\st="s"[^>]*>)\s*<v>\s*(\d+)\s*</v>'
+)
+_CALC_PROPERTIES_PATTERN = re.compile(rb"<calcPr\b[^>]*?(?=/?>)")
+_FULL_CALC_ON_LOAD_PATTERN = re.compile(rb'\sfullCalcOnLoad="[^"]*"')
+_ROW_PATTERN = re.compile(rb'<row\b[^>]*?\sr="(\d+)"[^>]*?(?:/>|>.*?</row>)', re.S)
+_CELL_PATTERN = re.compile(
+    rb'<c\b[^>]*?\sr="([A-Z]+)(\d+)"[^>]*?(?:/>|>.*?</c>)', re.S
+)
+_STYLE_ATTRIBUTE_PATTERN = re.compile(rb'^<c\b[^>]*?(\ss="\d+")')
+# parts linked from a sheet, such as drawings, comments and tables, belong to
+# that one sheet so a copy of the sheet leaves them out
+_LINKED_PART_ELEMENT_PATTERN = re.compile(
+    rb"<(drawing|legacyDrawing|legacyDrawingHF|picture)\b[^>]*/>"
+    rb"|<(tableParts|controls|oleObjects)\b(?:[^>]*/>|.*?</\2>)",
+    re.S,
+)
+
+
+class _WorkbookParts(NamedTuple):
+    workbook_part: str
+    relationships_part: str
+    sheet_names: List[str]
+    sheet_ids: List[int]
+    # part of each sheet, in tab order
+    sheet_parts: List[str]
+    relationship_ids: List[str]
+    worksheet_parts: List[str]
+    shared_strings_part: Optional[str]
+
+
+def read_sheet_names(filepath: str) -> List[str]:
+    """Sheet names of an xlsx file in tab order, without parsing any sheet"""
+    with ZipFile(filepath) as archive:
+        return _read_workbook_parts(archive).sheet_names
+
+
+def read_sheet_fingerprints(filepath: str) -> Dict[str, str]:
+    """Hash of the cells of each sheet, by sheet name, view changes such as the
+    selected tab keep the fingerprint. Shared strings are hashed as the text
+    they resolve to, so sheets with the same cells have the same fingerprint in
+    any workbook and renaming a label always changes it."""
+    with ZipFile(filepath) as archive:
+        parts = _read_workbook_parts(archive)
+        shared_strings: Optional[List[bytes]] = None
+        fingerprints = {}
+        for sheet_name, sheet_part in zip(parts.sheet_names, parts.sheet_parts):
+            sheet_data = _sheet_data(archive.read(sheet_part))
+            if shared_strings is None and b't="s"' in sheet_data:
+                shared_strings = _read_shared_strings(archive, parts)
+            if shared_strings:
+                sheet_data = _resolve_shared_strings(sheet_data, shared_strings)
+            fingerprints[sheet_name] = hashlib.sha256(sheet_data).hexdigest()
+        return fingerprints
+
+
+def _read_shared_strings(archive: ZipFile, parts: _WorkbookParts) -> List[bytes]:
+    """Text of each shared string, escaped again so it can stand in for the
+    string index in the sheet data"""
+    if parts.shared_strings_part is None:
+        return []
+    shared_strings = ElementTree.fromstring(archive.read(parts.shared_strings_part))
+    text_tag = f"{{{_MAIN_NAMESPACE}}}t"
+    phonetic_tag = f"{{{_MAIN_NAMESPACE}}}rPh"
+    strings = []
+    for string_item in shared_strings.iter(f"{{{_MAIN_NAMESPACE}}}si"):
+        # rich text keeps its text in runs, phonetic hints are not cell text
+        text = "".join(
+            text_element.text or ""
+            for child in string_item
+            if child.tag != phonetic_tag
+            for text_element in child.iter(text_tag)
+        )
+        strings.append(escape(text).encode())
+    return strings
+
+
+def _resolve_shared_strings(sheet_data: bytes, shared_strings: List[bytes]) -> bytes:
+    def resolve(match: "re.Match[bytes]") -> bytes:
+        index = int(match.group(2))
+        if index >= len(shared_strings):
+            return match.group(0)
+        return match.group(1) + b"<is>" + shared_strings[index] + b"</is>"
+
+    return _SHARED_STRING_CELL_PATTERN.sub(resolve, sheet_data)
+
+
+def _sheet_data(worksheet: bytes) -> bytes:
+    start_index = worksheet.find(b"<sheetData")
+    end_index = worksheet.rfind(b"</sheetData>")
+    if start_index < 0:
+        return b""
+    if end_index < 0:
+        # an empty sheet has a self closing sheetData element
+        return worksheet[start_index : worksheet.index(b">", start_index) + 1]
+    return worksheet[start_index:end_index]
+
+
+def insert_sheet(
+    filepath: str,
+    sheet_name: str,
+    values: Mapping[str, str],
+    output_filepath: str = "",
+    template_sheet: Optional[str] = None,
+) -> None:
+    """Adds a sheet holding values, by cell notation, as the first and active tab
+    of an xlsx file, every other part of the file is copied over unparsed apart
+    from the tab selection cleared from the other sheets
+
+    template_sheet names a sheet the new sheet starts as a copy of, with its
+    values, values are written over its cells. The copy keeps and leaves out the
+    same as ExcelWriter.clone_sheet. output_filepath defaults to replacing the
+    file.
+    """
+    output_filepath = output_filepath or filepath
+    temporary_filepath = f"{output_filepath}.tmp"
+    try:
+        with ZipFile(filepath) as archive, ZipFile(
+            temporary_filepath, "w"
+        ) as output_archive:
+            parts = _read_workbook_parts(archive)
+            replaced_parts = _insert_sheet_parts(
+                archive, parts, sheet_name, values, template_sheet
+            )
+            worksheet_parts = set(parts.worksheet_parts)
+            for info in archive.infolist():
+                data = replaced_parts.pop(info.filename, None)
+                if data is None:
+                    data = archive.read(info.filename)
+                if info.filename in worksheet_parts:
+                    # only the new sheet is selected, selecting several tabs
+                    # groups them
+                    data = _TAB_SELECTED_PATTERN.sub(b"", data)
+                output_archive.writestr(info, data, compress_type=info.compress_type)
+            for part_name, data in replaced_parts.items():
+                output_archive.writestr(part_name, data, compress_type=ZIP_DEFLATED)
+        os.replace(temporary_filepath, output_filepath)
+    finally:
+        if os.path.exists(temporary_filepath):
+            os.remove(temporary_filepath)
+
+
+def _insert_sheet_parts(
+    archive: ZipFile,
+    parts: _WorkbookParts,
+    sheet_name: str,
+    values: Mapping[str, str],
+    template_sheet: Optional[str] = None,
+) -> Dict[str, bytes]:
+    """Returns the changed and added parts of the package"""
+    if sheet_name in parts.sheet_names:
+        raise ValueError(f"sheet {sheet_name!r} already exists")
+    if template_sheet is not None and template_sheet not in parts.sheet_names:
+        raise ValueError(f"template sheet {template_sheet!r} not found")
+
+    workbook_directory = posixpath.dirname(parts.workbook_part)
+    sheet_part = _unused_part_name(
+        archive, posixpath.join(workbook_directory, "worksheets", "sheet{}.xml")
+    )
+    relationship_id = _unused_relationship_id(parts.relationship_ids)
+    sheet_id = max(parts.sheet_ids, default=0) + 1
+
+    workbook = archive.read(parts.workbook_part)
+    template_defined_names: List[bytes] = []
+    if template_sheet is None:
+        worksheet = _worksheet_xml(values)
+    else:
+        template_index = parts.sheet_names.index(template_sheet)
+        worksheet = _clone_worksheet_xml(
+            archive.read(parts.sheet_parts[template_index]), values
+        )
+        template_defined_names = _clone_print_defined_names(
+            workbook, template_index, template_sheet, sheet_name
+        )
+        workbook = _set_full_calculation_on_load(workbook)
+    relationships_prefix = _namespace_prefix(workbook, _RELATIONSHIPS_NAMESPACE)
+    sheet_element = (
+        f"<sheet name={quoteattr(sheet_name)} sheetId={quoteattr(str(sheet_id))}"
+        f" {relationships_prefix}:id={quoteattr(relationship_id)}/>"
+    )
+    workbook = _insert_after_start_tag(workbook, b"sheets", sheet_element.encode())
+    # sheet scoped names refer to sheets by position, which all move up by one
+    workbook = _LOCAL_SHEET_ID_PATTERN.sub(
+        lambda match: b'localSheetId="%d"' % (int(match.group(1)) + 1), workbook
+    )
+    if template_defined_names:
+        workbook = _insert_after_start_tag(
+            workbook, b"definedNames", b"".join(template_defined_names)
+        )
+    # the default active and first visible tab is the new first sheet
+    workbook = _WORKBOOK_VIEW_SHEET_PATTERN.sub(b"", workbook)
+
+    relationship_element = (
+        f"<Relationship Id={quoteattr(relationship_id)}"
+        f" Type={quoteattr(_WORKSHEET_TYPE)}"
+        f" Target={quoteattr(posixpath.relpath(sheet_part, workbook_directory))}/>"
+    )
+    content_type_element = (
+        f"<Override PartName={quoteattr('/' + sheet_part)}"
+        f" ContentType={quoteattr(_WORKSHEET_CONTENT_TYPE)}/>"
+    )
+
+    return {
+        parts.workbook_part: workbook,
+        parts.relationships_part: _insert_before_end_tag(
+            archive.read(parts.relationships_part),
+            b"Relationships",
+            relationship_element.encode(),
+        ),
+        _CONTENT_TYPES_PART: _insert_before_end_tag(
+            archive.read(_CONTENT_TYPES_PART), b"Types", content_type_element.encode()
+        ),
+        sheet_part: worksheet,
+    }
+
+
+def _clone_worksheet_xml(template: bytes, values: Mapping[str, str]) -> bytes:
+    # the copy becomes the only selected tab, whatever the template's selection
+    worksheet = _TAB_SELECTED_PATTERN.sub(b"", template)
+    worksheet = re.sub(rb"<sheetView\b", b'<sheetView tabSelected="1"', worksheet, 1)
+    worksheet = _LINKED_PART_ELEMENT_PATTERN.sub(b"", worksheet)
+    if b"<hyperlink" in worksheet or b"<pageSetup" in worksheet:
+        relationships_prefix = _namespace_prefix(worksheet, _RELATIONSHIPS_NAMESPACE)
+        relationship_attribute = (
+            rb"\s" + relationships_prefix.encode() + rb':id="[^"]*"'
+        )
+        # external hyperlinks and printer settings are linked parts as well
+        worksheet = re.sub(
+            rb"<hyperlink\b[^>]*" + relationship_attribute + rb"[^>]*/>", b"", worksheet
+        )
+        worksheet = re.sub(rb"<hyperlinks>\s*</hyperlinks>", b"", worksheet)
+        worksheet = re.sub(
+            rb"(<pageSetup\b[^>]*?)" + relationship_attribute, rb"\1", worksheet
+        )
+    for cell_notation, value in values.items():
+        worksheet = _set_cell_value(worksheet, cell_notation, value)
+    return worksheet
+
+
+def _set_cell_value(worksheet: bytes, cell_notation: str, value: str) -> bytes:
+    """Replaces the value of a cell with an inline string, keeping its style"""
+    row, column = coordinate_to_tuple(cell_notation)
+    for row_match in _ROW_PATTERN.finditer(worksheet):
+        row_number = int(row_match.group(1))
+        if row_number < row:
+            continue
+        if row_number > row:
+            new_row = (
+                f'<row r="{row}">{_inline_string_cell(cell_notation, value)}</row>'
+            )
+            return _splice(worksheet, row_match.start(), row_match.start(), new_row)
+        return _splice(
+            worksheet,
+            row_match.start(),
+            row_match.end(),
+            _set_row_cell_value(row_match.group(0), column, cell_notation, value),
+        )
+    new_row = f'<row r="{row}">{_inline_string_cell(cell_notation, value)}</row>'
+    if b"<sheetData/>" in worksheet:
+        return worksheet.replace(
+            b"<sheetData/>", f"<sheetData>{new_row}</sheetData>".encode(), 1
+        )
+    return _insert_before_end_tag(worksheet, b"sheetData", new_row.encode())
+
+
+def _set_row_cell_value(
+    row_xml: bytes, column: int, cell_notation: str, value: str
+) -> bytes:
+    if row_xml.endswith(b"/>"):
+        row_xml = row_xml[:-2] + b"></row>"
+    for cell_match in _CELL_PATTERN.finditer(row_xml):
+        cell_column = column_index_from_string(cell_match.group(1).decode())
+        if cell_column < column:
+            continue
+        if cell_column > column:
+            new_cell = _inline_string_cell(cell_notation, value)
+            return _splice(row_xml, cell_match.start(), cell_match.start(), new_cell)
+        style_match = _STYLE_ATTRIBUTE_PATTERN.match(cell_match.group(0))
+        style = style_match.group(1).decode() if style_match else ""
+        new_cell = _inline_string_cell(cell_notation, value, style)
+        return _splice(row_xml, cell_match.start(), cell_match.end(), new_cell)
+    return _insert_before_end_tag(
+        row_xml, b"row", _inline_string_cell(cell_notation, value).encode()
+    )
+
+
+def _inline_string_cell(cell_notation: str, value: str, style: str = "") -> str:
+    return (
+        f'<c r="{cell_notation}"{style} t="inlineStr">'
+        f"<is><t>{escape(value)}</t></is></c>"
+    )
+
+
+def _splice(xml: bytes, start: int, end: int, replacement: Union[str, bytes]) -> bytes:
+    if isinstance(replacement, str):
+        replacement = replacement.encode()
+    return xml[:start] + replacement + xml[end:]
+
+
+def _clone_print_defined_names(
+    workbook: bytes, template_index: int, template_sheet: str, sheet_name: str
+) -> List[bytes]:
+    """Print area and titles of the template sheet for the new first sheet"""
+    template_references = [
+        f"{escape(_quote_sheet_name(template_sheet))}!".encode(),
+        f"{escape(template_sheet)}!".encode(),
+    ]
+    new_reference = f"{escape(_quote_sheet_name(sheet_name))}!".encode()
+    defined_names = []
+    for match in _DEFINED_NAME_PATTERN.finditer(workbook):
+        defined_name = match.group(0)
+        if (
+            b'name="_xlnm.Print_' not in defined_name
+            or b'localSheetId="%d"' % template_index not in defined_name
+        ):
+            continue
+        defined_name = defined_name.replace(
+            b'localSheetId="%d"' % template_index, b'localSheetId="0"'
+        )
+        for template_reference in template_references:
+            defined_name = defined_name.replace(template_reference, new_reference)
+        defined_names.append(defined_name)
+    return defined_names
+
+
+def _quote_sheet_name(sheet_name: str) -> str:
+    return "'" + sheet_name.replace("'", "''") + "'"
+
+
+def _set_full_calculation_on_load(workbook: bytes) -> bytes:
+    """Has Excel recalculate on opening, the cached results of the copied
+    formulas belong to the template sheet"""
+    match = _CALC_PROPERTIES_PATTERN.search(workbook)
+    if match is None:
+        return workbook
+    calc_properties = _FULL_CALC_ON_LOAD_PATTERN.sub(b"", match.group(0))
+    return _splice(
+        workbook,
+        match.start(),
+        match.end(),
+        calc_properties + b' fullCalcOnLoad="1"',
+    )
+
+
+def _read_workbook_parts(archive: ZipFile) -> _WorkbookParts:
+    package_relationships = ElementTree.fromstring(
+        archive.read(_PACKAGE_RELATIONSHIPS_PART)
+    )
+    workbook_part = next(
+        _resolve_target("", relationship.get("Target", ""))
+        for relationship in package_relationships
+        if relationship.get("Type") == _OFFICE_DOCUMENT_TYPE
+    )
+    workbook_directory = posixpath.dirname(workbook_part)
+    relationships_part = posixpath.join(
+        workbook_directory, "_rels", f"{posixpath.basename(workbook_part)}.rels"
+    )
+    relationships = ElementTree.fromstring(archive.read(relationships_part))
+    relationship_targets = {
+        relationship.get("Id", ""): (
+            relationship.get("Type"),
+            _resolve_target(workbook_directory, relationship.get("Target", "")),
+        )
+        for relationship in relationships
+    }
+
+    workbook = ElementTree.fromstring(archive.read(workbook_part))
+    sheets = list(workbook.iter(f"{{{_MAIN_NAMESPACE}}}sheet"))
+    return _WorkbookParts(
+        workbook_part=workbook_part,
+        relationships_part=relationships_part,
+        sheet_names=[sheet.get("name", "") for sheet in sheets],
+        sheet_ids=[int(sheet.get("sheetId", 0)) for sheet in sheets],
+        sheet_parts=[
+            relationship_targets[sheet.get(f"{{{_RELATIONSHIPS_NAMESPACE}}}id", "")][1]
+            for sheet in sheets
+        ],
+        relationship_ids=list(relationship_targets),
+        worksheet_parts=[
+            target
+            for relationship_type, target in relationship_targets.values()
+            if relationship_type == _WORKSHEET_TYPE
+        ],
+        shared_strings_part=next(
+            (
+                target
+                for relationship_type, target in relationship_targets.values()
+                if relationship_type == _SHARED_STRINGS_TYPE
+            ),
+            None,
+        ),
+    )
+
+
+def _resolve_target(source_directory: str, target: str) -> str:
+    if target.startswith("/"):
+        return target[1:]
+    return posixpath.normpath(posixpath.join(source_directory, target))
+
+
+def _unused_part_name(archive: ZipFile, pattern: str) -> str:
+    existing_names = set(archive.namelist())
+    number = 1
+    while pattern.format(number) in existing_names:
+        number += 1
+    return pattern.format(number)
+
+
+def _unused_relationship_id(relationship_ids: List[str]) -> str:
+    existing_ids = set(relationship_ids)
+    number = len(existing_ids) + 1
+    while f"rId{number}" in existing_ids:
+        number += 1
+    return f"rId{number}"
+
+
+def _namespace_prefix(xml: bytes, namespace: str) -> str:
+    match = re.search(rb'xmlns:(\w+)="' + re.escape(namespace.encode()) + b'"', xml)
+    if match is None:
+        raise ValueError(f"namespace {namespace} is not declared")
+    return match.group(1).decode()
+
+
+def _insert_after_start_tag(xml: bytes, tag: bytes, element: bytes) -> bytes:
+    match = re.search(rb"<" + tag + rb"(?:\s[^>]*)?>", xml)
+    if match is None:
+        raise ValueError(f"no {tag.decode()} element in part")
+    return xml[: match.end()] + element + xml[match.end() :]
+
+
+def _insert_before_end_tag(xml: bytes, tag: bytes, element: bytes) -> bytes:
+    end_tag_index = xml.rfind(b"</" + tag + b">")
+    if end_tag_index < 0:
+        raise ValueError(f"no {tag.decode()} element in part")
+    return xml[:end_tag_index] + element + xml[end_tag_index:]
+
+
+def _worksheet_xml(values: Mapping[str, str]) -> bytes:
+    rows: Dict[int, List[Tuple[int, str, str]]] = {}
+    for cell_notation, value in values.items():
+        row, column = coordinate_to_tuple(cell_notation)
+        rows.setdefault(row, []).append((column, cell_notation, value))
+
+    row_elements = []
+    for row in sorted(rows):
+        cell_elements = "".join(
+            f'<c r="{cell_notation}" t="inlineStr"><is><t>{escape(value)}</t></is></c>'
+            for _, cell_notation, value in sorted(rows[row])
+        )
+        row_elements.append(f'<row r="{row}">{cell_elements}</row>')
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<worksheet xmlns="{_MAIN_NAMESPACE}">'
+        '<sheetViews><sheetView tabSelected="1" workbookViewId="0"/></sheetViews>'
+        f'<sheetData>{"".join(row_elements)}</sheetData>'
+        "</worksheet>"
+    ).encode()
@@ -0,0 +1,384 @@
+import atexit
+import os
+import shutil
+import subprocess
+import time
+import traceback
+import uuid
+from concurrent.futures import Future
+from contextlib import contextmanager
+from queue import Queue
+from tempfile import mkdtemp
+from threading import Lock, Thread
+from typing import (
+    Any,
+    Callable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+)
+
+from loguru import logger
+from pypdf import PdfWriter
+
+try:
+    import pythoncom
+    from win32com import client
+except ImportError:
+    client = pythoncom = None
+    logger.warning("not on windows, no win32com client")
+
+try:
+    # LibreOffice's python bindings, only importable from its bundled python
+    import uno  # type: ignore
+except ImportError:
+    uno = None
+    logger.debug("no LibreOffice uno module, headless PDF export unavailable")
+
+
+class PdfExportJob(NamedTuple):
+    """Sheets of the workbook exported, in order, into one PDF"""
+
+    sheet_indices: Tuple[int, ...]
+    pdf_filepath: str
+
+
+class PdfExportBackend(Protocol):
+    def export(self, workbook_filepath: str, jobs: Sequence[PdfExportJob]) -> None:
+        """Opens the workbook once and writes the PDF of every job"""
+        ...
+
+    def close(self) -> None:
+        ...
+
+
+class Win32ComPdfBackend:
+    """Exports through a new Excel application for every conversion, from any
+    thread as COM is initialized for the export"""
+
+    def __init__(self, application_factory: Optional[Callable[[], Any]] = None):
+        """application_factory defaults to dispatching Excel through win32com"""
+        self._application_factory = application_factory or _dispatch_excel
+
+    def export(self, workbook_filepath: str, jobs: Sequence[PdfExportJob]) -> None:
+        with _com_initialized():
+            excel = self._application_factory()
+            try:
+                excel.Visible = False
+                _export_workbook(excel, workbook_filepath, jobs)
+            finally:
+                excel.Quit()
+        for job in jobs:
+            logger.info(f"saved pdf to {job.pdf_filepath}")
+
+    def close(self) -> None:
+        pass
+
+
+def _export_sheets(workbook: Any, job: PdfExportJob) -> None:
+    if len(job.sheet_indices) == 1:
+        workbook.Worksheets[job.sheet_indices[0]].ExportAsFixedFormat(
+            0, job.pdf_filepath
+        )
+        return
+    # grouped sheets are exported together through the active sheet, the COM
+    # collection is 1-based when called with an array of sheets
+    workbook.Worksheets([index + 1 for index in job.sheet_indices]).Select()
+    workbook.ActiveSheet.ExportAsFixedFormat(0, job.pdf_filepath)
+
+
+@contextmanager
+def _com_initialized() -> Iterator[None]:
+    # threads other than the main thread, e.g. GUI workers, start without COM
+    if pythoncom is None:
+        yield
+        return
+    pythoncom.CoInitialize()
+    try:
+        yield
+    finally:
+        pythoncom.CoUninitialize()
+
+
+def _dispatch_excel() -> Any:
+    if client is None:
+        raise RuntimeError("exporting through Excel needs pywin32 on Windows")
+    return client.Dispatch("Excel.Application")
+
+
+def _get_uno() -> Any:
+    if uno is None:
+        raise RuntimeError("exporting through LibreOffice needs its uno module")
+    return uno
+
+
+class ExcelSessionPdfBackend:
+    """Keeps one Excel application open across exports, an application that
+    stopped responding is replaced and the export retried once"""
+
+    def __init__(self, application_factory: Optional[Callable[[], Any]] = None):
+        """application_factory defaults to dispatching Excel through win32com"""
+        self._application_factory = application_factory or _dispatch_excel
+        self._application: Any = None
+
+    def export(self, workbook_filepath: str, jobs: Sequence[PdfExportJob]) -> None:
+        application = self._get_application()
+        try:
+            _export_workbook(application, workbook_filepath, jobs)
+        except Exception:
+            if _is_application_alive(application):
+                raise
+            logger.warning("Excel stopped responding, restarting it")
+            self._application = None
+            _export_workbook(self._get_application(), workbook_filepath, jobs)
+        for job in jobs:
+            logger.info(f"saved pdf to {job.pdf_filepath}")
+
+    def close(self) -> None:
+        application, self._application = self._application, None
+        if application is None:
+            return
+        try:
+            application.Quit()
+        except Exception:
+            logger.debug("Excel already gone when quitting")
+
+    def _get_application(self) -> Any:
+        if self._application is None:
+            self._application = self._application_factory()
+            self._application.Visible = False
+            self._application.DisplayAlerts = False
+        return self._application
+
+
+def _is_application_alive(application: Any) -> bool:
+    try:
+        application.Workbooks.Count
+    except Exception:
+        return False
+    return True
+
+
+def _export_workbook(
+    application: Any, workbook_filepath: str, jobs: Sequence[PdfExportJob]
+) -> None:
+    workbook = application.Workbooks.Open(workbook_filepath)
+    try:
+        for job in jobs:
+            _export_sheets(workbook, job)
+    finally:
+        workbook.Saved = True
+        workbook.Close()
+
+
+class _ConversionRequest(NamedTuple):
+    workbook_filepath: str
+    jobs: Sequence[PdfExportJob]
+    result: "Future[None]"
+
+
+class LibreOfficePdfBackend:
+    """Keeps one headless soffice process alive and converts queued workbooks
+    through it on a single worker thread, the process is started on first use
+
+    Every backend listens on its own named pipe, so backends in other processes
+    never connect to, or terminate, each other's soffice.
+    """
+
+    def __init__(
+        self,
+        soffice_path: str = "soffice",
+        pipe_name: Optional[str] = None,
+        startup_timeout: float = 30.0,
+    ):
+        self._soffice_path = soffice_path
+        self._pipe_name = pipe_name or f"soffice-pdf-{uuid.uuid4().hex}"
+        self._startup_timeout = startup_timeout
+        self._requests: "Queue[Optional[_ConversionRequest]]" = Queue()
+        self._worker: Optional[Thread] = None
+        self._worker_lock = Lock()
+        self._process: Optional[subprocess.Popen] = None
+        self._profile_directory = ""
+        self._desktop: Any = None
+
+    def export(self, workbook_filepath: str, jobs: Sequence[PdfExportJob]) -> None:
+        self.export_async(workbook_filepath, jobs).result()
+
+    def export_async(
+        self, workbook_filepath: str, jobs: Sequence[PdfExportJob]
+    ) -> "Future[None]":
+        """Queues a conversion, the workbook file must exist until it is done"""
+        result: "Future[None]" = Future()
+        self._ensure_worker()
+        self._requests.put(_ConversionRequest(workbook_filepath, jobs, result))
+        return result
+
+    def close(self) -> None:
+        with self._worker_lock:
+            worker, self._worker = self._worker, None
+        if worker is None:
+            return
+        self._requests.put(None)
+        worker.join()
+
+    def _ensure_worker(self) -> None:
+        with self._worker_lock:
+            if self._worker is not None:
+                return
+            self._worker = Thread(
+                target=self._process_requests, name="soffice-pdf-export", daemon=True
+            )
+            self._worker.start()
+
+    def _process_requests(self) -> None:
+        try:
+            while (request := self._requests.get()) is not None:
+                if not request.result.set_running_or_notify_cancel():
+                    continue
+                try:
+                    if not self._is_office_running():
+                        self._start_office()
+                    self._convert(request.workbook_filepath, request.jobs)
+                except Exception as error:
+                    logger.error(f"failed to save to PDF: {traceback.format_exc()}")
+                    request.result.set_exception(error)
+                else:
+                    for job in request.jobs:
+                        logger.info(f"saved pdf to {job.pdf_filepath}")
+                    request.result.set_result(None)
+        finally:
+            self._stop_office()
+
+    def _is_office_running(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    def _start_office(self) -> None:
+        uno_module = _get_uno()
+        self._stop_office()
+        # a private profile keeps the worker apart from a user's own soffice
+        self._profile_directory = mkdtemp(prefix="soffice-profile-")
+        profile_url = uno_module.systemPathToFileUrl(self._profile_directory)
+        connection = f"pipe,name={self._pipe_name};urp"
+        self._process = subprocess.Popen(
+            [
+                self._soffice_path,
+                "--headless",
+                "--invisible",
+                "--nologo",
+                "--nodefault",
+                "--norestore",
+                f"-env:UserInstallation={profile_url}",
+                f"--accept={connection};StarOffice.ComponentContext",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        no_connect_exception = uno_module.getClass(
+            "com.sun.star.connection.NoConnectException"
+        )
+        local_context = uno_module.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_context
+        )
+        deadline = time.monotonic() + self._startup_timeout
+        while True:
+            # only ever connect while the soffice started here is alive
+            if not self._is_office_running():
+                raise RuntimeError("soffice exited before accepting connections")
+            try:
+                context = resolver.resolve(
+                    f"uno:{connection};StarOffice.ComponentContext"
+                )
+                break
+            except no_connect_exception:
+                if time.monotonic() > deadline:
+                    raise RuntimeError("could not connect to soffice")
+                time.sleep(0.2)
+        self._desktop = context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.frame.Desktop", context
+        )
+        logger.info(f"started soffice for PDF export on pipe {self._pipe_name}")
+
+    def _stop_office(self) -> None:
+        desktop, self._desktop = self._desktop, None
+        if desktop is not None and self._is_office_running():
+            try:
+                desktop.terminate()
+            except Exception:
+                logger.debug("soffice already gone when terminating")
+        if self._process is not None:
+            try:
+                self._process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+            self._process = None
+        if self._profile_directory:
+            shutil.rmtree(self._profile_directory, ignore_errors=True)
+            self._profile_directory = ""
+
+    def _convert(self, workbook_filepath: str, jobs: Sequence[PdfExportJob]) -> None:
+        uno_module = _get_uno()
+        document = self._desktop.loadComponentFromURL(
+            uno_module.systemPathToFileUrl(os.path.abspath(workbook_filepath)),
+            "_blank",
+            0,
+            _properties(Hidden=True, ReadOnly=True),
+        )
+        try:
+            for job in jobs:
+                self._show_only_sheets(document, job.sheet_indices)
+                document.storeToURL(
+                    uno_module.systemPathToFileUrl(os.path.abspath(job.pdf_filepath)),
+                    _properties(FilterName="calc_pdf_Export"),
+                )
+        finally:
+            document.close(True)
+
+    def _show_only_sheets(self, document: Any, sheet_indices: Tuple[int, ...]) -> None:
+        # only visible sheets are exported and the active one cannot be hidden
+        sheets = document.Sheets
+        for index in sheet_indices:
+            sheets.getByIndex(index).IsVisible = True
+        document.CurrentController.setActiveSheet(sheets.getByIndex(sheet_indices[0]))
+        for index in range(sheets.Count):
+            sheets.getByIndex(index).IsVisible = index in sheet_indices
+
+
+def _properties(**values: Any) -> tuple:
+    properties = []
+    for name, value in values.items():
+        property_value = _get_uno().createUnoStruct("com.sun.star.beans.PropertyValue")
+        property_value.Name = name
+        property_value.Value = value
+        properties.append(property_value)
+    return tuple(properties)
+
+
+_default_backend: Optional[PdfExportBackend] = None
+
+
+def get_default_backend() -> Optional[PdfExportBackend]:
+    """Excel on Windows, otherwise a shared LibreOffice backend when soffice
+    and its python bindings are installed"""
+    global _default_backend
+    if _default_backend is not None:
+        return _default_backend
+    if client is not None:
+        _default_backend = Win32ComPdfBackend()
+    elif uno is not None and shutil.which("soffice"):
+        _default_backend = LibreOfficePdfBackend()
+        atexit.register(_default_backend.close)
+    return _default_backend
+
+
+def merge_pdfs(pdf_filepaths: Sequence[str], merged_pdf_filepath: str) -> None:
+    pdf_writer = PdfWriter()
+    for pdf_filepath in pdf_filepaths:
+        pdf_writer.append(pdf_filepath)
+    with open(merged_pdf_filepath, "wb") as merged_pdf_file:
+        pdf_writer.write(merged_pdf_file)
+    pdf_writer.close()
+    logger.info(f"merged {len(pdf_filepaths)} PDFs into {merged_pdf_filepath}")
@@ -0,0 +1,61 @@
+from typing import Collection, Dict
+
+from openpyxl import Workbook
+from openpyxl.reader.excel import ExcelReader
+
+
+class _SheetSubsetReader(ExcelReader):
+    """openpyxl reader that skips parsing every sheet not in sheet_names"""
+
+    def __init__(self, filepath: str, sheet_names: Collection[str], read_only: bool):
+        super().__init__(filepath, read_only=read_only)
+        self._sheet_names = sheet_names
+
+    def read_workbook(self) -> None:
+        super().read_workbook()
+        kept_sheet_indices = self._filter_sheets()
+        self._reindex_sheet_defined_names(kept_sheet_indices)
+
+    def _filter_sheets(self) -> Dict[int, int]:
+        """drops unwanted sheets, returns a map of old to new sheet indices"""
+        # the parser's sheets, defined names and the workbook's active sheet index
+        # are openpyxl internals without type information
+        available_sheet_names = {sheet.name for sheet in self.parser.sheets}
+        if missing_sheet_names := set(self._sheet_names) - available_sheet_names:
+            raise ValueError(f"sheets not found in workbook: {missing_sheet_names}")
+
+        kept_sheet_indices = {}
+        kept_sheets = []
+        for index, sheet in enumerate(self.parser.sheets):
+            if sheet.name in self._sheet_names:
+                kept_sheet_indices[index] = len(kept_sheets)
+                kept_sheets.append(sheet)
+        self.parser.sheets = kept_sheets
+        active_sheet_index = self.parser.wb._active_sheet_index  # type: ignore
+        self.parser.wb.active = kept_sheet_indices.get(active_sheet_index, 0)
+        return kept_sheet_indices
+
+    def _reindex_sheet_defined_names(self, kept_sheet_indices: Dict[int, int]) -> None:
+        # sheet scoped names (print areas, titles) refer to sheets by position
+        defined_names = []
+        for defined_name in self.parser.defined_names.definedName:  # type: ignore
+            if defined_name.localSheetId is not None:
+                old_index = int(defined_name.localSheetId)
+                if old_index not in kept_sheet_indices:
+                    continue
+                defined_name.localSheetId = kept_sheet_indices[old_index]
+            defined_names.append(defined_name)
+        self.parser.defined_names.definedName = defined_names  # type: ignore
+
+
+def load_workbook_sheets(
+    filepath: str, sheet_names: Collection[str], read_only: bool = False
+) -> Workbook:
+    """Loads only the named sheets of a workbook, the others are never parsed
+
+    Saving the returned workbook writes out only the loaded sheets, ExcelWriter
+    refuses to save it for that reason.
+    """
+    reader = _SheetSubsetReader(filepath, sheet_names, read_only=read_only)
+    reader.read()
+    return reader.wb
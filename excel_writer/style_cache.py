@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from copy import copy
+from typing import Dict, NamedTuple, Tuple, Union
+
+from openpyxl import Workbook
+from openpyxl.cell import Cell
+from openpyxl.cell.read_only import ReadOnlyCell
+from openpyxl.styles import Alignment, Border, Font, PatternFill
+from openpyxl.styles.cell_style import StyleArray
+from openpyxl.utils.indexed_list import IndexedList
+
+# font, fill, border and alignment indices into the workbook style tables
+_StyleIds = Tuple[int, int, int, int]
+_StyleTables = Tuple[IndexedList, IndexedList, IndexedList, IndexedList]
+
+
+class CellStyle(NamedTuple):
+    font: Font
+    fill: PatternFill
+    border: Border
+    alignment: Alignment
+
+    def copy(self) -> CellStyle:
+        """Returns a style with copies of the style objects, safe to change"""
+        return CellStyle(
+            font=copy(self.font),
+            fill=copy(self.fill),
+            border=copy(self.border),
+            alignment=copy(self.alignment),
+        )
+
+
+class StyleCacheStats(NamedTuple):
+    hits: int
+    misses: int
+
+
+class StyleCache:
+    """Interns CellStyles of a workbook, each distinct style is registered in the
+    workbook style tables once and then applied to cells by its table indices"""
+
+    def __init__(self, workbook: Workbook):
+        self._workbook = workbook
+        self._style_ids: Dict[CellStyle, _StyleIds] = {}
+        self._styles: Dict[_StyleIds, CellStyle] = {}
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def stats(self) -> StyleCacheStats:
+        return StyleCacheStats(hits=self._hits, misses=self._misses)
+
+    def apply(self, cell: Cell, style: CellStyle) -> Cell:
+        style_ids = self._style_ids.get(style)
+        if style_ids is None:
+            self._misses += 1
+            style_ids = self._register(style)
+        else:
+            self._hits += 1
+
+        if not cell._style:
+            cell._style = StyleArray()
+        style_array = cell._style
+        (
+            style_array.fontId,
+            style_array.fillId,
+            style_array.borderId,
+            style_array.alignmentId,
+        ) = style_ids
+        return cell
+
+    def read(self, cell: Union[Cell, ReadOnlyCell]) -> CellStyle:
+        """Returns the interned style of a cell, it is shared by every cell with
+        the same style and must be copied before it is changed"""
+        style_ids = self._get_style_ids(cell)
+        style = self._styles.get(style_ids)
+        if style is None:
+            style = self._copy_style_from_tables(style_ids)
+            self._styles[style_ids] = style
+            self._style_ids.setdefault(style, style_ids)
+        return style
+
+    def _register(self, style: CellStyle) -> _StyleIds:
+        # interned styles are never handed out, so store a private copy
+        style = style.copy()
+        fonts, fills, borders, alignments = self._style_tables()
+        style_ids = (
+            fonts.add(style.font),
+            fills.add(style.fill),
+            borders.add(style.border),
+            alignments.add(style.alignment),
+        )
+        self._style_ids[style] = style_ids
+        return style_ids
+
+    def _style_tables(self) -> _StyleTables:
+        # the workbook style tables are openpyxl internals without type information
+        workbook = self._workbook
+        return (
+            workbook._fonts,  # type: ignore
+            workbook._fills,  # type: ignore
+            workbook._borders,  # type: ignore
+            workbook._alignments,  # type: ignore
+        )
+
+    def _get_style_ids(self, cell: Union[Cell, ReadOnlyCell]) -> _StyleIds:
+        if isinstance(cell, ReadOnlyCell):
+            style_array = cell.style_array
+        else:
+            style_array = cell._style or StyleArray()
+        return (
+            style_array.fontId,
+            style_array.fillId,
+            style_array.borderId,
+            style_array.alignmentId,
+        )
+
+    def _copy_style_from_tables(self, style_ids: _StyleIds) -> CellStyle:
+        fonts, fills, borders, alignments = self._style_tables()
+        font_id, fill_id, border_id, alignment_id = style_ids
+        return CellStyle(
+            font=copy(fonts[font_id]),
+            fill=copy(fills[fill_id]),
+            border=copy(borders[border_id]),
+            alignment=copy(alignments[alignment_id]),
+        )
@@ -1,39 +1,57 @@
 from __future__ import annotations
 
 import os
-import traceback
+import pickle
+from contextlib import contextmanager
 from copy import copy
+from datetime import datetime, timezone
+from io import BytesIO
+from itertools import chain, count, repeat
 from shutil import rmtree
 from tempfile import mkdtemp
 from typing import (
     Any,
+    BinaryIO,
+    Callable,
+    Collection,
     Dict,
+    Iterable,
+    Iterator,
     List,
     NamedTuple,
     Optional,
     Protocol,
+    Sequence,
     Tuple,
     Type,
     Union,
     overload,
 )
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
 
+import numpy as np
+import pandas as pd
 from loguru import logger
 from openpyxl import Workbook, load_workbook
-from openpyxl.cell import Cell
-from openpyxl.styles import Alignment, Border, Font, PatternFill
+from openpyxl.cell import Cell, MergedCell, WriteOnlyCell
 from openpyxl.utils import get_column_letter
+from openpyxl.utils.cell import coordinate_to_tuple, range_boundaries
+from openpyxl.worksheet.dimensions import DimensionHolder
+from openpyxl.worksheet.merge import MergedCellRange
 from openpyxl.worksheet.worksheet import Worksheet
-
-_IS_WINDOWS = False
-
-try:
-    from pywintypes import com_error
-    from win32com import client
-
-    _IS_WINDOWS = True
-except ImportError:
-    logger.warning("not on windows, no win32com client")
+from openpyxl.writer.excel import ExcelWriter as OpenpyxlExcelWriter
+
+from excel_writer.dimensions import DimensionMovePlan, move_range_dimensions
+from excel_writer.frames import frame_header, frame_rows, values_to_frame
+from excel_writer.pdf_export import (
+    ExcelSessionPdfBackend,
+    PdfExportBackend,
+    PdfExportJob,
+    get_default_backend,
+    merge_pdfs,
+)
+from excel_writer.reader import load_workbook_sheets
+from excel_writer.style_cache import CellStyle, StyleCache, StyleCacheStats
 
 _CellTypes = Type[Cell]
 
@@ -44,11 +62,10 @@ DEFAULT_COLUMN_WIDTH = 8.43
 # Cell Row and Column integeres are 1-based indexed
 
 
-class CellStyle(NamedTuple):
-    font: Font
-    fill: PatternFill
-    border: Border
-    alignment: Alignment
+_RowStyles = Optional[Union[CellStyle, Iterable[Optional[CellStyle]]]]
+_BlockStyles = Optional[Union[CellStyle, Iterable[_RowStyles]]]
+_SheetSelection = Optional[Union[str, int, Sequence[Union[str, int]]]]
+_BlockRows = Union[Iterable[Iterable[Any]], np.ndarray, pd.DataFrame]
 
 
 class CellRange(NamedTuple):
@@ -103,13 +120,30 @@ class ExcelWriter:
         iso_dates: bool = False,
         default_row_height: float = DEFAULT_ROW_HEIGHT,
         default_column_width: float = DEFAULT_COLUMN_WIDTH,
+        streaming: bool = False,
+        read_only: bool = False,
+        sheets: Optional[Collection[str]] = None,
     ):
+        """streaming creates a write-only workbook, rows can only be added with
+        append_rows and are flushed to a temporary file as they are written
+
+        read_only loads an existing workbook lazily, each sheet is only parsed when
+        it is read, call close once done. sheets loads only the named sheets of an
+        existing workbook, such a partial workbook can be read, edited and exported
+        as pdf but not saved, as saving would drop the sheets that were not loaded.
+        """
+        self.streaming = streaming
+        self.read_only = read_only
+        self.sheet_subset = sheets is not None
+        self._sheets_to_load = sheets
         self._workbook = self._initialize_workbook(
             existing_workbook, default_sheet_name, iso_dates
         )
         self.active_sheet = self._get_active_sheet(self._workbook)
+        self._style_cache = StyleCache(self._workbook)
         self._default_row_height = default_row_height
         self._default_column_width = default_column_width
+        self._dimension_move_plans: Dict[str, DimensionMovePlan] = {}
 
     def _initialize_workbook(
         self,
@@ -117,12 +151,20 @@ class ExcelWriter:
         default_sheet_name: str = "",
         iso_dates: bool = False,
     ) -> Workbook:
+        if existing_workbook and self.streaming:
+            raise ValueError("streaming mode can only create new workbooks")
         if existing_workbook:
             return self._load_existing_workbook(existing_workbook)
+        if self.streaming:
+            return self._create_streaming_workbook(default_sheet_name, iso_dates)
         return self._create_new_workbook(default_sheet_name, iso_dates)
 
     def _load_existing_workbook(self, filepath: str) -> Workbook:
-        return load_workbook(filepath)
+        if self._sheets_to_load is not None:
+            return load_workbook_sheets(
+                filepath, self._sheets_to_load, read_only=self.read_only
+            )
+        return load_workbook(filepath, read_only=self.read_only)
 
     def _create_new_workbook(
         self, default_sheet_name: str = "", iso_dates: bool = False
@@ -133,9 +175,17 @@ class ExcelWriter:
             active_sheet.title = default_sheet_name
         return workbook
 
+    def _create_streaming_workbook(
+        self, default_sheet_name: str = "", iso_dates: bool = False
+    ) -> Workbook:
+        workbook = Workbook(write_only=True, iso_dates=iso_dates)
+        # write-only workbooks start without any sheets
+        workbook.create_sheet(default_sheet_name or None)
+        return workbook
+
     def _get_active_sheet(self, workbook: Workbook) -> Worksheet:
         if not workbook.active:
-            workbook.active = self.get_worksheet(0)
+            workbook.active = workbook.worksheets[0]
         # correct typing, worksheet is subclass of _WorkbookChild
         return workbook.active  # type: ignore
 
@@ -151,34 +201,253 @@ class ExcelWriter:
         sheet_obj = self.get_worksheet(sheet)
         sheet_obj.title = new_sheet_name
 
-    def save_workbook(self, filepath: str, filename: str) -> None:
+    def clone_sheet(
+        self,
+        source: Union[str, int],
+        new_sheet_name: str,
+        position: Optional[int] = None,
+        values: bool = False,
+    ) -> None:
+        """Creates a sheet copying source, which becomes the active and only
+        selected tab, its values other than formulas are only copied when values
+        is True
+
+        The copy keeps what is stored in the sheet itself: styles, formulas,
+        dimensions, merged cells, conditional formatting, data validation, the
+        sheet view, autofilter, protection, header and footer, print area, titles
+        and page setup, and hyperlinks within the workbook. Parts linked to the
+        sheet are left out: images, charts, comments, tables and hyperlinks to
+        other files. excel_writer.package.insert_sheet copies a template sheet
+        the same way without loading the workbook.
+        """
+        self._raise_if_streaming("clone sheets")
+        if self.read_only:
+            raise ValueError("sheets of read-only workbooks cannot be cloned")
+        if new_sheet_name in self._workbook.sheetnames:
+            raise ValueError(f"sheet {new_sheet_name!r} already exists")
+        source_sheet = self.get_worksheet(source)
+        new_sheet = self._workbook.create_sheet(new_sheet_name, position)
+        new_sheet._cells = {
+            row_col: self._clone_cell(new_sheet, source_cell, values)
+            for row_col, source_cell in source_sheet._cells.items()
+        }
+        for dimension_holder_name in ("row_dimensions", "column_dimensions"):
+            source_dimensions = getattr(source_sheet, dimension_holder_name)
+            new_dimensions = getattr(new_sheet, dimension_holder_name)
+            for key, dimension in source_dimensions.items():
+                # openpyxl dimensions keep their sheet as parent, which copy keeps
+                new_dimension = copy(dimension)
+                new_dimension.parent = new_sheet
+                new_dimensions[key] = new_dimension
+        for merged_range in source_sheet.merged_cells.ranges:
+            new_sheet.merged_cells.add(MergedCellRange(new_sheet, merged_range.coord))
+        self._clone_sheet_settings(source_sheet, new_sheet)
+        self._select_only_tab(new_sheet)
+        self.set_active_sheet(new_sheet_name)
+
+    def _select_only_tab(self, selected_sheet: Worksheet) -> None:
+        # selecting several tabs groups them
+        for worksheet in self._workbook.worksheets:
+            for sheet_view in worksheet.views.sheetView:
+                sheet_view.tabSelected = worksheet is selected_sheet
+        self._workbook.active = selected_sheet
+
+    def _clone_sheet_settings(
+        self, source_sheet: Worksheet, new_sheet: Worksheet
+    ) -> None:
+        for conditional_format in source_sheet.conditional_formatting:
+            for rule in conditional_format.rules:
+                new_sheet.conditional_formatting.add(
+                    str(conditional_format.sqref), copy(rule)
+                )
+        new_sheet.data_validations = copy(source_sheet.data_validations)
+
+        new_sheet.views = copy(source_sheet.views)
+        new_sheet.auto_filter = copy(source_sheet.auto_filter)
+        new_sheet.protection = copy(source_sheet.protection)
+        new_sheet.HeaderFooter = copy(source_sheet.HeaderFooter)
+        new_sheet.sheet_format = copy(source_sheet.sheet_format)
+        new_sheet.sheet_properties = copy(source_sheet.sheet_properties)
+        new_sheet.page_margins = copy(source_sheet.page_margins)
+        new_sheet.page_setup = copy(source_sheet.page_setup)
+        new_sheet.print_options = copy(source_sheet.print_options)
+        new_sheet.row_breaks = copy(source_sheet.row_breaks)
+        new_sheet.col_breaks = copy(source_sheet.col_breaks)
+        # openpyxl keeps the print area ranges without type information
+        if source_print_ranges := source_sheet._print_area.ranges:  # type: ignore
+            new_sheet.print_area = [
+                print_range.coord for print_range in source_print_ranges
+            ]
+        new_sheet.print_title_rows = source_sheet.print_title_rows
+        new_sheet.print_title_cols = source_sheet.print_title_cols
+
+    def _clone_cell(
+        self, new_sheet: Worksheet, source_cell: Union[Cell, MergedCell], values: bool
+    ) -> Union[Cell, MergedCell]:
+        new_cell: Union[Cell, MergedCell]
+        if isinstance(source_cell, MergedCell):
+            new_cell = MergedCell(new_sheet, source_cell.row, source_cell.column)
+        else:
+            new_cell = Cell(new_sheet, row=source_cell.row, column=source_cell.column)
+            if values or source_cell.data_type == "f":
+                # values are set directly, they were converted and checked when
+                # written to the source cell
+                new_cell._value = copy(source_cell._value)
+                new_cell.data_type = source_cell.data_type
+            # hyperlinks to other files are parts linked to the sheet
+            if source_cell.hyperlink is not None and not source_cell.hyperlink.target:
+                new_cell._hyperlink = copy(source_cell.hyperlink)
+        if source_cell.has_style:
+            new_cell._style = copy(source_cell._style)
+        return new_cell
+
+    def snapshot(self) -> bytes:
+        """Serializes this writer and its workbook in memory, see from_snapshot"""
+        if self.streaming or self.read_only:
+            raise ValueError("streaming and read-only workbooks cannot be copied")
+        return pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def from_snapshot(cls, snapshot: bytes) -> ExcelWriter:
+        """Creates an independent writer from a snapshot taken in this process,
+        much cheaper than parsing the workbook file again"""
+        writer = pickle.loads(snapshot)
+        for worksheet in writer._workbook.worksheets:
+            writer._rebind_dimension_holders(worksheet)
+        return writer
+
+    def _rebind_dimension_holders(self, worksheet: Worksheet) -> None:
+        # openpyxl dimension holders lose their worksheet and default factory when
+        # unpickled, rebuild them around the unpickled dimensions, the factories
+        # are openpyxl internals without type information
+        row_dimensions = DimensionHolder(
+            worksheet, default_factory=worksheet._add_row  # type: ignore
+        )
+        row_dimensions.update(worksheet.row_dimensions)
+        worksheet.row_dimensions = row_dimensions
+        column_dimensions = DimensionHolder(
+            worksheet, default_factory=worksheet._add_column  # type: ignore
+        )
+        column_dimensions.update(worksheet.column_dimensions)
+        worksheet.column_dimensions = column_dimensions
+
+    def clone(self) -> ExcelWriter:
+        """Returns an independent in-memory copy of this writer and its workbook"""
+        return self.from_snapshot(self.snapshot())
+
+    def close(self) -> None:
+        """Releases the file handle held by read-only and streaming workbooks"""
+        self._workbook.close()
+
+    def save_workbook(
+        self, filepath: str, filename: str, compression_level: Optional[int] = None
+    ) -> None:
         full_filepath = os.path.join(filepath, filename)
-        self._workbook.save(full_filepath)
+        with open(full_filepath, "wb") as workbook_file:
+            self.save_to_stream(workbook_file, compression_level)
         logger.info(f"saved workbook to {full_filepath}")
 
+    def save_to_bytes(self, compression_level: Optional[int] = None) -> bytes:
+        workbook_stream = BytesIO()
+        self.save_to_stream(workbook_stream, compression_level)
+        return workbook_stream.getvalue()
+
+    def save_to_stream(
+        self, fileobj: BinaryIO, compression_level: Optional[int] = None
+    ) -> None:
+        """Writes the workbook as xlsx to a binary file object, compression level 0
+        stores the parts uncompressed, 1 to 9 trade saving speed for size"""
+        if self.sheet_subset:
+            raise ValueError("workbooks loaded with a subset of sheets cannot be saved")
+        self._write_to_stream(fileobj, compression_level)
+
+    def _write_to_stream(
+        self, fileobj: BinaryIO, compression_level: Optional[int] = None
+    ) -> None:
+        if self.read_only:
+            raise ValueError("read-only workbooks cannot be saved")
+        if compression_level is not None and not 0 <= compression_level <= 9:
+            raise ValueError(f"invalid compression level {compression_level}")
+        if self._workbook.write_only and not self._workbook.worksheets:
+            self._workbook.create_sheet()
+
+        compression = ZIP_STORED if compression_level == 0 else ZIP_DEFLATED
+        archive = ZipFile(
+            fileobj,
+            "w",
+            compression,
+            allowZip64=True,
+            compresslevel=compression_level,
+        )
+        self._workbook.properties.modified = datetime.now(tz=timezone.utc).replace(
+            tzinfo=None
+        )
+        # closes the archive but not the file object it was written to
+        OpenpyxlExcelWriter(self._workbook, archive).save()
+
     def export_as_pdf(
-        self, filepath: str, filename: str, sheet: Union[str, int] = 0
+        self,
+        filepath: str,
+        filename: str,
+        sheet: _SheetSelection = 0,
+        backend: Optional[PdfExportBackend] = None,
+    ) -> None:
+        """sheet may also be a list of sheets exported into one PDF or None for the
+        whole workbook, without a backend Excel is used on Windows and LibreOffice
+        elsewhere"""
+        self.export_pdfs([(sheet, os.path.join(filepath, filename))], backend)
+
+    def export_pdfs(
+        self,
+        jobs: Sequence[Tuple[_SheetSelection, str]],
+        backend: Optional[PdfExportBackend] = None,
+        merged_pdf_filepath: str = "",
     ) -> None:
-        pdf_filepath = os.path.join(filepath, filename)
-        sheet_index = self._get_sheet_index(sheet)
-        if not _IS_WINDOWS:
-            logger.error("Unable to export as PDF, not on Windows")
+        """Exports the sheets of every (sheets, pdf filepath) job from a single
+        saved copy of the workbook, optionally merging the PDFs into one file"""
+        if not jobs:
+            raise ValueError("no PDF export jobs")
+        export_jobs = [
+            PdfExportJob(self._get_sheet_indices(sheets), pdf_filepath)
+            for sheets, pdf_filepath in jobs
+        ]
+        backend = backend or get_default_backend()
+        if backend is None:
+            logger.error("Unable to export as PDF, no PDF export backend available")
             return
-        self._save_temporary_excel_and_print_pdf(sheet_index, pdf_filepath)
+        self._save_temporary_excel_and_print_pdf(export_jobs, backend)
+        if merged_pdf_filepath:
+            merge_pdfs([job.pdf_filepath for job in export_jobs], merged_pdf_filepath)
+
+    @staticmethod
+    @contextmanager
+    def pdf_exporter(
+        application_factory: Optional[Callable[[], Any]] = None,
+    ) -> Iterator[ExcelSessionPdfBackend]:
+        """Yields a backend for export_as_pdf that reuses one Excel application
+        for every export made within the block"""
+        backend = ExcelSessionPdfBackend(application_factory)
+        try:
+            yield backend
+        finally:
+            backend.close()
 
     def _save_temporary_excel_and_print_pdf(
-        self, sheet_index: int, pdf_filepath: str
+        self, jobs: Sequence[PdfExportJob], backend: PdfExportBackend
     ) -> None:
-        temp_excel_filename = self._generate_temp_workbook_filename(pdf_filepath)
+        temp_excel_filename = self._generate_temp_workbook_filename(
+            jobs[0].pdf_filepath
+        )
         tmpdir = mkdtemp()
         temp_filepath = os.path.join(tmpdir, temp_excel_filename)
-        self.save_workbook(tmpdir, temp_excel_filename)
-        excel = client.Dispatch("Excel.Application")
-        self._print_pdf_with_error_handling(
-            excel, temp_filepath, pdf_filepath, sheet_index
-        )
-        rmtree(tmpdir, ignore_errors=True)
-        excel.Quit()
+        try:
+            # the copy is only read back by the backend, so skip compressing it,
+            # it may hold just the loaded sheets of a partial workbook
+            with open(temp_filepath, "wb") as temp_file:
+                self._write_to_stream(temp_file, compression_level=0)
+            backend.export(temp_filepath, jobs)
+        finally:
+            rmtree(tmpdir, ignore_errors=True)
 
     def _generate_temp_workbook_filename(self, pdf_filepath: str) -> str:
         filename_only = os.path.basename(pdf_filepath)
@@ -188,39 +457,14 @@ class ExcelWriter:
         worksheet = self.get_worksheet(sheet)
         return self._workbook.index(worksheet)
 
-    def _print_pdf_with_error_handling(
-        self,
-        excel_client: Any,
-        temp_workbook_filepath: str,
-        pdf_filepath: str,
-        sheet_index: int,
-    ) -> None:
-        try:
-            self._print_pdf_using_win32com_client(
-                excel_client, temp_workbook_filepath, pdf_filepath, sheet_index
-            )
-        except (AttributeError, com_error):
-            logger.error(f"failed to save to PDF: {traceback.format_exc()}")
-
-    def _print_pdf_using_win32com_client(
-        self,
-        excel_client: Any,
-        temp_workbook_filepath: str,
-        pdf_filepath: str,
-        sheet_index: int,
-    ) -> None:
-        excel_client.Visible = False
-        workbook = excel_client.Workbooks.Open(temp_workbook_filepath)
-        worksheet = workbook.Worksheets[sheet_index]
-        try:
-            worksheet.ExportAsFixedFormat(0, pdf_filepath)
-        except com_error:
-            logger.error(
-                f"failed while saving as PDF using wincom32 {traceback.format_exc()}"
-            )
-        logger.info(f"saved pdf to {pdf_filepath}")
-        workbook.Saved = True
-        workbook.Close()
+    def _get_sheet_indices(self, sheets: _SheetSelection) -> Tuple[int, ...]:
+        if sheets is None:
+            return tuple(range(len(self._workbook.worksheets)))
+        if isinstance(sheets, (str, int)):
+            return (self._get_sheet_index(sheets),)
+        if not sheets:
+            raise ValueError("no sheets to export")
+        return tuple(self._get_sheet_index(sheet) for sheet in sheets)
 
     @overload
     def cell(
@@ -249,6 +493,7 @@ class ExcelWriter:
         set_value: Optional[str] = None,
         set_style: Optional[CellStyle] = None,
     ) -> Cell:
+        self._raise_if_streaming("cell")
         sheet_object = self.get_worksheet(sheet)
 
         if isinstance(cell_id, tuple):
@@ -270,13 +515,241 @@ class ExcelWriter:
     def _get_cell_by_notation(self, sheet: Worksheet, cell_notation: str) -> Cell:
         return sheet[cell_notation]
 
+    def write_block(
+        self,
+        sheet: Union[str, int],
+        top_left: Union[Tuple[int, int], str],
+        rows: _BlockRows,
+        styles: _BlockStyles = None,
+    ) -> CellRange:
+        """Writes a 2-D block of values with top_left as the first cell
+
+        styles is either one CellStyle for every cell, or one entry per row holding a
+        CellStyle for the whole row or an iterable of per-cell styles. None values and
+        None styles leave the existing cell untouched, in a DataFrame NaN, NaT and NA
+        count as None and numpy scalars are written as python values.
+        """
+        self._raise_if_streaming("write_block")
+        worksheet = self.get_worksheet(sheet)
+        start_row, start_column = self._get_row_col(top_left)
+        end_row = start_row - 1
+        end_column = start_column
+
+        for row, values, row_styles in zip(
+            count(start_row),
+            self._iter_block_rows(rows),
+            self._iter_block_styles(styles),
+        ):
+            column = start_column
+            for column, value, style in zip(
+                count(start_column), values, self._iter_row_styles(row_styles)
+            ):
+                if value is None and style is None:
+                    continue
+                cell = worksheet.cell(row=row, column=column, value=value)
+                if style is not None:
+                    # a merged cell would have refused the value above
+                    self._set_cell_style(cell, style)  # type: ignore
+            end_row = row
+            end_column = max(end_column, column)
+
+        if end_row < start_row:
+            raise ValueError("no rows to write")
+        return CellRange(
+            start_row=start_row,
+            start_column=start_column,
+            end_row=end_row,
+            end_column=end_column,
+        )
+
+    def append_rows(
+        self,
+        sheet: Union[str, int],
+        rows: _BlockRows,
+        styles: _BlockStyles = None,
+    ) -> int:
+        """Appends rows below the last used row of the sheet, returns the row count
+
+        rows may be a generator, in streaming mode each row is written out as soon as
+        it is consumed so memory stays flat. styles follow the write_block rules.
+        """
+        worksheet = self.get_worksheet(sheet)
+        rows_appended = 0
+        for values, row_styles in zip(
+            self._iter_block_rows(rows), self._iter_block_styles(styles)
+        ):
+            if row_styles is not None:
+                values = self._create_styled_row(worksheet, values, row_styles)
+            elif not isinstance(values, (list, tuple)):
+                values = list(values)
+            worksheet.append(values)
+            rows_appended += 1
+        return rows_appended
+
+    def write_frame(
+        self,
+        sheet: Union[str, int],
+        top_left: Union[Tuple[int, int], str],
+        frame: pd.DataFrame,
+        header: bool = True,
+        styles: _BlockStyles = None,
+        header_style: Optional[CellStyle] = None,
+    ) -> CellRange:
+        """Writes the frame with its column names as the first row when header is
+        set, the index is not written so reset_index first to keep it
+
+        styles follow the write_block rules for the rows below the header. Missing
+        values leave the existing cell untouched.
+        """
+        self._raise_if_streaming("write_frame")
+        if not frame.shape[1]:
+            raise ValueError("no columns to write")
+        rows: Iterable[Iterable[Any]] = frame_rows(frame)
+        if header:
+            rows = chain([frame_header(frame)], rows)
+            styles = chain([header_style], self._iter_block_styles(styles))
+        return self.write_block(sheet, top_left, rows, styles)
+
+    def read_frame(
+        self,
+        sheet: Union[str, int],
+        cell_range: Optional[Union[CellRange, str]] = None,
+        header: bool = True,
+    ) -> pd.DataFrame:
+        """Reads the cell range, e.g. "B2:D10", into a frame with inferred column
+        dtypes, the first row names the columns when header is set
+
+        cell_range defaults to the used range of the sheet. Cells are not created
+        for the empty positions of the range.
+        """
+        self._raise_if_streaming("read_frame")
+        worksheet = self.get_worksheet(sheet)
+        bounds = self._get_range_bounds(worksheet, cell_range)
+        values = np.full(
+            (
+                bounds.end_row - bounds.start_row + 1,
+                bounds.end_column - bounds.start_column + 1,
+            ),
+            None,
+            dtype=object,
+        )
+        if self.read_only:
+            self._read_streamed_values(worksheet, bounds, values)
+        else:
+            self._read_cell_values(worksheet, bounds, values)
+        return values_to_frame(values, header, bounds.start_column)
+
+    def _get_range_bounds(
+        self, worksheet: Worksheet, cell_range: Optional[Union[CellRange, str]]
+    ) -> CellRange:
+        if isinstance(cell_range, CellRange):
+            return cell_range
+        if isinstance(cell_range, str):
+            start_column, start_row, end_column, end_row = range_boundaries(cell_range)
+            return self._bounded_range(
+                cell_range, (start_row, start_column, end_row, end_column)
+            )
+        if cell_range is not None:
+            raise ValueError(f"invalid cell range {cell_range}")
+        if self.read_only and worksheet.max_row is None:
+            # the sheet file declared no dimensions, they are found by reading it
+            # the read-only sheet accepts force, the Worksheet stubs do not
+            worksheet.calculate_dimension(force=True)  # type: ignore
+        return self._bounded_range(
+            worksheet.title,
+            (
+                worksheet.min_row,
+                worksheet.min_column,
+                worksheet.max_row,
+                worksheet.max_column,
+            ),
+        )
+
+    @staticmethod
+    def _bounded_range(
+        name: str,
+        bounds: Tuple[Optional[int], Optional[int], Optional[int], Optional[int]],
+    ) -> CellRange:
+        start_row, start_column, end_row, end_column = bounds
+        if (
+            start_row is None
+            or start_column is None
+            or end_row is None
+            or end_column is None
+        ):
+            raise ValueError(f"the bounds of {name} are not fully known")
+        return CellRange(start_row, start_column, end_row, end_column)
+
+    def _read_streamed_values(
+        self, worksheet: Worksheet, bounds: CellRange, values: np.ndarray
+    ) -> None:
+        rows = worksheet.iter_rows(
+            min_row=bounds.start_row,
+            max_row=bounds.end_row,
+            min_col=bounds.start_column,
+            max_col=bounds.end_column,
+            values_only=True,
+        )
+        for row_index, row in enumerate(rows):
+            values[row_index, : len(row)] = row
+
+    def _read_cell_values(
+        self, worksheet: Worksheet, bounds: CellRange, values: np.ndarray
+    ) -> None:
+        # iter_rows would create a cell for every empty position of the range
+        for (row, column), cell in worksheet._cells.items():
+            if (
+                bounds.start_row <= row <= bounds.end_row
+                and bounds.start_column <= column <= bounds.end_column
+            ):
+                values[row - bounds.start_row, column - bounds.start_column] = (
+                    cell.value
+                )
+
+    def _create_styled_row(
+        self, worksheet: Worksheet, values: Iterable[Any], row_styles: _RowStyles
+    ) -> List[Any]:
+        styled_row = []
+        for value, style in zip(values, self._iter_row_styles(row_styles)):
+            if style is not None:
+                value = self._set_cell_style(WriteOnlyCell(worksheet, value), style)
+            styled_row.append(value)
+        return styled_row
+
+    def _raise_if_streaming(self, action: str) -> None:
+        if self.streaming:
+            raise ValueError(f"{action} is not available in streaming mode")
+
+    def _get_row_col(self, cell_id: Union[Tuple[int, int], str]) -> Tuple[int, int]:
+        if isinstance(cell_id, tuple):
+            return cell_id
+        if isinstance(cell_id, str):
+            return coordinate_to_tuple(cell_id)
+        raise ValueError("one of row and column or cell notation must be specified")
+
+    def _iter_block_rows(self, rows: _BlockRows) -> Iterator[Iterable[Any]]:
+        if isinstance(rows, pd.DataFrame):
+            return frame_rows(rows)
+        if isinstance(rows, np.ndarray):
+            return iter(np.atleast_2d(rows).tolist())
+        return iter(rows)
+
+    def _iter_block_styles(self, styles: _BlockStyles) -> Iterator[_RowStyles]:
+        if styles is None or isinstance(styles, CellStyle):
+            return repeat(styles)
+        return chain(styles, repeat(None))
+
+    def _iter_row_styles(self, row_styles: _RowStyles) -> Iterator[Optional[CellStyle]]:
+        if row_styles is None or isinstance(row_styles, CellStyle):
+            return repeat(row_styles)
+        return chain(row_styles, repeat(None))
+
     def _set_cell_style(self, cell: Cell, style: CellStyle) -> Cell:
-        cell.font = style.font
-        cell.fill = style.fill
-        cell.border = style.border
-        cell.alignment = style.alignment
+        return self._style_cache.apply(cell, style)
 
-        return cell
+    @property
+    def style_cache_stats(self) -> StyleCacheStats:
+        return self._style_cache.stats
 
     @overload
     def get_worksheet(self, sheet: str) -> Worksheet:
@@ -305,14 +778,10 @@ class ExcelWriter:
         sheet: Union[str, int],
         cell_id: Union[Tuple[int, int], str],
     ) -> CellStyle:
+        """Returns the style of the cell, it is shared with every cell of the same
+        style, use its copy to get a style that is safe to change"""
         cell = self.cell(sheet, cell_id)
-
-        font = copy(cell.font)
-        border = copy(cell.border)
-        fill = copy(cell.fill)
-        alignment = copy(cell.alignment)
-
-        return CellStyle(font=font, fill=fill, border=border, alignment=alignment)
+        return self._style_cache.read(cell)
 
     def move_range(
         self,
@@ -323,6 +792,7 @@ class ExcelWriter:
         translate_formulas: bool = False,
         move_dimensions: bool = True,
     ) -> CellRange:
+        self._raise_if_streaming("move_range")
         worksheet = self.get_worksheet(sheet)
         range_notation = cell_range.notation
         if move_dimensions:
@@ -346,107 +816,43 @@ class ExcelWriter:
         rows_to_move: int = 0,
         columns_to_move: int = 0,
     ) -> None:
+        worksheet = self.get_worksheet(sheet)
+        move_plan = self._dimension_move_plans.get(worksheet.title)
+        if move_plan is not None:
+            move_plan.add(cell_range, rows_to_move, columns_to_move)
+            return
         logger.debug("moving range with styles")
-        row_height_map = self._copy_range_row_height(sheet, cell_range)
-        column_width_map = self._copy_range_column_width(sheet, cell_range)
-        self._set_old_row_height_to_default(sheet, cell_range)
-        self._set_old_column_width_to_default(sheet, cell_range)
-        self._set_range_row_height(sheet, row_height_map, rows_moved=rows_to_move)
-        self._set_range_column_width(
-            sheet, column_width_map, columns_moved=columns_to_move
+        move_range_dimensions(
+            worksheet,
+            cell_range,
+            rows_to_move,
+            columns_to_move,
+            default_row_height=self._default_row_height,
+            default_column_width=self._default_column_width,
         )
 
-    def _copy_range_row_height(
-        self,
-        sheet: Union[str, int],
-        cell_range: CellRange,
-    ) -> Dict[int, float]:
-        worksheet = self.get_worksheet(sheet)
-        current_row = cell_range.start_row
-        end_row = cell_range.end_row
-
-        row_height_map = {}
-
-        while current_row <= end_row:
-            # openpyxl row dimension indexing
-            row_dimensions = worksheet.row_dimensions[current_row].height  # type: ignore
-            row_height_map[current_row] = row_dimensions
-            current_row += 1
-        return row_height_map
-
-    def _copy_range_column_width(
-        self,
-        sheet: Union[str, int],
-        cell_range: CellRange,
-    ) -> Dict[int, float]:
-        worksheet = self.get_worksheet(sheet)
-        current_column = cell_range.start_column
-        end_column = cell_range.end_column
-
-        column_width_map = {}
+    @contextmanager
+    def deferred_dimension_moves(self, sheet: Union[str, int]) -> Iterator[None]:
+        """Row heights and column widths moved by move_range on the sheet are
+        only relocated on exit, chained moves of a range are applied as one
 
-        while current_column <= end_column:
-            column_letter = get_column_letter(current_column)
-            column_width = worksheet.column_dimensions[column_letter].width
-            column_width_map[current_column] = column_width
-            current_column += 1
-        return column_width_map
-
-    def _set_old_row_height_to_default(
-        self,
-        sheet: Union[str, int],
-        cell_range: CellRange,
-        default_row_height: Optional[float] = None,
-    ) -> None:
-        default_row_height = default_row_height or self._default_row_height
+        The planned moves are applied even if the block raises, as the cells
+        moved so far stay moved.
+        """
         worksheet = self.get_worksheet(sheet)
-        current_row = cell_range.start_row
-        end_row = cell_range.end_row
-
-        while current_row <= end_row:
-            # openpyxl row dimension indexing
-            worksheet.row_dimensions[current_row].height = default_row_height  # type: ignore
-            current_row += 1
-
-    def _set_old_column_width_to_default(
-        self,
-        sheet: Union[str, int],
-        cell_range: CellRange,
-        default_column_width: Optional[float] = None,
-    ) -> None:
-        default_column_width = default_column_width or self._default_column_width
-        worksheet = self.get_worksheet(sheet)
-        current_column = cell_range.start_column
-        end_column = cell_range.end_column
-
-        while current_column <= end_column:
-            column_letter = get_column_letter(current_column)
-            worksheet.column_dimensions[column_letter].width = default_column_width
-            current_column += 1
-
-    def _set_range_row_height(
-        self,
-        sheet: Union[str, int],
-        row_height_map: Dict[int, float],
-        rows_moved: int = 0,
-    ) -> None:
-        worksheet = self.get_worksheet(sheet)
-        for row, height in row_height_map.items():
-            new_row = row + rows_moved
-            # openpyxl row dimension indexing
-            worksheet.row_dimensions[new_row].height = height  # type: ignore
-
-    def _set_range_column_width(
-        self,
-        sheet: Union[str, int],
-        column_width_map: Dict[int, float],
-        columns_moved: int = 0,
-    ) -> None:
-        worksheet = self.get_worksheet(sheet)
-        for column, width in column_width_map.items():
-            new_column = column + columns_moved
-            column_letter = get_column_letter(new_column)
-            worksheet.column_dimensions[column_letter].width = width
+        if worksheet.title in self._dimension_move_plans:
+            yield
+            return
+        move_plan = DimensionMovePlan()
+        self._dimension_move_plans[worksheet.title] = move_plan
+        try:
+            yield
+        finally:
+            del self._dimension_move_plans[worksheet.title]
+            for cell_range, rows_to_move, columns_to_move in move_plan.moves:
+                self._move_range_dimensions_to_new_range(
+                    worksheet.title, cell_range, rows_to_move, columns_to_move
+                )
 
     def get_print_area(
         self,
@@ -66,3 +66,25 @@ class TestSetContent:
         worksheet = self.writer.active_sheet
         # openpyxl row dimensions indexing
         assert worksheet.row_dimensions[36].height == 30  # type: ignore
+
+
+class TestSetContentLongerThanHundredRows:
+    def setup_method(self):
+        # 30 items of title, 3 descriptions and a spacer row need 150 rows
+        contents = [
+            Content(f"title{index}", ["desc1", "desc2", "desc3"]) for index in range(30)
+        ]
+        self.writer = load_template(TEST_FILEPATH)
+        self.writer = set_content(self.writer, contents)
+
+    def test_last_content_written(self):
+        assert self.writer.cell(0, "B161").value == "title29"
+        assert self.writer.cell(0, "B164").value == "desc3"
+
+    def test_signature_block_moved_below_contents(self):
+        assert self.writer.cell(0, "B166").value == "Name of recipients"
+        # openpyxl row dimensions indexing
+        assert self.writer.active_sheet.row_dimensions[166].height == 30  # type: ignore
+
+    def test_print_area_covers_signature_block(self):
+        assert self.writer.get_print_area(0) == "'Sheet 1'!$B$2:$D$176"
@@ -0,0 +1,122 @@
+from queue import Queue
+from threading import Event
+from typing import Any, Callable, List, Tuple
+
+import pytest
+
+from acknowledgement_form.gui.background import BackgroundRunner, TaskContext
+
+
+class FakeUiQueue:
+    """Collects posted callbacks like the appJar event queue"""
+
+    def __init__(self):
+        self._posted: "Queue[Tuple[Callable[..., None], Tuple[Any, ...]]]" = Queue()
+
+    def post(self, func: Callable[..., None], *args: Any) -> None:
+        self._posted.put((func, args))
+
+    def run_posted(self, expected_count: int) -> None:
+        # outcomes are posted from the worker just after the future completes
+        for _ in range(expected_count):
+            func, args = self._posted.get(timeout=5)
+            func(*args)
+        assert self._posted.empty()
+
+
+class TestBackgroundRunner:
+    def setup_method(self):
+        self.ui_queue = FakeUiQueue()
+        self.runner = BackgroundRunner(self.ui_queue.post)
+        self.results: List[Any] = []
+        self.errors: List[BaseException] = []
+        self.progress: List[str] = []
+
+    def teardown_method(self):
+        self.runner.shutdown()
+
+    def submit(self, task: Callable[[TaskContext], Any]):
+        return self.runner.submit(
+            task,
+            on_done=self.results.append,
+            on_error=self.errors.append,
+            on_progress=self.progress.append,
+        )
+
+    def test_result_and_progress_posted_to_ui(self):
+        def task(context: TaskContext) -> int:
+            context.report_progress("half way")
+            return 42
+
+        self.submit(task).result(timeout=5)
+        self.ui_queue.run_posted(expected_count=2)
+        assert self.progress == ["half way"]
+        assert self.results == [42]
+
+    def test_error_posted_to_ui(self):
+        def task(context: TaskContext) -> None:
+            raise ValueError("unreadable pdf")
+
+        handle = self.submit(task)
+        with pytest.raises(ValueError):
+            handle.result(timeout=5)
+        self.ui_queue.run_posted(expected_count=1)
+        assert [str(error) for error in self.errors] == ["unreadable pdf"]
+
+    def test_cancelled_task_stops_at_progress_and_posts_nothing(self):
+        started = Event()
+        release = Event()
+
+        def task(context: TaskContext) -> str:
+            started.set()
+            release.wait(timeout=5)
+            context.report_progress("never reported")
+            return "never returned"
+
+        handle = self.submit(task)
+        started.wait(timeout=5)
+        handle.cancel()
+        release.set()
+        self.runner.shutdown(wait=True)
+        self.ui_queue.run_posted(expected_count=0)
+        assert not self.results
+        assert not self.errors
+        assert not self.progress
+
+    def test_task_not_cancelled_after_final_step(self):
+        saving = Event()
+        release = Event()
+
+        def task(context: TaskContext) -> str:
+            context.report_final_step("saving")
+            saving.set()
+            release.wait(timeout=5)
+            return "saved"
+
+        handle = self.submit(task)
+        saving.wait(timeout=5)
+        assert not handle.cancel()
+        release.set()
+        assert handle.result(timeout=5) == "saved"
+        self.ui_queue.run_posted(expected_count=2)
+        assert self.progress == ["saving"]
+        assert self.results == ["saved"]
+
+    def test_cancelled_task_stops_at_final_step(self):
+        started = Event()
+        release = Event()
+
+        def task(context: TaskContext) -> str:
+            started.set()
+            release.wait(timeout=5)
+            context.report_final_step("never reported")
+            return "never returned"
+
+        handle = self.submit(task)
+        started.wait(timeout=5)
+        assert handle.cancel()
+        release.set()
+        self.runner.shutdown(wait=True)
+        self.ui_queue.run_posted(expected_count=0)
+        assert not self.results
+        assert not self.progress
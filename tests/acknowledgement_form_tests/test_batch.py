@@ -0,0 +1,118 @@
+import json
+import os
+import shutil
+from tempfile import TemporaryDirectory
+
+from acknowledgement_form.form_generator.batch import (
+    MANIFEST_FILENAME,
+    AcknowledgementJob,
+    BatchTemplateRenderer,
+    find_quotation_pdfs,
+    generate_forms_from_quotations,
+)
+from acknowledgement_form.form_generator.constants import Content, Field
+from excel_writer.writer import ExcelWriter
+
+TEST_FILEPATH = os.path.join(
+    "tests", "acknowledgement_form_tests", "test_files", "template_job_ack.xlsx"
+)
+SAMPLE_PDF = os.path.join(
+    "tests", "acknowledgement_form_tests", "test_files", "sample_quo.pdf"
+)
+
+
+class TestBatchTemplateRenderer:
+    def setup_method(self):
+        self.renderer = BatchTemplateRenderer(TEST_FILEPATH)
+
+    def test_render_does_not_change_template(self):
+        first = self.renderer.render(
+            {Field.CLIENT_NAME: "abc pte ltd"}, [Content("title1", ["desc1"])]
+        )
+        second = self.renderer.render({Field.CLIENT_NAME: "xyz pte ltd"}, [])
+        assert "abc pte ltd" in str(
+            first.cell(0, Field.CLIENT_NAME.value.cell_id).value
+        )
+        assert "xyz pte ltd" in str(
+            second.cell(0, Field.CLIENT_NAME.value.cell_id).value
+        )
+        assert first.cell(0, "B16").value == "title1"
+
+    def test_render_batch(self):
+        jobs = [
+            AcknowledgementJob(
+                {
+                    Field.CLIENT_NAME: "abc",
+                    Field.JOB_NUM: "1",
+                    Field.QUOTATION_NUM: "Q1",
+                },
+                [Content("title1", ["desc1", "desc2"])],
+            ),
+            AcknowledgementJob(
+                {Field.CLIENT_NAME: "xyz"}, [Content("title2", [])], "custom.xlsx"
+            ),
+        ]
+        with TemporaryDirectory() as tmpdir:
+            output_filepaths = self.renderer.render_batch(jobs, tmpdir)
+            assert output_filepaths == [
+                os.path.join(tmpdir, "ACK-JN1-Q1-abc.xlsx"),
+                os.path.join(tmpdir, "custom.xlsx"),
+            ]
+            saved = ExcelWriter(output_filepaths[1])
+        assert saved.cell(0, "B16").value == "title2"
+
+
+def test_find_quotation_pdfs():
+    test_files = os.path.join("tests", "acknowledgement_form_tests", "test_files")
+    assert find_quotation_pdfs(test_files) == [
+        os.path.join(test_files, "sample_quo.pdf"),
+        os.path.join(test_files, "sample_quo_2.pdf"),
+        os.path.join(test_files, "sample_quo_with_version.pdf"),
+    ]
+    assert find_quotation_pdfs(os.path.join(test_files, "*_2.pdf")) == [
+        os.path.join(test_files, "sample_quo_2.pdf")
+    ]
+
+
+def test_generate_forms_from_quotations():
+    with TemporaryDirectory() as tmpdir:
+        broken_pdf = os.path.join(tmpdir, "broken.pdf")
+        with open(broken_pdf, "w", encoding="utf-8") as broken_file:
+            broken_file.write("not a pdf")
+        shutil.copy(SAMPLE_PDF, tmpdir)
+
+        output_directory = os.path.join(tmpdir, "output")
+        results = generate_forms_from_quotations(
+            tmpdir, output_directory, max_workers=2, template_filepath=TEST_FILEPATH
+        )
+        with open(os.path.join(output_directory, MANIFEST_FILENAME)) as manifest:
+            manifest = json.load(manifest)
+        saved = ExcelWriter(results[1].output_filepath)
+
+    assert [result.succeeded for result in results] == [False, True]
+    assert [entry["quotation"] for entry in manifest["failed"]] == [broken_pdf]
+    assert len(manifest["succeeded"]) == 1
+    assert os.path.basename(results[1].output_filepath).startswith("ACK-JN")
+    assert results[1].output_filepath.endswith("_sample_quo.xlsx")
+    assert "SCHOTTEL FAR EAST (PTE) LTD" in str(saved.cell(0, "B3").value)
+
+
+def test_generate_forms_with_colliding_names():
+    with TemporaryDirectory() as tmpdir:
+        for directory_name in ["a", "b"]:
+            os.makedirs(os.path.join(tmpdir, directory_name))
+            shutil.copy(SAMPLE_PDF, os.path.join(tmpdir, directory_name))
+        shutil.copy(SAMPLE_PDF, os.path.join(tmpdir, "a", "sample_copy.pdf"))
+
+        results = generate_forms_from_quotations(
+            os.path.join(tmpdir, "*", "*.pdf"),
+            os.path.join(tmpdir, "output"),
+            max_workers=2,
+            template_filepath=TEST_FILEPATH,
+        )
+        output_filepaths = [result.output_filepath for result in results[:2]]
+        assert all(os.path.exists(filepath) for filepath in output_filepaths)
+
+    assert [result.succeeded for result in results] == [True, True, False]
+    assert len(set(output_filepaths)) == 2
+    assert os.path.join("a", "sample_quo.pdf") in results[2].error
@@ -0,0 +1,85 @@
+from acknowledgement_form.form_generator.constants import Content
+from acknowledgement_form.gui.content_model import ContentModel, serialize_contents
+
+CONTENTS = [
+    Content("title1", ["desc1", "desc2"]),
+    Content("title2", ["desc1"]),
+]
+
+CONTENT_TEXT = (
+    "Title: title1 \n"
+    "Description:\n"
+    "desc1 \n"
+    "desc2 \n"
+    "\n"
+    "---ENDBLOCK---\n"
+    "\n"
+    "Title: title2 \n"
+    "Description:\n"
+    "desc1 \n"
+    "\n"
+    "---ENDBLOCK---\n"
+    "\n"
+)
+
+
+def test_serialize_contents():
+    assert serialize_contents(CONTENTS) == CONTENT_TEXT
+
+
+class TestContentModel:
+    def setup_method(self):
+        self.model = ContentModel()
+
+    def test_parse_keeps_title_trailing_space(self):
+        self.model.update(CONTENT_TEXT)
+        assert self.model.contents == [
+            Content("title1 ", ["desc1 ", "desc2 "]),
+            Content("title2 ", ["desc1 "]),
+        ]
+
+    def test_set_contents_round_trip(self):
+        text = self.model.set_contents(CONTENTS)
+        assert text == CONTENT_TEXT
+        assert [title.strip() for title, _ in self.model.contents] == [
+            "title1",
+            "title2",
+        ]
+
+    def test_only_changed_segment_parsed_again(self):
+        text = serialize_contents(
+            Content(f"title{index}", ["desc"]) for index in range(1000)
+        )
+        self.model.update(text)
+        parsed_segment_count = self.model.parsed_segment_count
+        changed = self.model.update(text.replace("title500 ", "renamed "))
+        assert changed
+        assert self.model.parsed_segment_count == parsed_segment_count + 1
+        assert self.model.contents[500] == Content("renamed ", ["desc "])
+        assert len(self.model.contents) == 1000
+
+    def test_unchanged_contents_keep_version(self):
+        self.model.update(CONTENT_TEXT)
+        version = self.model.version
+        # a blank line outside the blocks does not change the contents
+        assert not self.model.update(CONTENT_TEXT + "\n")
+        assert self.model.version == version
+
+    def test_unclosed_block_has_no_content(self):
+        self.model.update(CONTENT_TEXT + "Title: title3 \nDescription:\ndesc1 \n")
+        assert len(self.model.contents) == 2
+        assert self.model.segments[-1].descriptions is None
+
+    def test_titles_pair_with_blocks_in_order(self):
+        text = "Title: a\nTitle: b\n---ENDBLOCK---\nx\n---ENDBLOCK---\n"
+        self.model.update(text)
+        assert self.model.contents == [Content("a", []), Content("b", ["x"])]
+
+    def test_segment_at_line(self):
+        self.model.update(CONTENT_TEXT)
+        first_segment, second_segment, trailing_segment = self.model.segments
+        assert (first_segment.start_line, first_segment.line_count) == (0, 6)
+        assert (second_segment.start_line, second_segment.line_count) == (6, 6)
+        assert self.model.segment_at_line(7) == second_segment
+        assert self.model.segment_at_line(12) == trailing_segment
+        assert self.model.segment_at_line(14) is None
@@ -0,0 +1,56 @@
+from typing import Callable, Dict, FrozenSet, Hashable, List
+
+from acknowledgement_form.gui.debounce import Debouncer
+
+
+class FakeScheduler:
+    def __init__(self):
+        self.scheduled: Dict[int, Callable[[], None]] = {}
+        self._next_id = 0
+
+    def after(self, delay_ms: int, callback: Callable[[], None]) -> int:
+        self._next_id += 1
+        self.scheduled[self._next_id] = callback
+        return self._next_id
+
+    def after_cancel(self, after_id: int) -> None:
+        del self.scheduled[after_id]
+
+    def run_pending(self) -> None:
+        scheduled, self.scheduled = self.scheduled, {}
+        for callback in scheduled.values():
+            callback()
+
+
+class TestDebouncer:
+    def setup_method(self):
+        self.scheduler = FakeScheduler()
+        self.runs: List[FrozenSet[Hashable]] = []
+        self.debouncer = Debouncer(
+            self.scheduler.after, self.scheduler.after_cancel, self.runs.append
+        )
+
+    def test_requests_collapse_into_one_run(self):
+        for key in ("client", "vessel", "client"):
+            self.debouncer.request(key)
+        assert len(self.scheduler.scheduled) == 1
+        self.scheduler.run_pending()
+        assert self.runs == [frozenset({"client", "vessel"})]
+        assert not self.debouncer.is_pending
+
+    def test_keys_cleared_between_runs(self):
+        self.debouncer.request("client")
+        self.scheduler.run_pending()
+        self.debouncer.request("contents")
+        self.scheduler.run_pending()
+        assert self.runs == [frozenset({"client"}), frozenset({"contents"})]
+
+    def test_flush_runs_pending_immediately(self):
+        self.debouncer.request("client")
+        self.debouncer.flush()
+        assert self.runs == [frozenset({"client"})]
+        assert not self.scheduler.scheduled
+
+    def test_flush_without_pending_request(self):
+        self.debouncer.flush()
+        assert not self.runs
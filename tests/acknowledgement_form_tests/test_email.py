@@ -134,3 +134,17 @@ def test_email_body(
     )
     email_body = email_generator.create_email_body()
     assert email_body == expected_body
+
+
+def test_email_body_reuses_created_parts():
+    email_generator = ConfirmationEmailGenerator(
+        client_name="ABC PTE LTD",
+        job_number="2308001",
+        contents=[Content("title1", ["desc1"])],
+    )
+    subject = email_generator.create_email_subject()
+    content_lines = email_generator.create_lines_from_contents()
+    assert (
+        email_generator.create_email_body(subject=subject, content_lines=content_lines)
+        == email_generator.create_email_body()
+    )
@@ -0,0 +1,50 @@
+from acknowledgement_form.form_generator.constants import Field
+from acknowledgement_form.form_generator.field_extractor import FieldExtractor
+
+SAMPLE_PAGE_TEXT = (
+    "NO.  MMSQ23-00553 SALES QUOTATION\n"
+    "Page No. 3Version :\n"
+    "BILL TO\n"
+    "ABC PTE LTD   \n"
+    "Vessel: Valaris 106\n"
+    "Class: ABS\n"
+    "Drawing No.: DWG-01\n"
+    "Duration:\n"
+    "5-6 working days upon receipt\n"
+    "Delivery: ex works\n"
+)
+
+
+def test_get_first_page_fields():
+    extractor = FieldExtractor(SAMPLE_PAGE_TEXT)
+    assert extractor.get_first_page_fields() == {
+        Field.CLIENT_NAME: "ABC PTE LTD",
+        Field.QUOTATION_NUM: "MMSQ23-00553 V3",
+        Field.VESSEL: "Valaris 106",
+        Field.CLASS: "ABS",
+        Field.DRAWING_NUM: "DWG-01",
+    }
+
+
+def test_get_duration():
+    extractor = FieldExtractor(SAMPLE_PAGE_TEXT)
+    assert extractor.has_duration
+    assert extractor.get_duration() == "5-6 working days"
+
+
+def test_get_duration_falls_back_to_delivery():
+    extractor = FieldExtractor("Duration:\nTBA\nDelivery: ex works")
+    assert extractor.get_duration() == "TBA"
+
+
+def test_missing_fields_use_defaults():
+    extractor = FieldExtractor("nothing to see here\n")
+    assert not extractor.has_duration
+    assert extractor.get_first_page_fields() == {
+        Field.CLIENT_NAME: "-",
+        Field.QUOTATION_NUM: "-",
+        Field.VESSEL: "N/A",
+        Field.CLASS: "Not Involved",
+        Field.DRAWING_NUM: "-",
+    }
+    assert extractor.get_duration() == "N/A"
@@ -0,0 +1,112 @@
+import os
+import time
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from acknowledgement_form.form_generator import quotation_reader
+from acknowledgement_form.form_generator.constants import Content, Field
+from acknowledgement_form.form_generator.quotation_cache import (
+    ParsedQuotation,
+    QuotationCache,
+)
+from acknowledgement_form.form_generator.quotation_reader import QuotationReader
+
+SAMPLE_PDF = "tests/acknowledgement_form_tests/test_files/sample_quo.pdf"
+
+PARSED_QUOTATION = ParsedQuotation(
+    pages_text=["page 1", "page 2"],
+    fields={Field.CLIENT_NAME: "ABC PTE LTD"},
+    contents=[Content("title1", ["desc1", "desc2"])],
+)
+
+
+class TestQuotationCache:
+    def setup_method(self):
+        self.tmpdir = TemporaryDirectory()
+        self.cache = QuotationCache(self.tmpdir.name)
+
+    def teardown_method(self):
+        self.tmpdir.cleanup()
+
+    def test_store_and_load(self):
+        self.cache.store("key", PARSED_QUOTATION)
+        assert self.cache.load("key") == PARSED_QUOTATION
+
+    def test_load_missing(self):
+        assert self.cache.load("missing") is None
+
+    def test_key_depends_on_parser_version(self):
+        assert self.cache.get_key(SAMPLE_PDF, 1) != self.cache.get_key(SAMPLE_PDF, 2)
+
+    def test_evicts_least_recently_used(self):
+        for key in ("first", "second"):
+            self.cache.store(key, PARSED_QUOTATION)
+        entry_size = os.path.getsize(os.path.join(self.tmpdir.name, "first.json"))
+        cache = QuotationCache(self.tmpdir.name, max_bytes=int(entry_size * 2.5))
+        past = time.time() - 60
+        os.utime(os.path.join(self.tmpdir.name, "first.json"), (past, past))
+        os.utime(os.path.join(self.tmpdir.name, "second.json"), (past, past - 60))
+        cache.load("second")
+        cache.store("third", PARSED_QUOTATION)
+        assert cache.load("first") is None
+        assert cache.load("second") == PARSED_QUOTATION
+        assert cache.load("third") == PARSED_QUOTATION
+
+    def test_discards_corrupt_entry(self):
+        with open(os.path.join(self.tmpdir.name, "corrupt.json"), "w") as entry:
+            entry.write("{not json")
+        assert self.cache.load("corrupt") is None
+        assert not os.path.exists(os.path.join(self.tmpdir.name, "corrupt.json"))
+
+    def test_unreadable_entry_is_a_miss(self):
+        os.mkdir(os.path.join(self.tmpdir.name, "directory.json"))
+        assert self.cache.load("directory") is None
+
+    def test_unusable_directory_disables_cache(self):
+        blocking_filepath = os.path.join(self.tmpdir.name, "file")
+        with open(blocking_filepath, "w") as blocking_file:
+            blocking_file.write("not a directory")
+        cache = QuotationCache(os.path.join(blocking_filepath, "cache"))
+        cache.store("key", PARSED_QUOTATION)
+        assert not cache.enabled
+        assert cache.load("key") is None
+
+
+def test_quotation_reader_served_from_cache(monkeypatch: pytest.MonkeyPatch):
+    with TemporaryDirectory() as tmpdir:
+        cache = QuotationCache(tmpdir)
+        first_reader = QuotationReader(SAMPLE_PDF, cache=cache)
+        expected_fields = first_reader.get_fields()
+        expected_contents = first_reader.get_content()
+
+        def fail_to_open(*args, **kwargs):
+            raise AssertionError("cached quotation should not be opened")
+
+        monkeypatch.setattr(quotation_reader, "PdfReader", fail_to_open)
+        cached_reader = QuotationReader(SAMPLE_PDF, cache=cache)
+        assert cached_reader.get_fields() == expected_fields
+        assert cached_reader.get_content() == expected_contents
+        assert cached_reader.get_content(description_lines=1) == [
+            Content(title, descriptions[:1])
+            for title, descriptions in expected_contents
+        ]
+
+
+def test_quotation_reader_cache_miss_extracts_needed_pages(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    with TemporaryDirectory() as tmpdir:
+        cache = QuotationCache(tmpdir)
+        first_reader = QuotationReader(SAMPLE_PDF, cache=cache)
+        expected_fields = first_reader.get_fields()
+        assert first_reader.pages_text.extracted_page_count == 1
+
+        def fail_to_open(*args, **kwargs):
+            raise AssertionError("cached fields should not open the quotation")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(quotation_reader, "PdfReader", fail_to_open)
+            cached_reader = QuotationReader(SAMPLE_PDF, cache=cache)
+            assert cached_reader.get_fields() == expected_fields
+        assert cached_reader.get_content() == first_reader.get_content()
@@ -3,10 +3,12 @@ from typing import Dict
 import pytest
 from pypdf import PdfReader
 
-from acknowledgement_form.form_generator.constants import Field
+from acknowledgement_form.form_generator.constants import Content, Field
 from acknowledgement_form.form_generator.quotation_reader import (
+    LazyPagesText,
     QuotationReader,
     get_client_name,
+    get_content,
     get_drawing_number,
     get_duration,
     get_quotation_number,
@@ -205,3 +207,64 @@ def test_get_fields_from_quotation(
 ):
     quotation_reader = QuotationReader(pdf_location)
     assert quotation_reader.get_fields() == expected_fields
+
+
+def test_get_fields_extracts_only_needed_pages():
+    quotation_reader = QuotationReader(
+        "tests/acknowledgement_form_tests/test_files/sample_quo.pdf"
+    )
+    pages_text = quotation_reader.pages_text
+    assert isinstance(pages_text, LazyPagesText)
+    quotation_reader.get_fields()
+    assert pages_text.extracted_page_count == 1
+    quotation_reader.get_content()
+    assert pages_text.extracted_page_count == 3
+
+
+def test_lazy_pages_text_matches_pdf_reader():
+    pdf_location = "tests/acknowledgement_form_tests/test_files/sample_quo_2.pdf"
+    reader = PdfReader(pdf_location)
+    quotation_reader = QuotationReader(pdf_location)
+    expected_pages_text = [page.extract_text() for page in reader.pages]
+    assert list(quotation_reader.pages_text) == expected_pages_text
+    assert quotation_reader.pages_text[-1] == expected_pages_text[-1]
+    assert quotation_reader.pages_text[1:] == expected_pages_text[1:]
+
+
+def test_get_content_from_quotation():
+    quotation_reader = QuotationReader(
+        "tests/acknowledgement_form_tests/test_files/sample_quo_2.pdf"
+    )
+    assert quotation_reader.get_content() == [
+        Content(
+            "Nickel Aluminium Bronze Propeller - 3 PCS",
+            ["5 Blades (2RH/1LH)", "(Dia): 1980mm"],
+        ),
+        Content("Class (BV) survey/certification fee", ["and material testing fee"]),
+    ]
+
+
+def test_get_content_duplicate_titles():
+    page_text = "1. A 1 PCS\nShaft\nfirst\n\n2. B 1 PCS\nShaft\nsecond\n"
+    assert get_content(page_text) == [
+        Content("Shaft", ["first"]),
+        Content("Shaft", ["second"]),
+    ]
+
+
+@pytest.mark.parametrize("description_lines", [0, 1, 3])
+def test_get_content_description_lines(description_lines: int):
+    page_text = "1. A 1 PCS\nTitle\nd1\nd2\nd3\nd4"
+    assert get_content(page_text, description_lines) == [
+        Content("Title", ["d1", "d2", "d3", "d4"][:description_lines])
+    ]
+
+
+def test_get_content_many_items():
+    page_text = "\n".join(
+        f"{index}. ITEM 1 PCS\ntitle {index}\ndescription {index}\n"
+        for index in range(1, 5001)
+    )
+    contents = get_content(page_text)
+    assert len(contents) == 5000
+    assert contents[-1] == Content("title 5000", ["description 5000"])
@@ -0,0 +1,364 @@
+import os
+import threading
+from tempfile import TemporaryDirectory, mkdtemp
+from typing import List, Optional, Sequence, Tuple, Union
+
+import pytest
+from pypdf import PdfReader, PdfWriter
+
+from excel_writer import pdf_export
+from excel_writer.pdf_export import (
+    ExcelSessionPdfBackend,
+    LibreOfficePdfBackend,
+    PdfExportJob,
+    Win32ComPdfBackend,
+)
+from excel_writer.writer import ExcelWriter
+
+
+class FakePdfBackend:
+    """Writes a PDF with a blank page per exported sheet"""
+
+    def __init__(self):
+        self.exports: List[Tuple[str, Sequence[PdfExportJob]]] = []
+        self.workbook_existed = False
+
+    def export(self, workbook_filepath: str, jobs: Sequence[PdfExportJob]) -> None:
+        self.workbook_existed = os.path.isfile(workbook_filepath)
+        self.exports.append((workbook_filepath, jobs))
+        for job in jobs:
+            pdf_writer = PdfWriter()
+            for _ in job.sheet_indices:
+                pdf_writer.add_blank_page(width=100, height=100)
+            with open(job.pdf_filepath, "wb") as pdf_file:
+                pdf_writer.write(pdf_file)
+
+    def close(self) -> None:
+        pass
+
+
+class StubExcelWorksheet:
+    def __init__(self, application: "StubExcelApplication", sheet_index: int):
+        self._application = application
+        self._sheet_index = sheet_index
+
+    def ExportAsFixedFormat(self, file_format: int, pdf_filepath: str) -> None:
+        if self._application.crash_on_next_export:
+            self._application.crash_on_next_export = False
+            self._application.crashed = True
+            raise OSError("RPC server unavailable")
+        if self._application.fail_exports:
+            raise ValueError("export failed")
+        self._application.exported.append((pdf_filepath, self._sheet_index))
+
+
+class StubSelectedWorksheets:
+    def __init__(self, workbook: "StubExcelWorkbook", sheet_numbers: List[int]):
+        self._workbook = workbook
+        self._sheet_numbers = sheet_numbers
+
+    def Select(self) -> None:
+        self._workbook.selected = [number - 1 for number in self._sheet_numbers]
+
+
+class StubActiveSheet:
+    def __init__(self, workbook: "StubExcelWorkbook"):
+        self._workbook = workbook
+
+    def ExportAsFixedFormat(self, file_format: int, pdf_filepath: str) -> None:
+        self._workbook.application.exported.append(
+            (pdf_filepath, tuple(self._workbook.selected))
+        )
+
+
+class StubExcelWorksheets(list):
+    workbook: "StubExcelWorkbook"
+
+    def __call__(self, sheet_numbers: List[int]) -> StubSelectedWorksheets:
+        return StubSelectedWorksheets(self.workbook, sheet_numbers)
+
+
+class StubExcelWorkbook:
+    def __init__(self, application: "StubExcelApplication"):
+        self.application = application
+        self.Worksheets = StubExcelWorksheets(
+            StubExcelWorksheet(application, index) for index in range(3)
+        )
+        self.Worksheets.workbook = self
+        self.ActiveSheet = StubActiveSheet(self)
+        self.selected: List[int] = []
+        self.Saved = False
+
+    def Close(self) -> None:
+        pass
+
+
+class StubExcelWorkbooks:
+    def __init__(self, application: "StubExcelApplication"):
+        self._application = application
+
+    @property
+    def Count(self) -> int:
+        if self._application.crashed:
+            raise OSError("RPC server unavailable")
+        return 0
+
+    def Open(self, workbook_filepath: str) -> StubExcelWorkbook:
+        self._application.opened.append(workbook_filepath)
+        return StubExcelWorkbook(self._application)
+
+
+class StubExcelApplication:
+    def __init__(self):
+        self.crash_on_next_export = False
+        self.fail_exports = False
+        self.Workbooks = StubExcelWorkbooks(self)
+        self.opened: List[str] = []
+        self.exported: List[Tuple[str, Union[int, Tuple[int, ...]]]] = []
+        self.crashed = False
+        self.quit = False
+
+    def Quit(self) -> None:
+        self.quit = True
+
+
+class StubLibreOfficePdfBackend(LibreOfficePdfBackend):
+    def __init__(self):
+        super().__init__()
+        self.office_starts = 0
+        self.converted: List[PdfExportJob] = []
+        self.worker_threads = set()
+        self.office_running = False
+
+    def _is_office_running(self) -> bool:
+        return self.office_running
+
+    def _start_office(self) -> None:
+        self.office_starts += 1
+        self.office_running = True
+
+    def _stop_office(self) -> None:
+        self.office_running = False
+
+    def _convert(self, workbook_filepath: str, jobs: Sequence[PdfExportJob]) -> None:
+        self.worker_threads.add(threading.get_ident())
+        if workbook_filepath == "crash.xlsx":
+            self.office_running = False
+            raise RuntimeError("soffice crashed")
+        self.converted.extend(jobs)
+
+
+class TestExportAsPdf:
+    def setup_method(self):
+        self.writer = ExcelWriter(default_sheet_name="first")
+        self.writer.create_sheet("second")
+        self.backend = FakePdfBackend()
+
+    def test_export_sheet_by_name(self):
+        with TemporaryDirectory() as tmpdir:
+            self.writer.export_as_pdf(
+                tmpdir, "out.pdf", sheet="second", backend=self.backend
+            )
+            [(workbook_filepath, jobs)] = self.backend.exports
+        assert jobs == [PdfExportJob((1,), os.path.join(tmpdir, "out.pdf"))]
+        assert workbook_filepath.endswith("out.xlsx")
+
+    def test_temporary_workbook_removed(self):
+        with TemporaryDirectory() as tmpdir:
+            self.writer.export_as_pdf(tmpdir, "out.pdf", backend=self.backend)
+        [(workbook_filepath, _)] = self.backend.exports
+        assert self.backend.workbook_existed
+        assert not os.path.exists(workbook_filepath)
+
+    def test_temporary_directory_removed_when_save_fails(self, monkeypatch):
+        temporary_directories = []
+
+        def record_mkdtemp() -> str:
+            temporary_directories.append(mkdtemp())
+            return temporary_directories[-1]
+
+        def fail_write(*args, **kwargs) -> None:
+            raise OSError("disk full")
+
+        monkeypatch.setattr("excel_writer.writer.mkdtemp", record_mkdtemp)
+        monkeypatch.setattr(self.writer, "_write_to_stream", fail_write)
+        with TemporaryDirectory() as tmpdir, pytest.raises(OSError):
+            self.writer.export_as_pdf(tmpdir, "out.pdf", backend=self.backend)
+        assert not os.path.exists(temporary_directories[0])
+
+    @pytest.mark.parametrize(
+        "sheets, expected_sheet_indices",
+        [(["second", "first"], (1, 0)), (None, (0, 1, 2))],
+    )
+    def test_export_sheets_into_one_pdf(
+        self, sheets: Optional[List[str]], expected_sheet_indices: Tuple[int, ...]
+    ):
+        self.writer.create_sheet("third")
+        with TemporaryDirectory() as tmpdir:
+            self.writer.export_as_pdf(
+                tmpdir, "out.pdf", sheet=sheets, backend=self.backend
+            )
+        [(_, [job])] = self.backend.exports
+        assert job.sheet_indices == expected_sheet_indices
+
+    def test_export_pdfs_from_one_saved_copy(self):
+        with TemporaryDirectory() as tmpdir:
+            first_pdf = os.path.join(tmpdir, "first.pdf")
+            both_pdf = os.path.join(tmpdir, "both.pdf")
+            merged_pdf = os.path.join(tmpdir, "merged.pdf")
+            self.writer.export_pdfs(
+                [("first", first_pdf), ([0, 1], both_pdf)],
+                backend=self.backend,
+                merged_pdf_filepath=merged_pdf,
+            )
+            merged_page_count = len(PdfReader(merged_pdf).pages)
+        [(_, jobs)] = self.backend.exports
+        assert jobs == [PdfExportJob((0,), first_pdf), PdfExportJob((0, 1), both_pdf)]
+        assert merged_page_count == 3
+
+    def test_export_pdfs_without_jobs(self):
+        with pytest.raises(ValueError):
+            self.writer.export_pdfs([], backend=self.backend)
+
+
+class TestExcelPdfExporter:
+    def setup_method(self):
+        self.applications: List[StubExcelApplication] = []
+
+    def create_application(self) -> StubExcelApplication:
+        application = StubExcelApplication()
+        self.applications.append(application)
+        return application
+
+    def test_exports_share_one_application(self):
+        writers = [
+            ExcelWriter(default_sheet_name=f"sheet{index}") for index in range(3)
+        ]
+        with ExcelWriter.pdf_exporter(self.create_application) as exporter:
+            for index, writer in enumerate(writers):
+                writer.export_as_pdf("", f"{index}.pdf", backend=exporter)
+        [application] = self.applications
+        assert application.exported == [(f"{index}.pdf", 0) for index in range(3)]
+        assert application.quit
+
+    def test_application_restarted_after_crash(self):
+        writer = ExcelWriter(default_sheet_name="first")
+        writer.create_sheet("second")
+        with ExcelWriter.pdf_exporter(self.create_application) as exporter:
+            writer.export_as_pdf("", "first.pdf", sheet=0, backend=exporter)
+            self.applications[0].crash_on_next_export = True
+            writer.export_as_pdf("", "second.pdf", sheet=1, backend=exporter)
+        crashed_application, restarted_application = self.applications
+        assert crashed_application.exported == [("first.pdf", 0)]
+        assert restarted_application.exported == [("second.pdf", 1)]
+        assert restarted_application.quit
+
+    def test_grouped_sheets_exported_together(self):
+        writer = ExcelWriter(default_sheet_name="first")
+        writer.create_sheet("second")
+        with ExcelWriter.pdf_exporter(self.create_application) as exporter:
+            writer.export_pdfs(
+                [(0, "first.pdf"), (None, "workbook.pdf")], backend=exporter
+            )
+        [application] = self.applications
+        assert len(application.opened) == 1
+        assert application.exported == [("first.pdf", 0), ("workbook.pdf", (0, 1))]
+
+    def test_export_error_raised_when_application_alive(self):
+        writer = ExcelWriter(default_sheet_name="first")
+        with ExcelWriter.pdf_exporter(self.create_application) as exporter:
+            writer.export_as_pdf("", "first.pdf", backend=exporter)
+            self.applications[0].fail_exports = True
+            with pytest.raises(ValueError):
+                writer.export_as_pdf("", "second.pdf", backend=exporter)
+        assert len(self.applications) == 1
+
+
+class TestWin32ComPdfBackend:
+    def test_exports_through_new_application(self):
+        application = StubExcelApplication()
+        backend = Win32ComPdfBackend(lambda: application)
+        backend.export("book.xlsx", [PdfExportJob((1,), "book.pdf")])
+        assert application.exported == [("book.pdf", 1)]
+        assert application.quit
+
+    def test_export_error_raised(self):
+        application = StubExcelApplication()
+        application.fail_exports = True
+        writer = ExcelWriter(default_sheet_name="first")
+        with TemporaryDirectory() as tmpdir:
+            with pytest.raises(ValueError):
+                writer.export_pdfs(
+                    [(0, os.path.join(tmpdir, "first.pdf"))],
+                    backend=Win32ComPdfBackend(lambda: application),
+                    merged_pdf_filepath=os.path.join(tmpdir, "merged.pdf"),
+                )
+            assert not os.listdir(tmpdir)
+        assert application.quit
+
+
+@pytest.mark.skipif(pdf_export.client is not None, reason="win32com is installed")
+def test_excel_backend_unavailable_without_win32com():
+    with pytest.raises(RuntimeError):
+        ExcelSessionPdfBackend().export("book.xlsx", [PdfExportJob((0,), "book.pdf")])
+
+
+class TestLibreOfficePdfBackend:
+    def setup_method(self):
+        self.backend = StubLibreOfficePdfBackend()
+
+    def teardown_method(self):
+        self.backend.close()
+
+    def test_conversions_share_one_office_process(self):
+        jobs = [PdfExportJob((index,), f"{index}.pdf") for index in range(5)]
+        results = [self.backend.export_async("book.xlsx", [job]) for job in jobs]
+        for result in results:
+            result.result(timeout=5)
+        assert self.backend.office_starts == 1
+        assert self.backend.converted == jobs
+        assert len(self.backend.worker_threads) == 1
+
+    def test_office_restarted_after_crash(self):
+        job = PdfExportJob((0,), "book.pdf")
+        with pytest.raises(RuntimeError):
+            self.backend.export("crash.xlsx", [job])
+        self.backend.export("book.xlsx", [job])
+        assert self.backend.office_starts == 2
+        assert self.backend.converted == [job]
+
+    def test_close_stops_office(self):
+        self.backend.export("book.xlsx", [PdfExportJob((0,), "book.pdf")])
+        self.backend.close()
+        assert not self.backend.office_running
+
+
+class StubDesktop:
+    def __init__(self):
+        self.terminated = False
+
+    def terminate(self) -> None:
+        self.terminated = True
+
+
+class StubExitedProcess:
+    def poll(self) -> Optional[int]:
+        return 1
+
+    def wait(self, timeout: Optional[float] = None) -> int:
+        return 1
+
+
+def test_office_backends_use_separate_pipes():
+    first, second = LibreOfficePdfBackend(), LibreOfficePdfBackend()
+    assert first._pipe_name != second._pipe_name
+
+
+def test_office_not_terminated_when_not_started_here():
+    backend = LibreOfficePdfBackend()
+    desktop = StubDesktop()
+    backend._desktop = desktop
+    backend._process = StubExitedProcess()  # type: ignore
+    backend._stop_office()
+    assert not desktop.terminated
+    assert backend._process is None
@@ -1,15 +1,30 @@
 import os
+from datetime import datetime
+from io import BytesIO
 from tempfile import TemporaryDirectory
-from typing import Tuple
+from typing import Optional, Tuple
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
 
+import numpy as np
+import pandas as pd
 import pytest
-from openpyxl.styles import Font
+from openpyxl import load_workbook
+from openpyxl.styles import Alignment, Border, Font, PatternFill
 
 from excel_writer.writer import (
     DEFAULT_COLUMN_WIDTH,
     DEFAULT_ROW_HEIGHT,
     CellRange,
+    CellStyle,
     ExcelWriter,
+    StyleCacheStats,
+)
+
+RED_STYLE = CellStyle(
+    font=Font(color="FF0000"),
+    fill=PatternFill(),
+    border=Border(),
+    alignment=Alignment(),
 )
 
 
@@ -92,12 +107,374 @@ class TestExcelWriter:
             == DEFAULT_COLUMN_WIDTH
         )
 
+    def test_move_range_skips_default_dimensions(self):
+        self.writer.active_sheet.row_dimensions[3].height = 30  # type: ignore
+        cell_range = CellRange(start_row=1, end_row=50, start_column=1, end_column=20)
+        self.writer.move_range(0, cell_range, rows_to_move=100)
+        assert set(self.writer.active_sheet.row_dimensions) == {3, 103}
+        assert self.writer.active_sheet.row_dimensions[103].height == 30  # type: ignore
+        assert not self.writer.active_sheet.column_dimensions
+
+    def test_move_range_resets_destination_dimensions(self):
+        self.writer.active_sheet.row_dimensions[8].height = 40  # type: ignore
+        self.writer.active_sheet.column_dimensions["C"].width = 40
+        cell_range = CellRange(start_row=1, end_row=3, start_column=1, end_column=1)
+        self.writer.move_range(0, cell_range, rows_to_move=5, columns_to_move=2)
+        assert self.writer.active_sheet.row_dimensions[8].height == DEFAULT_ROW_HEIGHT  # type: ignore
+        assert (
+            self.writer.active_sheet.column_dimensions["C"].width
+            == DEFAULT_COLUMN_WIDTH
+        )
+
+    def test_deferred_dimension_moves_collapse_chained_moves(self):
+        self.writer.active_sheet.row_dimensions[1].height = 30  # type: ignore
+        cell_range = CellRange(start_row=1, end_row=2, start_column=1, end_column=2)
+        with self.writer.deferred_dimension_moves(0):
+            moved_range = self.writer.move_range(0, cell_range, rows_to_move=100)
+            assert self.writer.active_sheet.row_dimensions[1].height == 30  # type: ignore
+            self.writer.move_range(0, moved_range, rows_to_move=-97)
+        assert set(self.writer.active_sheet.row_dimensions) == {1, 4}
+        assert self.writer.active_sheet.row_dimensions[4].height == 30  # type: ignore
+        assert self.writer.active_sheet.row_dimensions[1].height == DEFAULT_ROW_HEIGHT  # type: ignore
+
+    def test_deferred_dimension_moves_drop_cancelled_moves(self):
+        self.writer.active_sheet.column_dimensions["B"].width = 50
+        cell_range = CellRange(start_row=1, end_row=2, start_column=1, end_column=2)
+        with self.writer.deferred_dimension_moves(0):
+            moved_range = self.writer.move_range(0, cell_range, columns_to_move=10)
+            self.writer.move_range(0, moved_range, columns_to_move=-10)
+        assert list(self.writer.active_sheet.column_dimensions) == ["B"]
+        assert self.writer.active_sheet.column_dimensions["B"].width == 50
+
+    def test_deferred_dimension_moves_applied_on_error(self):
+        self.writer.active_sheet.row_dimensions[1].height = 30  # type: ignore
+        cell_range = CellRange(start_row=1, end_row=2, start_column=1, end_column=2)
+        with pytest.raises(RuntimeError):
+            with self.writer.deferred_dimension_moves(0):
+                self.writer.move_range(0, cell_range, rows_to_move=3)
+                raise RuntimeError("failed after moving")
+        assert self.writer.active_sheet.row_dimensions[4].height == 30  # type: ignore
+        assert self.writer.active_sheet.row_dimensions[1].height == DEFAULT_ROW_HEIGHT  # type: ignore
+
     def test_get_cell_style(self):
         ft = Font(color="FF0000")
         self.writer.cell(0, "A1").font = ft
         cell_style = self.writer.cell_style(0, "A1")
         assert cell_style.font == ft
 
+    @pytest.mark.parametrize(
+        "rows",
+        [
+            [[1, 2, 3], [4, 5, 6]],
+            ((1, 2, 3), (4, 5, 6)),
+            np.array([[1, 2, 3], [4, 5, 6]]),
+            pd.DataFrame([[1, 2, 3], [4, 5, 6]]),
+        ],
+    )
+    def test_write_block(self, rows):
+        written_range = self.writer.write_block(0, "B2", rows)
+        assert written_range == CellRange(
+            start_row=2, start_column=2, end_row=3, end_column=4
+        )
+        assert self.writer.cell(0, "B2").value == 1
+        assert self.writer.cell(0, "D3").value == 6
+
+    def test_write_block_generator_rows(self):
+        rows = ([index, index * 2] for index in range(1000))
+        written_range = self.writer.write_block(0, (1, 1), rows)
+        assert written_range.notation == "A1:B1000"
+        assert self.writer.cell(0, "B1000").value == 1998
+
+    def test_write_block_single_style(self):
+        self.writer.write_block(0, "A1", [["a", "b"]], styles=RED_STYLE)
+        assert self.writer.cell_style(0, "B1").font == RED_STYLE.font
+
+    def test_write_block_row_styles(self):
+        self.writer.write_block(
+            0, "A1", [["a", "b"], ["c", "d"], ["e", "f"]], styles=[RED_STYLE, None]
+        )
+        assert self.writer.cell_style(0, "B1").font == RED_STYLE.font
+        assert self.writer.cell_style(0, "B2").font != RED_STYLE.font
+        assert self.writer.cell_style(0, "B3").font != RED_STYLE.font
+
+    def test_write_block_cell_styles(self):
+        self.writer.write_block(0, "A1", [["a", "b"]], styles=[[None, RED_STYLE]])
+        assert self.writer.cell_style(0, "A1").font != RED_STYLE.font
+        assert self.writer.cell_style(0, "B1").font == RED_STYLE.font
+
+    def test_write_block_skips_none_values(self):
+        self.writer.cell(0, "B1", set_value="keep")
+        self.writer.write_block(0, "A1", [["a", None]])
+        assert self.writer.cell(0, "B1").value == "keep"
+
+    def test_write_block_frame_values(self):
+        self.writer.cell(0, "B1", set_value="keep")
+        frame = pd.DataFrame(
+            {
+                "count": np.array([1], dtype=np.int32),
+                "amount": [np.nan],
+                "date": pd.Series([pd.NaT]),
+            }
+        )
+        self.writer.write_block(0, "A1", frame)
+        assert type(self.writer.cell(0, "A1").value) is int
+        assert self.writer.cell(0, "B1").value == "keep"
+        assert self.writer.cell(0, "C1").value is None
+
+    def test_style_cache_registers_style_once(self):
+        self.writer.write_block(0, "A1", [["a"]] * 100, styles=RED_STYLE)
+        assert self.writer.style_cache_stats == StyleCacheStats(hits=99, misses=1)
+        assert self.writer.cell_style(0, "A100").font == RED_STYLE.font
+
+    def test_read_style_is_interned(self):
+        self.writer.cell(0, "A1", set_value="a", set_style=RED_STYLE)
+        self.writer.cell(0, "A2", set_value="b", set_style=RED_STYLE)
+        style = self.writer.cell_style(0, "A1")
+        assert style == self.writer.cell_style(0, "A2")
+        self.writer.cell(0, "A3", set_value="c", set_style=style)
+        assert self.writer.style_cache_stats == StyleCacheStats(hits=2, misses=1)
+
+    def test_read_style_is_shared(self):
+        self.writer.cell(0, "A1", set_value="a", set_style=RED_STYLE)
+        self.writer.cell(0, "A2", set_value="b", set_style=RED_STYLE)
+        assert self.writer.cell_style(0, "A1") is self.writer.cell_style(0, "A2")
+
+    def test_copied_style_is_independent(self):
+        self.writer.cell(0, "A1", set_value="a", set_style=RED_STYLE)
+        self.writer.cell(0, "A2", set_value="b", set_style=RED_STYLE)
+        style = self.writer.cell_style(0, "A1").copy()
+        style.font.bold = True
+        assert not self.writer.cell_style(0, "A2").font.bold
+        assert not self.writer.cell(0, "A1").font.bold
+        assert not RED_STYLE.font.bold
+
+    def test_clone_is_independent(self):
+        self.writer.cell(0, "A1", set_value="original")
+        self.writer.active_sheet.row_dimensions[1].height = 30  # type: ignore
+        clone = self.writer.clone()
+        clone.cell(0, "A1", set_value="cloned")
+        clone.active_sheet.row_dimensions[2].height = 40  # type: ignore
+        assert self.writer.cell(0, "A1").value == "original"
+        assert clone.active_sheet.row_dimensions[1].height == 30  # type: ignore
+        assert 2 not in self.writer.active_sheet.row_dimensions
+
+    def test_write_block_empty_rows(self):
+        with pytest.raises(ValueError):
+            self.writer.write_block(0, "A1", [])
+
+    def test_save_to_bytes(self):
+        self.writer.cell(0, "A1", set_value="in memory")
+        saved = load_workbook(BytesIO(self.writer.save_to_bytes()))
+        assert saved.active["A1"].value == "in memory"  # type: ignore
+
+    @pytest.mark.parametrize(
+        "compression_level, expected_compression", [(0, ZIP_STORED), (9, ZIP_DEFLATED)]
+    )
+    def test_save_to_stream_compression(
+        self, compression_level: int, expected_compression: int
+    ):
+        workbook_stream = BytesIO()
+        self.writer.save_to_stream(workbook_stream, compression_level)
+        with ZipFile(workbook_stream) as archive:
+            compress_types = {info.compress_type for info in archive.infolist()}
+        assert compress_types == {expected_compression}
+        assert not workbook_stream.closed
+
+    def test_save_to_stream_invalid_compression_level(self):
+        with pytest.raises(ValueError):
+            self.writer.save_to_bytes(compression_level=10)
+
+    @pytest.mark.parametrize("values, expected_label", [(False, None), (True, "label")])
+    def test_clone_sheet(self, values: bool, expected_label: Optional[str]):
+        self.writer.cell(0, "A1", set_value="label", set_style=RED_STYLE)
+        self.writer.cell(0, "B1", set_value="=SUM(C1:C2)")
+        source_sheet = self.writer.active_sheet
+        source_sheet.row_dimensions[1].height = 30
+        source_sheet.column_dimensions["B"].width = 20
+        source_sheet.merge_cells("A3:B3")
+        self.writer.set_print_area(0, "A1:B3")
+        source_sheet.page_setup.orientation = "landscape"
+
+        self.writer.clone_sheet(0, "clone", 0, values=values)
+
+        assert self.writer.worksheets == ("clone", "original_sheet")
+        assert self.writer.active_sheet.title == "clone"
+        assert self.writer.cell("clone", "A1").value == expected_label
+        assert self.writer.cell("clone", "B1").value == "=SUM(C1:C2)"
+        assert self.writer.cell_style("clone", "A1") == RED_STYLE
+        clone_sheet = self.writer.get_worksheet("clone")
+        assert clone_sheet.row_dimensions[1].height == 30
+        assert clone_sheet.column_dimensions["B"].width == 20
+        assert clone_sheet.row_dimensions[1].parent is clone_sheet
+        assert clone_sheet.column_dimensions["B"].parent is clone_sheet
+        assert [str(merged) for merged in clone_sheet.merged_cells.ranges] == ["A3:B3"]
+        assert self.writer.get_print_area("clone") == "'clone'!$A$1:$B$3"
+        assert clone_sheet.page_setup.orientation == "landscape"
+
+    def test_clone_sheet_is_independent(self):
+        self.writer.cell(0, "A1", set_value="original", set_style=RED_STYLE)
+        source_sheet = self.writer.active_sheet
+        self.writer.clone_sheet(0, "clone", values=True)
+        self.writer.cell("clone", "A1", set_value="changed")
+        self.writer.get_worksheet("clone").row_dimensions[1].height = 40
+        assert self.writer.cell(0, "A1").value == "original"
+        assert source_sheet.row_dimensions[1].height is None
+        saved = load_workbook(BytesIO(self.writer.save_to_bytes()))
+        assert saved["clone"]["A1"].value == "changed"
+        assert saved["original_sheet"]["A1"].font.color.rgb == "00FF0000"
+
+    def test_clone_sheet_existing_name(self):
+        self.writer.create_sheet("other")
+        with pytest.raises(ValueError):
+            self.writer.clone_sheet(0, "other")
+
+
+class TestStreamingExcelWriter:
+    def setup_method(self):
+        self.writer = ExcelWriter(default_sheet_name="stream", streaming=True)
+
+    def test_streaming_default_sheet(self):
+        assert self.writer.worksheets == ("stream",)
+
+    def test_append_rows_saved(self):
+        rows = ([index, f"row {index}"] for index in range(1, 501))
+        appended = self.writer.append_rows(0, rows, styles=[RED_STYLE])
+        self.writer.set_print_area(0, "A1:B500")
+        with TemporaryDirectory() as tmpdir:
+            self.writer.save_workbook(filepath=tmpdir, filename="stream.xlsx")
+            saved = ExcelWriter(os.path.join(tmpdir, "stream.xlsx"))
+        assert appended == 500
+        assert saved.cell(0, "B500").value == "row 500"
+        assert saved.cell_style(0, "A1").font.color == RED_STYLE.font.color
+        assert saved.cell_style(0, "A2").font.color != RED_STYLE.font.color
+        assert saved.get_print_area(0) == "'stream'!$A$1:$B$500"
+
+    def test_cell_unavailable_when_streaming(self):
+        with pytest.raises(ValueError):
+            self.writer.cell(0, "A1")
+
+    def test_move_range_unavailable_when_streaming(self):
+        with pytest.raises(ValueError):
+            self.writer.move_range(0, CellRange(1, 1, 2, 2), rows_to_move=1)
+
+    def test_streaming_save_to_bytes(self):
+        self.writer.append_rows(0, [["streamed"]])
+        saved = load_workbook(BytesIO(self.writer.save_to_bytes()))
+        assert saved["stream"]["A1"].value == "streamed"
+
+    def test_streaming_existing_workbook_rejected(self):
+        with pytest.raises(ValueError):
+            ExcelWriter("existing.xlsx", streaming=True)
+
+
+class TestFrames:
+    def setup_method(self):
+        self.writer = ExcelWriter(default_sheet_name="frames")
+        self.frame = pd.DataFrame(
+            {
+                "count": [1, 2, 3],
+                "amount": [1.5, np.nan, 2.0],
+                "date": pd.to_datetime(pd.Series(["2023-06-19", None, "2023-06-25"])),
+                "name": ["a", None, "c"],
+            }
+        )
+
+    def test_write_frame(self):
+        written_range = self.writer.write_frame(
+            0, "B2", self.frame, styles=RED_STYLE, header_style=RED_STYLE
+        )
+        assert written_range.notation == "B2:E5"
+        assert [self.writer.cell(0, (2, column)).value for column in range(2, 6)] == [
+            "count",
+            "amount",
+            "date",
+            "name",
+        ]
+        assert type(self.writer.cell(0, "B3").value) is int
+        assert self.writer.cell(0, "C4").value is None
+        assert self.writer.cell(0, "D3").value == datetime(2023, 6, 19)
+        assert self.writer.cell_style(0, "E5").font == RED_STYLE.font
+
+    def test_frame_round_trip(self):
+        self.writer.write_frame(0, "B2", self.frame)
+        frame = self.writer.read_frame(0, "B2:E5")
+        assert frame["count"].dtype == np.int64
+        assert frame["amount"].dtype == np.float64
+        assert pd.api.types.is_datetime64_dtype(frame["date"].dtype)
+        assert frame["date"].isna().tolist() == [False, True, False]
+        assert frame["name"].tolist()[::2] == ["a", "c"]
+        assert frame["count"].tolist() == [1, 2, 3]
+
+    def test_read_frame_without_header(self):
+        self.writer.write_frame(0, (1, 1), self.frame, header=False)
+        frame = self.writer.read_frame(0, header=False)
+        assert list(frame.columns) == ["A", "B", "C", "D"]
+        assert len(frame) == 3
+
+    def test_read_frame_creates_no_cells(self):
+        self.writer.cell(0, "A1", set_value="only")
+        self.writer.cell(0, "D4", set_value="corner")
+        frame = self.writer.read_frame(0, "A1:J100", header=False)
+        assert frame.shape == (100, 10)
+        assert len(self.writer.active_sheet._cells) == 2
+
+    def test_read_frame_read_only(self):
+        self.writer.write_frame(0, "A1", self.frame)
+        with TemporaryDirectory() as tmpdir:
+            self.writer.save_workbook(filepath=tmpdir, filename="frames.xlsx")
+            reader = ExcelWriter(os.path.join(tmpdir, "frames.xlsx"), read_only=True)
+            frame = reader.read_frame(0)
+            reader.close()
+        assert frame["amount"].isna().tolist() == [False, True, False]
+        assert frame["name"].iloc[2] == "c"
+
+    def test_append_frame_rows_when_streaming(self):
+        writer = ExcelWriter(streaming=True)
+        writer.append_rows(0, self.frame)
+        saved = load_workbook(BytesIO(writer.save_to_bytes()))
+        assert saved.active["B2"].value is None  # type: ignore
+        assert saved.active["C1"].value == datetime(2023, 6, 19)  # type: ignore
+
+
+class TestLoadExistingWorkbook:
+    sheet_location = os.path.join("tests", "test_files", "sample_weekly_stats.xlsx")
+
+    def test_read_only(self):
+        writer = ExcelWriter(self.sheet_location, read_only=True)
+        assert writer.worksheets[:2] == ("Week 24", "Week 23")
+        assert writer.cell("Week 23", "D2").value == "WEEK 23 (05~11/06/2023)"
+        writer.close()
+
+    def test_read_only_cannot_be_saved(self):
+        writer = ExcelWriter(self.sheet_location, read_only=True)
+        with pytest.raises(ValueError):
+            writer.save_to_bytes()
+        writer.close()
+
+    @pytest.mark.parametrize("read_only", [True, False])
+    def test_load_sheet_subset(self, read_only: bool):
+        writer = ExcelWriter(
+            self.sheet_location, read_only=read_only, sheets=["Week 23", "Week 21"]
+        )
+        assert writer.worksheets == ("Week 23", "Week 21")
+        assert writer.cell(1, "D2").value == "WEEK 21 (22~28/05/2023)"
+        writer.close()
+
+    def test_load_sheet_subset_keeps_print_area(self):
+        writer = ExcelWriter(self.sheet_location, sheets=["Week 23"])
+        assert writer.get_print_area(0) == "'Week 23'!$A$1:$G$162"
+
+    def test_sheet_subset_cannot_be_saved(self):
+        writer = ExcelWriter(self.sheet_location, sheets=["Week 23"])
+        with pytest.raises(ValueError):
+            writer.save_to_bytes()
+        with pytest.raises(ValueError):
+            writer.clone().save_to_bytes()
+
+    def test_load_missing_sheet(self):
+        with pytest.raises(ValueError):
+            ExcelWriter(self.sheet_location, sheets=["Week 99"])
+
 
 @pytest.mark.parametrize(
     "start_row, start_column, end_row, end_column, expected_notation",
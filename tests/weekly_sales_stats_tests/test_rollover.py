@@ -0,0 +1,216 @@
+import os
+import shutil
+from tempfile import TemporaryDirectory
+from zipfile import ZipFile
+
+import pytest
+from openpyxl import Workbook, load_workbook
+from openpyxl.comments import Comment
+from openpyxl.formatting.rule import CellIsRule
+from openpyxl.worksheet.datavalidation import DataValidation
+from openpyxl.worksheet.hyperlink import Hyperlink
+from openpyxl.worksheet.worksheet import Worksheet
+
+from excel_writer.package import insert_sheet, read_sheet_names
+from weekly_sales_stats.rollover import roll_over_workbook, roll_over_workbooks
+from weekly_sales_stats.stats_creator import WeeklySalesStatsGenerator
+
+SAMPLE_FILEPATH = os.path.join("tests", "test_files", "sample_weekly_stats.xlsx")
+
+
+class TestRollOverWorkbook:
+    def setup_method(self):
+        self.tmpdir = TemporaryDirectory()
+        self.output_filepath = os.path.join(self.tmpdir.name, "rolled.xlsx")
+
+    def teardown_method(self):
+        self.tmpdir.cleanup()
+
+    def test_new_week_tab_added_first_and_active(self):
+        new_tab_name = roll_over_workbook(
+            SAMPLE_FILEPATH, self.output_filepath, year=2023
+        )
+        workbook = load_workbook(self.output_filepath)
+        assert new_tab_name == "Week 25"
+        assert workbook.sheetnames[:2] == ["Week 25", "Week 24"]
+        assert workbook.active.title == "Week 25"  # type: ignore
+        assert workbook["Week 25"]["D2"].value == "Week 25 (19~25/06/2023)"
+        selected_tabs = [
+            worksheet.title
+            for worksheet in workbook.worksheets
+            if worksheet.views.sheetView[0].tabSelected
+        ]
+        assert selected_tabs == ["Week 25"]
+
+    def test_new_week_tab_copies_latest_tab(self):
+        roll_over_workbook(SAMPLE_FILEPATH, self.output_filepath, year=2023)
+        workbook = load_workbook(self.output_filepath)
+        new_sheet, latest_sheet = workbook["Week 25"], workbook["Week 24"]
+        assert new_sheet["B2"].value == latest_sheet["B2"].value
+        assert new_sheet["D2"].style_id == latest_sheet["D2"].style_id
+        assert new_sheet.print_area == "'Week 25'!$A$1:$G$157"
+        assert new_sheet.column_dimensions["F"].width == (
+            latest_sheet.column_dimensions["F"].width
+        )
+        with ZipFile(self.output_filepath) as archive:
+            [new_sheet_part] = [
+                archive.read(name)
+                for name in archive.namelist()
+                if b"Week 25 (19~25/06/2023)" in archive.read(name)
+            ]
+        # the copy has no relationships part, so it must not link to one
+        assert b"r:id=" not in new_sheet_part
+
+    def test_existing_sheets_unchanged(self):
+        roll_over_workbook(SAMPLE_FILEPATH, self.output_filepath, year=2023)
+        original = load_workbook(SAMPLE_FILEPATH)
+        rolled = load_workbook(self.output_filepath)
+        assert rolled.sheetnames[1:] == original.sheetnames
+        for sheet_name in ("Week 24", "Week 07"):
+            assert rolled[sheet_name].print_area == original[sheet_name].print_area
+            assert rolled[sheet_name]["B2"].value == original[sheet_name]["B2"].value
+
+    def test_year_of_summary_date(self):
+        roll_over_workbook(SAMPLE_FILEPATH, self.output_filepath, year=2024)
+        workbook = load_workbook(self.output_filepath)
+        assert workbook["Week 25"]["D2"].value == "Week 25 (17~23/06/2024)"
+
+    def test_template_values_added_to_missing_cells(self):
+        workbook = Workbook()
+        template_sheet = workbook.active
+        template_sheet.title = "template"  # type: ignore
+        template_sheet["A1"] = "kept"  # type: ignore
+        template_sheet["F2"] = 1  # type: ignore
+        template_sheet["A3"] = "=F2*2"  # type: ignore
+        workbook.save(self.output_filepath)
+
+        insert_sheet(
+            self.output_filepath,
+            "copy",
+            {"D2": "before F2", "G2": "after F2", "B5": "new row"},
+            template_sheet="template",
+        )
+
+        new_sheet = load_workbook(self.output_filepath)["copy"]
+        assert [
+            new_sheet[cell].value for cell in ("A1", "D2", "F2", "G2", "A3", "B5")
+        ] == ["kept", "before F2", 1, "after F2", "=F2*2", "new row"]
+
+    def test_template_not_selected(self):
+        workbook = Workbook()
+        workbook.active.title = "first"  # type: ignore
+        template_sheet = workbook.create_sheet("template")
+        template_sheet.sheet_view.tabSelected = False  # written as tabSelected="0"
+        workbook.save(self.output_filepath)
+
+        insert_sheet(self.output_filepath, "copy", {}, template_sheet="template")
+
+        rolled = load_workbook(self.output_filepath)
+        selected_tabs = [
+            worksheet.title
+            for worksheet in rolled.worksheets
+            if worksheet.views.sheetView[0].tabSelected
+        ]
+        assert selected_tabs == ["copy"]
+
+    def test_same_copy_as_stats_generator(self):
+        workbook = Workbook()
+        latest_sheet = workbook.active
+        latest_sheet.title = "Week 24"  # type: ignore
+        workbook.create_sheet("Week 23")
+        latest_sheet["A1"] = "label"  # type: ignore
+        latest_sheet["A2"] = "=A1"  # type: ignore
+        latest_sheet["B1"].hyperlink = "https://example.com"  # type: ignore
+        latest_sheet["B2"].hyperlink = Hyperlink(  # type: ignore
+            ref="B2", location="'Week 23'!A1"
+        )
+        latest_sheet["A1"].comment = Comment("note", "staff")  # type: ignore
+        latest_sheet.conditional_formatting.add(  # type: ignore
+            "C1:C5", CellIsRule(operator="greaterThan", formula=["1"])
+        )
+        validation = DataValidation(type="whole")
+        validation.add("D1:D5")
+        latest_sheet.add_data_validation(validation)  # type: ignore
+        latest_sheet.freeze_panes = "A2"  # type: ignore
+        workbook.save(self.output_filepath)
+        generated_filepath = os.path.join(self.tmpdir.name, "generated.xlsx")
+        generator = WeeklySalesStatsGenerator(self.output_filepath, year=2023)
+        generator.rollover()
+        with open(generated_filepath, "wb") as generated_file:
+            generated_file.write(generator.writer.save_to_bytes())
+
+        roll_over_workbook(self.output_filepath, self.output_filepath, year=2023)
+
+        rolled = load_workbook(self.output_filepath)
+        generated = load_workbook(generated_filepath)
+        assert _copied_parts(rolled) == _copied_parts(generated)
+        assert _copied_parts(rolled)[1:5] == (
+            ["B2"],
+            [],
+            ["C1:C5"],
+            ["D1:D5"],
+        )
+
+    def test_existing_sheet_name(self):
+        with pytest.raises(ValueError):
+            insert_sheet(SAMPLE_FILEPATH, "Week 24", {}, self.output_filepath)
+        assert not os.listdir(self.tmpdir.name)
+
+
+def _copied_parts(workbook: Workbook) -> tuple:
+    """What the new first tab kept of the latest tab, and the tab selection"""
+    new_sheet: Worksheet = workbook.worksheets[0]
+    cells = [cell for row in new_sheet.iter_rows() for cell in row]
+    return (
+        [
+            (cell.coordinate, cell.value, cell.style_id)
+            for cell in cells
+            if cell.value is not None
+        ],
+        [cell.coordinate for cell in cells if cell.hyperlink is not None],
+        [cell.coordinate for cell in cells if cell.comment is not None],
+        [str(formatting.sqref) for formatting in new_sheet.conditional_formatting],
+        [
+            str(validation.sqref)
+            for validation in new_sheet.data_validations.dataValidation
+        ],
+        new_sheet.freeze_panes,
+        workbook.active.title,  # type: ignore
+        [
+            worksheet.title
+            for worksheet in workbook.worksheets
+            if worksheet.views.sheetView[0].tabSelected
+        ],
+    )
+
+
+def test_roll_over_workbooks():
+    with TemporaryDirectory() as tmpdir:
+        source_directory = os.path.join(tmpdir, "source")
+        output_directory = os.path.join(tmpdir, "output")
+        os.makedirs(source_directory)
+        for name in ("a.xlsx", "b.xlsx"):
+            shutil.copy(SAMPLE_FILEPATH, os.path.join(source_directory, name))
+        with open(os.path.join(source_directory, "broken.xlsx"), "w") as file:
+            file.write("not a workbook")
+
+        results = roll_over_workbooks(
+            source_directory,
+            output_directory=output_directory,
+            year=2023,
+            max_workers=2,
+        )
+
+        assert [result.succeeded for result in results] == [True, True, False]
+        assert results[2].error.startswith("BadZipFile")
+        assert read_sheet_names(results[0].output_filepath)[0] == "Week 25"
+        assert read_sheet_names(results[0].workbook_filepath)[0] == "Week 24"
+
+
+def test_roll_over_workbooks_never_replaces_workbooks():
+    with TemporaryDirectory() as tmpdir:
+        shutil.copy(SAMPLE_FILEPATH, os.path.join(tmpdir, "a.xlsx"))
+
+        with pytest.raises(ValueError):
+            roll_over_workbooks(tmpdir, output_directory=tmpdir, year=2023)
+        assert read_sheet_names(os.path.join(tmpdir, "a.xlsx"))[0] == "Week 24"
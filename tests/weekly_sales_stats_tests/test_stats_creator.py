@@ -8,7 +8,7 @@ from weekly_sales_stats.stats_creator import WeeklySalesStatsGenerator
 class TestWeeklySalesStatsGenerator:
     def setup_method(self):
         sheet_location = os.path.join("tests", "test_files", "sample_weekly_stats.xlsx")
-        self.generator = WeeklySalesStatsGenerator(sheet_location)
+        self.generator = WeeklySalesStatsGenerator(sheet_location, year=2023)
 
     def test_create_new_week_tab(self):
         self.generator.create_new_week_tab()
@@ -19,3 +19,15 @@ class TestWeeklySalesStatsGenerator:
         self.generator._set_data_summary_date()
         cell = self.generator.writer.cell(0, "D2")
         assert cell.value == "Week 25 (19~25/06/2023)"
+
+    def test_new_week_tab_cloned_from_latest_tab(self):
+        latest_sheet = self.generator.writer.get_worksheet(0)
+        self.generator.rollover()
+        new_sheet = self.generator.writer.get_worksheet(0)
+        assert new_sheet["B2"].value == latest_sheet["B2"].value
+        assert new_sheet["D2"].value == "Week 25 (19~25/06/2023)"
+        assert latest_sheet["D2"].value == "WEEK 24 (12~18/06/2023)"
+        assert new_sheet.print_area == "'Week 25'!$A$1:$G$157"
+        assert new_sheet.column_dimensions["F"].width == (
+            latest_sheet.column_dimensions["F"].width
+        )
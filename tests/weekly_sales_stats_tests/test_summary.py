@@ -0,0 +1,129 @@
+import os
+import shutil
+from tempfile import TemporaryDirectory
+from zipfile import ZipFile
+
+import numpy as np
+import pytest
+
+from weekly_sales_stats.rollover import roll_over_workbook
+from weekly_sales_stats.summary import (
+    WeekAggregateCache,
+    WeeklySalesSummary,
+    _item_rows,
+    aggregate_week_rows,
+)
+
+SAMPLE_FILEPATH = os.path.join("tests", "test_files", "sample_weekly_stats.xlsx")
+
+
+class TestWeeklySalesSummary:
+    def setup_method(self):
+        self.tmpdir = TemporaryDirectory()
+        self.workbook_filepath = os.path.join(self.tmpdir.name, "stats.xlsx")
+        shutil.copy(SAMPLE_FILEPATH, self.workbook_filepath)
+        self.cache_directory = os.path.join(self.tmpdir.name, "cache")
+        self.summary = WeeklySalesSummary(
+            self.workbook_filepath, WeekAggregateCache(self.cache_directory)
+        )
+
+    def teardown_method(self):
+        self.tmpdir.cleanup()
+
+    def test_section_totals(self):
+        totals = self.summary.section_totals(["Week 24", "Week 23"])
+        assert list(totals.index) == ["Week 24", "Week 23"]
+        assert totals.loc["Week 24", "Enquiries received thru"] == 13
+        assert totals.loc["Week 24", "Delivery Orders Issued"] == 31
+        assert "Total" not in self.summary.item_totals(["Week 24"]).columns
+
+    def test_week_titles_grouped_across_weeks(self):
+        totals = self.summary.section_totals(["Week 24", "Week 23"])
+        assert (
+            "Quotations Not prepared for Enquiries received in current week"
+            in totals.columns
+        )
+        assert not totals.columns.str.contains("Wk").any()
+
+    def test_only_new_week_aggregated(self):
+        self.summary.week_aggregates()
+        assert len(self.summary.loaded_sheet_names) == 16
+        roll_over_workbook(self.workbook_filepath, self.workbook_filepath, year=2023)
+        aggregates = self.summary.week_aggregates()
+        assert self.summary.loaded_sheet_names[16:] == ["Week 25"]
+        # the new week starts as a copy of the latest week
+        weeks = aggregates.groupby("week")["count"].sum()
+        assert weeks["Week 25"] == weeks["Week 24"]
+
+    def test_label_renamed_in_shared_strings(self):
+        self.summary.week_aggregates(["Week 24"])
+        _replace_in_part(
+            self.workbook_filepath,
+            "xl/sharedStrings.xml",
+            b" - Emails  <",
+            b" - E-mails  <",
+        )
+        aggregates = self.summary.week_aggregates(["Week 24"])
+        assert self.summary.loaded_sheet_names == ["Week 24", "Week 24"]
+        assert "E-mails" in aggregates["item"].tolist()
+
+    def test_aggregates_reused_from_disk_cache(self):
+        first_aggregates = self.summary.week_aggregates()
+        summary = WeeklySalesSummary(
+            self.workbook_filepath, WeekAggregateCache(self.cache_directory)
+        )
+        aggregates = summary.week_aggregates()
+        assert not summary.loaded_sheet_names
+        assert aggregates.equals(first_aggregates)
+
+    def test_undeletable_corrupt_cache_entry_is_a_miss(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        first_aggregates = self.summary.week_aggregates(["Week 24"])
+        [entry_name] = os.listdir(self.cache_directory)
+        with open(os.path.join(self.cache_directory, entry_name), "w") as entry:
+            entry.write("{not json")
+
+        def fail_to_remove(path: str) -> None:
+            raise PermissionError(path)
+
+        monkeypatch.setattr(os, "remove", fail_to_remove)
+        summary = WeeklySalesSummary(
+            self.workbook_filepath, WeekAggregateCache(self.cache_directory)
+        )
+        assert summary.week_aggregates(["Week 24"]).equals(first_aggregates)
+        assert summary.loaded_sheet_names == ["Week 24"]
+
+    def test_missing_week(self):
+        with pytest.raises(ValueError):
+            self.summary.week_aggregates(["Week 99"])
+
+
+def _replace_in_part(filepath: str, part_name: str, old: bytes, new: bytes) -> None:
+    with ZipFile(filepath) as archive:
+        parts = {info: archive.read(info.filename) for info in archive.infolist()}
+    with ZipFile(filepath, "w") as archive:
+        for info, data in parts.items():
+            if info.filename == part_name:
+                assert old in data
+                data = data.replace(old, new)
+            archive.writestr(info, data)
+
+
+def test_item_rows_normalized_and_summed():
+    values = np.array(
+        [
+            ["Invoices Issued ", None, None],
+            [None, " - Services ", 7],
+            [None, " - Project ( New Build) ", 5],
+            [None, "- Project ( New  Build )", 1],
+            [None, "Total", "=SUM(D2:D4)"],
+            ["Remarks", None, "-"],
+        ],
+        dtype=object,
+    )
+    aggregate = aggregate_week_rows(_item_rows(values))
+    assert aggregate.to_numpy().tolist() == [
+        ["Invoices Issued", "Services", 7.0],
+        ["Invoices Issued", "Project (New Build)", 6.0],
+    ]
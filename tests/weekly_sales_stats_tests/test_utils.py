@@ -2,7 +2,13 @@ from datetime import datetime
 
 import pytest
 
-from weekly_sales_stats.utils import DateRange, calculate_week_dates
+from weekly_sales_stats.utils import (
+    DateRange,
+    calculate_week_dates,
+    current_year,
+    format_summary_date,
+    increment_tab_week,
+)
 
 
 @pytest.mark.parametrize(
@@ -15,3 +21,20 @@ from weekly_sales_stats.utils import DateRange, calculate_week_dates
 def test_calculate_week_dates(year: int, week: int, expected_range: DateRange):
     daterange = calculate_week_dates(week, year)
     assert daterange == expected_range
+
+
+def test_calculate_week_dates_in_53_week_year():
+    daterange = calculate_week_dates(53, 2020)
+    assert daterange == DateRange(datetime(2020, 12, 28), datetime(2021, 1, 3))
+
+
+def test_year_end_rollover():
+    new_tab_name = increment_tab_week("Week 52")
+    assert new_tab_name == "Week 53"
+    assert format_summary_date(new_tab_name, 2023) == "Week 53 (1~07/01/2024)"
+
+
+def test_year_defaults_to_current_year():
+    assert format_summary_date("Week 25") == format_summary_date(
+        "Week 25", current_year()
+    )
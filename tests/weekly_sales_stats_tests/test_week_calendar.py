@@ -0,0 +1,55 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+from weekly_sales_stats.week_calendar import week_dates, weeks_between, weeks_in_year
+
+
+def test_week_dates_across_years():
+    start_dates, end_dates = week_dates([2020, 2020, 2021, 2023], [1, 53, 1, 25])
+    np.testing.assert_array_equal(
+        start_dates,
+        np.array(
+            ["2019-12-30", "2020-12-28", "2021-01-04", "2023-06-19"],
+            dtype="datetime64[D]",
+        ),
+    )
+    np.testing.assert_array_equal(end_dates - start_dates, np.timedelta64(6, "D"))
+
+
+def test_week_dates_broadcasts_year():
+    start_dates, _ = week_dates(2023, np.arange(1, 53))
+    assert start_dates.shape == (52,)
+    assert start_dates[0] == np.datetime64("2023-01-02")
+
+
+@pytest.mark.parametrize(
+    "years, weeks", [(2021, 53), (2023, 0), ([2020, 2021], [53, 53])]
+)
+def test_week_dates_rejects_missing_weeks(years, weeks):
+    with pytest.raises(ValueError):
+        week_dates(years, weeks)
+
+
+def test_week_dates_rejects_non_integers():
+    with pytest.raises(ValueError):
+        week_dates(2023.0, 1)
+
+
+@pytest.mark.parametrize(
+    "year, expected_week_count",
+    [(2015, 53), (2019, 52), (2020, 53), (2023, 52), (2026, 53)],
+)
+def test_weeks_in_year(year: int, expected_week_count: int):
+    assert weeks_in_year(year) == expected_week_count
+
+
+def test_weeks_between_matches_isocalendar():
+    table = weeks_between(2014, 2027)
+    for year, week, start_date in zip(table.years, table.weeks, table.start_dates):
+        iso_year, iso_week, iso_weekday = date.fromisoformat(
+            str(start_date)
+        ).isocalendar()
+        assert (iso_year, iso_week, iso_weekday) == (year, week, 1)
+    assert len(table.years) == weeks_in_year(np.arange(2014, 2028)).sum()
@@ -0,0 +1,145 @@
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import List, NamedTuple, Optional
+
+from loguru import logger
+
+from excel_writer.package import insert_sheet, read_sheet_names
+from weekly_sales_stats.utils import (
+    SUMMARY_DATE_CELL,
+    current_year,
+    format_summary_date,
+    increment_tab_week,
+)
+
+
+class RolloverResult(NamedTuple):
+    workbook_filepath: str
+    output_filepath: str
+    new_tab_name: str
+    seconds: float
+    error: str = ""
+
+    @property
+    def succeeded(self) -> bool:
+        return not self.error
+
+
+def find_workbooks(source: str) -> List[str]:
+    """Returns the workbooks in a directory, or the files matching a glob pattern"""
+    if os.path.isdir(source):
+        source = os.path.join(source, "*.xlsx")
+    return sorted(glob.glob(source))
+
+
+def roll_over_workbooks(
+    source: str,
+    output_directory: str,
+    year: Optional[int] = None,
+    max_workers: Optional[int] = None,
+) -> List[RolloverResult]:
+    """Adds the next week tab to every workbook across a process pool, writing
+    the rolled over workbooks to output_directory, year defaults to the current
+    year
+
+    The workbooks themselves are never replaced, an output_directory holding
+    any of them, or workbooks sharing a file name, raise ValueError before
+    anything is written.
+    """
+    workbook_filepaths = find_workbooks(source)
+    if year is None:
+        year = current_year()
+    output_directory = os.path.realpath(output_directory)
+    if any(
+        os.path.dirname(os.path.realpath(workbook_filepath)) == output_directory
+        for workbook_filepath in workbook_filepaths
+    ):
+        raise ValueError(f"{output_directory} holds the workbooks to roll over")
+    file_names = [os.path.basename(filepath) for filepath in workbook_filepaths]
+    if len(set(file_names)) != len(file_names):
+        raise ValueError("workbooks sharing a file name would overwrite each other")
+    os.makedirs(output_directory, exist_ok=True)
+
+    worker_count = max_workers or os.cpu_count() or 1
+    start_time = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=worker_count) as executor:
+        results = list(
+            executor.map(
+                partial(
+                    _roll_over_workbook_with_timing,
+                    output_directory=output_directory,
+                    year=year,
+                ),
+                workbook_filepaths,
+                # workbooks take milliseconds each, batch them per worker
+                chunksize=max(1, len(workbook_filepaths) // (4 * worker_count)),
+            )
+        )
+    total_seconds = time.perf_counter() - start_time
+
+    for result in results:
+        if result.succeeded:
+            logger.info(
+                f"added {result.new_tab_name} to {result.output_filepath} in"
+                f" {result.seconds:.3f}s"
+            )
+        else:
+            logger.error(
+                f"failed to roll over {result.workbook_filepath}: {result.error}"
+            )
+    logger.info(
+        f"rolled over {sum(result.succeeded for result in results)} of"
+        f" {len(results)} workbooks in {total_seconds:.2f}s"
+    )
+    return results
+
+
+def roll_over_workbook(
+    workbook_filepath: str, output_filepath: str, year: Optional[int] = None
+) -> str:
+    """Adds the week after the first tab as the new first tab, with its summary
+    date, without loading the workbook, returns the new tab name, output_filepath
+    may be workbook_filepath to replace the workbook
+
+    The new tab is the same copy of the latest tab WeeklySalesStatsGenerator
+    makes, see ExcelWriter.clone_sheet for what it keeps. The other sheets are
+    copied over unparsed, only their tab selection is cleared.
+    """
+    latest_tab_name = read_sheet_names(workbook_filepath)[0]
+    new_tab_name = increment_tab_week(latest_tab_name)
+    insert_sheet(
+        workbook_filepath,
+        new_tab_name,
+        {SUMMARY_DATE_CELL: format_summary_date(new_tab_name, year)},
+        output_filepath,
+        template_sheet=latest_tab_name,
+    )
+    return new_tab_name
+
+
+def _roll_over_workbook_with_timing(
+    workbook_filepath: str, output_directory: str, year: int
+) -> RolloverResult:
+    start_time = time.perf_counter()
+    output_filepath = os.path.join(
+        output_directory, os.path.basename(workbook_filepath)
+    )
+    try:
+        new_tab_name = roll_over_workbook(workbook_filepath, output_filepath, year)
+    except Exception as exc:
+        return RolloverResult(
+            workbook_filepath,
+            output_filepath="",
+            new_tab_name="",
+            seconds=time.perf_counter() - start_time,
+            error=f"{type(exc).__name__}: {exc}",
+        )
+    return RolloverResult(
+        workbook_filepath,
+        output_filepath,
+        new_tab_name,
+        time.perf_counter() - start_time,
+    )
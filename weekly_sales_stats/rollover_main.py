@@ -0,0 +1,38 @@
+import argparse
+import sys
+
+from weekly_sales_stats.rollover import roll_over_workbooks
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Adds the next week tab to weekly sales stats workbooks"
+    )
+    parser.add_argument("source", help="directory or glob pattern of workbooks")
+    parser.add_argument(
+        "output_directory",
+        help="directory to write the workbooks to, the source ones are kept",
+    )
+    parser.add_argument(
+        "--year",
+        type=int,
+        default=None,
+        help="year of the week tabs, defaults to the current year",
+    )
+    parser.add_argument("--workers", type=int, default=None, help="process count")
+    args = parser.parse_args()
+    results = roll_over_workbooks(
+        args.source,
+        output_directory=args.output_directory,
+        year=args.year,
+        max_workers=args.workers,
+    )
+    for result in results:
+        outcome = result.new_tab_name if result.succeeded else result.error
+        print(f"{result.seconds:8.3f}s  {result.workbook_filepath}  {outcome}")
+    if not all(result.succeeded for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
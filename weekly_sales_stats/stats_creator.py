@@ -1,45 +1,50 @@
 from typing import Optional, Union
 
 from excel_writer.writer import ExcelWriter
-from weekly_sales_stats.utils import DateRange, calculate_week_dates
+from weekly_sales_stats.utils import (
+    SUMMARY_DATE_CELL,
+    current_year,
+    format_summary_date,
+    increment_tab_week,
+)
 
 
 class WeeklySalesStatsGenerator:
     def __init__(
-        self, previous_sheet_location: str, writer: Optional[ExcelWriter] = None
+        self,
+        previous_sheet_location: str,
+        writer: Optional[ExcelWriter] = None,
+        year: Optional[int] = None,
     ):
+        """year defaults to the current year"""
         self.writer = writer or ExcelWriter(existing_workbook=previous_sheet_location)
+        self.year = current_year() if year is None else year
+
+    def rollover(self) -> None:
+        """Adds the next week tab with its summary date, see
+        weekly_sales_stats.rollover to roll over many workbooks at once"""
+        self.create_new_week_tab()
+        self._set_data_summary_date()
 
     def create_new_week_tab(self) -> None:
         latest_tab_name = self.writer.worksheets[0]
         new_tab_name = self._increment_tab_week(latest_tab_name)
-        self.writer.create_sheet(new_tab_name, 0)
+        # labels and formulas of the latest week are kept, staff overwrite its
+        # figures
+        self.writer.clone_sheet(latest_tab_name, new_tab_name, 0, values=True)
 
     def _increment_tab_week(self, tab_name: str, increment: int = 1) -> str:
-        previous_week = tab_name[-2:]
-        incremented_week = int(previous_week) + increment
-        return tab_name[:-2] + str(incremented_week)
+        return increment_tab_week(tab_name, increment)
 
     def _set_data_summary_date(self, sheet: Union[str, int] = 0) -> None:
         week_str = self._get_sheet_name(sheet)
-        week_num = self._get_week_num_from_week_str(week_str)
-        week_dates = calculate_week_dates(week_num)
-
-        formatted_date_range = self._format_date_range(week_dates)
-        final_date_str = f"{week_str} {formatted_date_range}"
-
-        self.writer.cell(sheet=sheet, cell_id="D2", set_value=final_date_str)
+        final_date_str = format_summary_date(week_str, self.year)
+        self.writer.cell(
+            sheet=sheet, cell_id=SUMMARY_DATE_CELL, set_value=final_date_str
+        )
 
     def _get_sheet_name(self, sheet: Union[str, int]) -> str:
         return self.writer.get_worksheet(sheet).title
 
-    def _get_week_num_from_week_str(self, week_str: str) -> int:
-        return int(week_str[-2:])
-
-    def _format_date_range(self, date_range: DateRange) -> str:
-        start_day = date_range.start_date.day
-        end_date = date_range.end_date.strftime("%d/%m/%Y")
-        return f"({start_day}~{end_date})"
-
     def save_file(self, filepath: str, filename: str) -> None:
         self.writer.save_workbook(filepath, filename)
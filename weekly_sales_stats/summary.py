@@ -0,0 +1,186 @@
+import hashlib
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from excel_writer.json_cache import JsonFileCache
+from excel_writer.package import read_sheet_fingerprints
+from excel_writer.writer import ExcelWriter
+
+SUMMARY_CACHE_DIRECTORY = os.path.join(
+    os.path.expanduser("~"), ".weekly_sales_stats", "summary_cache"
+)
+
+# sections are titled in column B, their items are in column C with the count
+# in column D
+SECTION_COLUMN = 2
+COUNT_COLUMN = 4
+FIRST_DATA_ROW = 4
+TOTAL_ITEM = "Total"
+CURRENT_WEEK_LABEL = "current week"
+
+_WEEK_REFERENCE_PATTERN = r"\bWk\s*\d+\s*\(Y?\d{4}\)"
+
+AGGREGATE_COLUMNS = ["section", "item", "count"]
+# bumped whenever the rows are read or aggregated differently
+AGGREGATE_VERSION = 1
+
+
+class WeekAggregateCache(JsonFileCache[pd.DataFrame]):
+    """On-disk cache of the per-item counts of a week tab, keyed by the
+    fingerprint of the tab"""
+
+    def __init__(self, cache_directory: str = SUMMARY_CACHE_DIRECTORY):
+        super().__init__(cache_directory, description="summary cache")
+
+    def get_key(self, sheet_name: str, fingerprint: str) -> str:
+        key_text = f"summary-v{AGGREGATE_VERSION}:{sheet_name}:{fingerprint}"
+        return hashlib.sha256(key_text.encode()).hexdigest()
+
+    def _serialize(self, value: pd.DataFrame) -> List[List[Any]]:
+        return value[AGGREGATE_COLUMNS].to_numpy().tolist()
+
+    def _deserialize(self, entry: Any) -> pd.DataFrame:
+        return _aggregate_frame(entry)
+
+
+class WeeklySalesSummary:
+    """Per-week totals of a weekly sales stats workbook, the counts of each tab
+    are aggregated once and reused until the tab changes"""
+
+    def __init__(
+        self, workbook_filepath: str, cache: Optional[WeekAggregateCache] = None
+    ):
+        self._workbook_filepath = workbook_filepath
+        self._cache = cache
+        # by week and fingerprint of its tab
+        self._aggregates: Dict[Tuple[str, str], pd.DataFrame] = {}
+        self.loaded_sheet_names: List[str] = []
+
+    def week_aggregates(self, weeks: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """Counts by week, section and item, only tabs that changed since they
+        were last aggregated are read from the workbook"""
+        fingerprints = read_sheet_fingerprints(self._workbook_filepath)
+        weeks = list(fingerprints) if weeks is None else list(weeks)
+        if missing_weeks := set(weeks) - set(fingerprints):
+            raise ValueError(f"weeks not found in workbook: {missing_weeks}")
+
+        uncached_weeks = [
+            week for week in weeks if not self._load_cached(week, fingerprints[week])
+        ]
+        if uncached_weeks:
+            for week, aggregate in self._aggregate_weeks(uncached_weeks).items():
+                self._aggregates[week, fingerprints[week]] = aggregate
+                if self._cache is not None:
+                    cache_key = self._cache.get_key(week, fingerprints[week])
+                    self._cache.store(cache_key, aggregate)
+
+        frames = [
+            self._aggregates[week, fingerprints[week]].assign(week=week)
+            for week in weeks
+        ]
+        if not frames:
+            return _aggregate_frame([]).assign(week=pd.Series(dtype=object))
+        return pd.concat(frames, ignore_index=True)[["week", *AGGREGATE_COLUMNS]]
+
+    def section_totals(self, weeks: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """Weeks by sections, in tab and row order"""
+        aggregates = self.week_aggregates(weeks)
+        return aggregates.pivot_table(
+            index="week", columns="section", values="count", aggfunc="sum", sort=False
+        )
+
+    def item_totals(self, weeks: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """Weeks by items, summed across sections, e.g. all Services counts"""
+        aggregates = self.week_aggregates(weeks)
+        return aggregates.pivot_table(
+            index="week", columns="item", values="count", aggfunc="sum", sort=False
+        )
+
+    def _load_cached(self, week: str, fingerprint: str) -> bool:
+        if (week, fingerprint) in self._aggregates:
+            return True
+        if self._cache is None:
+            return False
+        aggregate = self._cache.load(self._cache.get_key(week, fingerprint))
+        if aggregate is None:
+            return False
+        self._aggregates[week, fingerprint] = aggregate
+        return True
+
+    def _aggregate_weeks(self, weeks: List[str]) -> Dict[str, pd.DataFrame]:
+        # only the changed tabs are parsed, in a single pass over the workbook
+        writer = ExcelWriter(
+            existing_workbook=self._workbook_filepath, read_only=True, sheets=weeks
+        )
+        try:
+            aggregates = {
+                week: aggregate_week_rows(load_week_rows(writer, week))
+                for week in weeks
+            }
+        finally:
+            writer.close()
+        self.loaded_sheet_names.extend(weeks)
+        logger.debug(f"aggregated {len(weeks)} week tabs")
+        return aggregates
+
+
+def load_week_rows(writer: ExcelWriter, sheet: str) -> pd.DataFrame:
+    """Section, item and count of every item row of a week tab"""
+    rows = writer.get_worksheet(sheet).iter_rows(
+        min_row=FIRST_DATA_ROW,
+        min_col=SECTION_COLUMN,
+        max_col=COUNT_COLUMN,
+        values_only=True,
+    )
+    values = np.array(list(rows), dtype=object).reshape(-1, 3)
+    return _item_rows(values)
+
+
+def aggregate_week_rows(rows: pd.DataFrame) -> pd.DataFrame:
+    """Sums the counts of repeated section and item rows"""
+    counts = rows.groupby(["section", "item"], sort=False)["count"].sum()
+    return counts.reset_index()
+
+
+def _item_rows(values: np.ndarray) -> pd.DataFrame:
+    frame = pd.DataFrame(values, columns=AGGREGATE_COLUMNS)
+    # item rows leave the section column empty, they belong to the section
+    # titled above them
+    sections = _normalize_labels(frame["section"]).ffill()
+    items = _normalize_labels(frame["item"]).str.lstrip("- ")
+    counts = pd.to_numeric(frame["count"], errors="coerce")
+    # total rows hold formulas, which are summed again here instead
+    is_item_row = (
+        sections.notna() & items.notna() & (items != TOTAL_ITEM) & counts.notna()
+    )
+    return _aggregate_frame(
+        {
+            "section": sections[is_item_row].to_numpy(),
+            "item": items[is_item_row].to_numpy(),
+            "count": counts[is_item_row].to_numpy(),
+        }
+    )
+
+
+def _normalize_labels(labels: pd.Series) -> pd.Series:
+    """Strips the spacing that varies between tabs, so Project ( New Build )
+    and Project ( New Build) group together, and replaces the week a title
+    refers to, e.g. Wk 24 (2023)"""
+    labels = labels.where(labels.map(lambda label: isinstance(label, str)))
+    normalized_labels = (
+        labels.str.replace(_WEEK_REFERENCE_PATTERN, CURRENT_WEEK_LABEL, regex=True)
+        .str.replace(r"\s+", " ", regex=True)
+        .str.replace(r"\(\s*", "(", regex=True)
+        .str.replace(r"\s*\)", ")", regex=True)
+        .str.strip()
+    )
+    return normalized_labels.mask(normalized_labels == "")
+
+
+def _aggregate_frame(data: Any) -> pd.DataFrame:
+    frame = pd.DataFrame(data, columns=AGGREGATE_COLUMNS)
+    return frame.astype({"section": str, "item": str, "count": float})
@@ -1,5 +1,9 @@
-from datetime import datetime, timedelta
-from typing import NamedTuple
+from datetime import date, datetime
+from typing import NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from weekly_sales_stats.week_calendar import week_dates, weeks_in_year
 
 
 class DateRange(NamedTuple):
@@ -7,28 +11,54 @@ class DateRange(NamedTuple):
     end_date: datetime
 
 
-CURRENT_YEAR = 2023
+SUMMARY_DATE_CELL = "D2"
+
+
+def current_year() -> int:
+    """ISO year of today, the year of the week tabs unless one is given"""
+    return date.today().isocalendar()[0]
+
+
+def calculate_week_dates(week: int, year: Optional[int] = None) -> DateRange:
+    """Weeks past the last ISO week of the year carry on into the next year, so
+    week 53 of a 52 week year is week 1 of the following year"""
+    if year is None:
+        year = current_year()
+    year, week = _normalize_week(year, week)
+    start_dates, end_dates = week_dates(year, week)
+    return DateRange(_to_datetime(start_dates), _to_datetime(end_dates))
+
+
+def _normalize_week(year: int, week: int) -> Tuple[int, int]:
+    while week > (week_count := int(weeks_in_year(year))):
+        year, week = year + 1, week - week_count
+    while week < 1:
+        year -= 1
+        week += int(weeks_in_year(year))
+    return year, week
+
+
+def _to_datetime(date: np.ndarray) -> datetime:
+    return date.astype("datetime64[us]").item()
 
 
-def calculate_week_dates(week: int, year: int = CURRENT_YEAR) -> DateRange:
-    first_monday_of_year = _calculate_first_monday_of_year(year)
-    start_date_of_week = _calculate_start_date_of_week(first_monday_of_year, week)
-    end_date_of_week = _calculate_end_date_of_week(start_date_of_week)
-    return DateRange(start_date_of_week, end_date_of_week)
+def increment_tab_week(tab_name: str, increment: int = 1) -> str:
+    previous_week = tab_name[-2:]
+    incremented_week = int(previous_week) + increment
+    return tab_name[:-2] + str(incremented_week)
 
 
-def _calculate_first_monday_of_year(year: int) -> datetime:
-    reference_point = datetime(year, 1, 4)
-    reference_point_weekday = reference_point.isocalendar().weekday
-    days_to_first_monday = 1 - reference_point_weekday
-    return reference_point + timedelta(days=days_to_first_monday)
+def get_week_num_from_week_str(week_str: str) -> int:
+    return int(week_str[-2:])
 
 
-def _calculate_start_date_of_week(
-    first_monday_of_year: datetime, week: int
-) -> datetime:
-    return first_monday_of_year + timedelta(weeks=week - 1)
+def format_date_range(date_range: DateRange) -> str:
+    start_day = date_range.start_date.day
+    end_date = date_range.end_date.strftime("%d/%m/%Y")
+    return f"({start_day}~{end_date})"
 
 
-def _calculate_end_date_of_week(start_date_of_week: datetime) -> datetime:
-    return start_date_of_week + timedelta(days=6)
+def format_summary_date(week_str: str, year: Optional[int] = None) -> str:
+    """e.g. Week 25 (19~25/06/2023)"""
+    date_range = calculate_week_dates(get_week_num_from_week_str(week_str), year)
+    return f"{week_str} {format_date_range(date_range)}"
@@ -0,0 +1,106 @@
+from functools import lru_cache
+from typing import NamedTuple, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+MIN_YEAR = 1
+MAX_YEAR = 9998
+
+_DAY = np.timedelta64(1, "D")
+_WEEK = np.timedelta64(7, "D")
+# 1970-01-01, day 0 of datetime64[D], was a Thursday
+_EPOCH_WEEKDAY = 3
+
+
+class WeekDates(NamedTuple):
+    """datetime64[D] arrays of the Monday and Sunday of each week"""
+
+    start_dates: np.ndarray
+    end_dates: np.ndarray
+
+
+class WeekTable(NamedTuple):
+    """Every ISO week of a range of years, in order"""
+
+    years: np.ndarray
+    weeks: np.ndarray
+    start_dates: np.ndarray
+    end_dates: np.ndarray
+
+
+def week_dates(years: npt.ArrayLike, weeks: npt.ArrayLike) -> WeekDates:
+    """Start and end dates of ISO weeks, years and weeks are broadcast against
+    each other"""
+    years_array, weeks_array = np.broadcast_arrays(
+        _as_int_array(years, "years"), _as_int_array(weeks, "weeks")
+    )
+    if years_array.size == 0:
+        empty = np.empty(years_array.shape, dtype="datetime64[D]")
+        return WeekDates(empty, empty.copy())
+
+    first_year, last_year = int(years_array.min()), int(years_array.max())
+    first_mondays, week_counts = _year_table(first_year, last_year)
+    year_indices = years_array - first_year
+    invalid_weeks = (weeks_array < 1) | (weeks_array > week_counts[year_indices])
+    if invalid_weeks.any():
+        year, week = years_array[invalid_weeks][0], weeks_array[invalid_weeks][0]
+        raise ValueError(f"year {year} has no ISO week {week}")
+
+    start_dates = first_mondays[year_indices] + (weeks_array - 1) * _WEEK
+    return WeekDates(start_dates, start_dates + 6 * _DAY)
+
+
+def weeks_in_year(years: npt.ArrayLike) -> np.ndarray:
+    """52 or 53 for each year"""
+    years_array = _as_int_array(years, "years")
+    if years_array.size == 0:
+        return np.empty(years_array.shape, dtype=np.int64)
+    first_year = int(years_array.min())
+    _, week_counts = _year_table(first_year, int(years_array.max()))
+    return week_counts[years_array - first_year]
+
+
+def weeks_between(first_year: int, last_year: int) -> WeekTable:
+    """All ISO weeks from the first week of first_year to the last week of
+    last_year"""
+    if first_year > last_year:
+        raise ValueError(f"first year {first_year} is after last year {last_year}")
+    first_mondays, week_counts = _year_table(first_year, last_year)
+    years = np.repeat(np.arange(first_year, last_year + 1), week_counts)
+    # week numbers restart at 1 on the first row of every year
+    year_start_rows = np.repeat(np.cumsum(week_counts) - week_counts, week_counts)
+    weeks = np.arange(len(years)) - year_start_rows + 1
+    start_dates = first_mondays[0] + np.arange(len(years)) * _WEEK
+    return WeekTable(years, weeks, start_dates, start_dates + 6 * _DAY)
+
+
+@lru_cache(maxsize=32)
+def _year_table(first_year: int, last_year: int) -> Tuple[np.ndarray, np.ndarray]:
+    """First ISO Monday and week count of each year, the arrays are read only as
+    they are shared between calls"""
+    if first_year < MIN_YEAR or last_year > MAX_YEAR:
+        raise ValueError(f"years must be between {MIN_YEAR} and {MAX_YEAR}")
+    years = np.arange(first_year, last_year + 2)
+    first_mondays = _first_mondays(years)
+    week_counts = np.diff(first_mondays) // _WEEK
+    first_mondays = first_mondays[:-1]
+    first_mondays.flags.writeable = False
+    week_counts.flags.writeable = False
+    return first_mondays, week_counts
+
+
+def _first_mondays(years: np.ndarray) -> np.ndarray:
+    # the first ISO week is the one holding January 4th
+    january_fourths = (years - 1970).astype("datetime64[Y]").astype(
+        "datetime64[D]"
+    ) + 3 * _DAY
+    weekdays = (january_fourths.astype(np.int64) + _EPOCH_WEEKDAY) % 7
+    return january_fourths - weekdays * _DAY
+
+
+def _as_int_array(values: npt.ArrayLike, name: str) -> np.ndarray:
+    array = np.asarray(values)
+    if array.dtype.kind not in "iu":
+        raise ValueError(f"{name} must be integers, got {array.dtype}")
+    return array.astype(np.int64)